@@ -0,0 +1,63 @@
+"""Runs the tklife benchmark suite.
+
+Requires a display, run under Xvfb on headless machines::
+
+    xvfb-run -a python -m benchmarks --output current.json
+    xvfb-run -a python -m benchmarks --compare baseline.json
+
+Exits with status 1 when ``--compare`` finds a regression.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from benchmarks import cases  # noqa: F401  # pylint: disable=unused-import
+from benchmarks.harness import CASES, compare, run
+
+
+def main(argv=None) -> int:
+    """Runs the suite from the command line and returns the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Runs the tklife benchmark suite."
+    )
+    parser.add_argument("cases", nargs="*", help=f"cases to run: {', '.join(CASES)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-size", type=int, default=None)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="fraction a result may be slower than the baseline (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, repeat=args.repeat, max_size=args.max_size)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if not args.compare:
+        return 0
+    with open(args.compare, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: {regression.baseline * 1000:.3f} ms -> "
+            f"{regression.current * 1000:.3f} ms ({regression.ratio:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+"""Benchmark cases covering the hot paths of tklife."""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from benchmarks.harness import case
+from tklife.behaviors.commands import Command, CommandHistory
+from tklife.core import SkeletonMixin, SkelWidget
+from tklife.dynamic import AppendableMixin
+from tklife.event import TkEvent
+from tklife.mailbox import UIMailbox
+from tklife.proxy import CallProxyFactory
+from tklife.replay import EventReplayer, RecordedEvent
+from tklife.widgets import AutoSearchCombobox
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from benchmarks.harness import Timer
+
+COLUMNS = 10
+SKELETON_SIZES = (10, 100, 1000, 10000)
+ROW_SIZES = (100, 500, 2000)
+ROW_OPERATIONS = 20
+
+
+def _template(cells: int):
+    return tuple(
+        [
+            SkelWidget(ttk.Label, {"text": f"{row}:{col}"})
+            for col in range(min(COLUMNS, cells - row * COLUMNS))
+        ]
+        for row in range(-(-cells // COLUMNS))
+    )
+
+
+def _row(index: int):
+    return [
+        SkelWidget(ttk.Label, {"text": f"Row {index}"}),
+        SkelWidget(ttk.Entry, {"textvariable": tk.StringVar}),
+        SkelWidget(ttk.Button, {"text": "x"}, label=f"row_{index}"),
+    ]
+
+
+class _Appendable(SkeletonMixin, AppendableMixin, ttk.Frame):
+    pass
+
+
+def _appendable(root: tk.Tk, rows: int) -> _Appendable:
+    frame = _Appendable(root)
+    for index in range(rows):
+        frame.append_row(_row(index))
+    return frame
+
+
+@case("skeleton.construct", SKELETON_SIZES)
+def skeleton_construct(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Constructs a view with ``size`` cells."""
+    template = _template(size)
+
+    class View(SkeletonMixin, ttk.Frame):
+        @property
+        def template(self):
+            return template
+
+    with timer:
+        view = View(root)
+    view.destroy()
+
+
+@case("skeleton.construct_cached", SKELETON_SIZES)
+def skeleton_construct_cached(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Constructs a view with ``size`` cells and a cached template plan."""
+    template = _template(size)
+
+    class View(SkeletonMixin, ttk.Frame):
+        cache_template = True
+
+        @property
+        def template(self):
+            return template
+
+    View(root).destroy()
+    with timer:
+        view = View(root)
+    view.destroy()
+
+
+@case("skeleton.construct_bulk", SKELETON_SIZES)
+def skeleton_construct_bulk(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Constructs a view with ``size`` cells created by a single Tcl script."""
+    template = _template(size)
+
+    class View(SkeletonMixin, ttk.Frame):
+        bulk_create = "template"
+
+        @property
+        def template(self):
+            return template
+
+    with timer:
+        view = View(root)
+    view.destroy()
+
+
+@case("appendable.append_row", ROW_SIZES)
+def appendable_append_row(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Appends rows to a frame having ``size`` rows."""
+    frame = _appendable(root, size)
+    with timer:
+        for index in range(ROW_OPERATIONS):
+            frame.append_row(_row(size + index))
+    frame.destroy()
+
+
+@case("appendable.insert_row_at", ROW_SIZES)
+def appendable_insert_row_at(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Inserts rows in the middle of a frame having ``size`` rows."""
+    frame = _appendable(root, size)
+    with timer:
+        for index in range(ROW_OPERATIONS):
+            frame.insert_row_at(size // 2, _row(size + index))
+    frame.destroy()
+
+
+@case("appendable.destroy_row", ROW_SIZES)
+def appendable_destroy_row(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Destroys rows in the middle of a frame having ``size`` rows."""
+    frame = _appendable(root, size)
+    with timer:
+        for __ in range(ROW_OPERATIONS):
+            frame.destroy_row(size // 4)
+    frame.destroy()
+
+
+@case("appendable.find_row_of", ROW_SIZES)
+def appendable_find_row_of(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Finds the last rows of a frame having ``size`` rows."""
+    frame = _appendable(root, size)
+    with timer:
+        for index in range(ROW_OPERATIONS):
+            frame.find_row_of(f"row_{size - index - 1}")
+    frame.destroy()
+
+
+@case("appendable.sort_rows", ROW_SIZES)
+def appendable_sort_rows(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Sorts the rows of a frame having ``size`` rows by label, descending."""
+    frame = _appendable(root, size)
+    with timer:
+        frame.sort_rows(lambda row: str(row[0].widget.cget("text")), reverse=True)
+    frame.destroy()
+
+
+@case("appendable.bind_group", ROW_SIZES)
+def appendable_bind_group(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Binds a handler for every widget of a frame having ``size`` rows through a
+    bindtag group."""
+    frame = _appendable(root, size)
+    with timer:
+        frame.add_to_group("rows")
+        frame.bind_group("rows", TkEvent.BUTTON, lambda event, position: None)
+    frame.destroy()
+
+
+@case("event.bind", (10, 100, 1000))
+def event_bind(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Binds ``size`` handlers with add="+"."""
+    widget = ttk.Frame(root)
+    with timer:
+        for __ in range(size):
+            TkEvent.CONFIGURE.bind(widget, lambda __: None, add="+")
+    widget.destroy()
+
+
+@case("event.get_bindings", (10, 100, 1000))
+def event_get_bindings(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Gets the bindings of an event having ``size`` handlers."""
+    widget = ttk.Frame(root)
+    for __ in range(size):
+        TkEvent.CONFIGURE.bind(widget, lambda __: None, add="+")
+    with timer:
+        for __ in range(ROW_OPERATIONS):
+            TkEvent.CONFIGURE.get_bindings(widget)
+    widget.destroy()
+
+
+@case("event.unbind", (10, 100, 1000))
+def event_unbind(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Unbinds every one of ``size`` handlers bound with add="+"."""
+    widget = ttk.Frame(root)
+    funcids = [
+        TkEvent.CONFIGURE.bind(widget, lambda __: None, add="+") for __ in range(size)
+    ]
+    with timer:
+        for funcid in funcids:
+            TkEvent.CONFIGURE.unbind(widget, funcid)
+    widget.destroy()
+
+
+def _generate_motion(root: tk.Tk, size: int, timer: Timer, **kwargs: Any) -> None:
+    widget = ttk.Frame(root)
+    TkEvent.MOTION.bind(widget, lambda event: event.x, **kwargs)
+    with timer:
+        for x in range(size):
+            widget.event_generate("<Motion>", x=x, y=0)
+    widget.destroy()
+
+
+@case("event.generate_motion", (100, 1000, 10000))
+def event_generate_motion(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Generates ``size`` <Motion> events handled with a full tkinter.Event."""
+    _generate_motion(root, size, timer)
+
+
+@case("event.generate_motion_lean", (100, 1000, 10000))
+def event_generate_motion_lean(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Generates ``size`` <Motion> events handled with a LeanEvent."""
+    _generate_motion(root, size, timer, fields=("x",))
+
+
+@case("widgets.autosearch_filter", (100, 1000, 10000))
+def autosearch_filter(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Filters an AutoSearchCombobox having ``size`` values while typing."""
+    combobox = AutoSearchCombobox(root, values=[f"value {i:06}" for i in range(size)])
+    with timer:
+        for char in "value 0001":
+            combobox.insert(tk.END, char)
+            combobox._handle_keyrelease(  # pylint: disable=protected-access
+                SimpleNamespace(keysym=char if char != " " else "space")
+            )
+    combobox.destroy()
+
+
+@case("replay.autosearch_typing", (100, 1000))
+def replay_autosearch_typing(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Replays a recorded session typing ``size`` keys into an AutoSearchCombobox."""
+    combobox = AutoSearchCombobox(root, values=[f"value {i:06}" for i in range(1000)])
+    keys = ("v", "a", "l", "BackSpace", "BackSpace", "BackSpace")
+    events = [
+        RecordedEvent(index, sequence, str(combobox), {"keysym": keys[index % 6]})
+        for index in range(size)
+        for sequence in ("<KeyPress>", "<KeyRelease>")
+    ]
+    replayer = EventReplayer(root, events)
+    with timer:
+        replayer.replay()
+    combobox.destroy()
+
+
+@case("mailbox.burst", (1000, 10000, 100000))
+def mailbox_burst(root: tk.Tk, size: int, timer: Timer) -> None:
+    """Posts ``size`` updates of 10 variables to a mailbox and drains it."""
+    variables = [tk.StringVar(root) for __ in range(10)]
+    mailbox = UIMailbox(root)
+    with timer:
+        for index in range(size):
+            mailbox.set(variables[index % 10], str(index))
+        mailbox.drain()
+    mailbox.close()
+
+
+@case("proxy.call", (1000, 10000, 100000), needs_tk=False)
+def proxy_call(__, size: int, timer: Timer) -> None:
+    """Calls a controller method ``size`` times through a call proxy."""
+    controller = SimpleNamespace(save=lambda: None)
+    factory = CallProxyFactory(SimpleNamespace(controller=controller))
+    proxy = factory.save
+    factory.set_controller(controller)  # type: ignore[arg-type]
+    with timer:
+        for __ in range(size):
+            proxy()
+
+
+class _NoopCommand(Command):
+    def execute(self) -> None:
+        pass
+
+    def reverse(self) -> None:
+        pass
+
+
+@case("commands.history", (100, 1000, 10000), needs_tk=False)
+def command_history(__, size: int, timer: Timer) -> None:
+    """Adds ``size`` commands, then undoes and redoes all of them."""
+    history = CommandHistory()
+    commands = [_NoopCommand() for __ in range(size)]
+    with timer:
+        for command in commands:
+            history.add_history(command)
+        len(history)
+        history.undo_all()
+        while history.redo() is not None:
+            pass
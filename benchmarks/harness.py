@@ -0,0 +1,157 @@
+"""Registry, timing and baseline comparison for the benchmark suite."""
+
+from __future__ import annotations
+
+import dataclasses
+import platform
+import statistics
+import time
+import tkinter as tk
+from typing import TYPE_CHECKING
+
+import tklife
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Optional
+
+    CaseFunction = Callable[[tk.Tk, int, "Timer"], None]
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    """A benchmark function and the sizes it is run at."""
+
+    name: str
+    function: CaseFunction
+    sizes: tuple[int, ...]
+    needs_tk: bool = True
+
+
+CASES: dict[str, Case] = {}
+"""Registered benchmark cases, keyed by name."""
+
+
+def case(name: str, sizes: Iterable[int], needs_tk: bool = True):
+    """Registers a benchmark case.
+
+    The decorated function is called once per repetition with the Tk root, the size and
+    a ``Timer``. It must do its setup outside of ``with timer:`` and the measured work
+    inside of it.
+
+    Args:
+        name: The name of the case
+        sizes: The sizes to run the case at
+        needs_tk: Whether the case needs a Tk root (default: True)
+
+    """
+
+    def decorator(function: CaseFunction) -> CaseFunction:
+        CASES[name] = Case(name, function, tuple(sizes), needs_tk)
+        return function
+
+    return decorator
+
+
+class Timer:
+    """Context manager that accumulates the wall time of the blocks it wraps."""
+
+    elapsed: float
+
+    def __init__(self) -> None:
+        self.elapsed = 0.0
+        self.__start = 0.0
+
+    def __enter__(self) -> Timer:
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *__) -> None:
+        self.elapsed += time.perf_counter() - self.__start
+
+
+def run(
+    names: Optional[Iterable[str]] = None,
+    repeat: int = 5,
+    max_size: Optional[int] = None,
+) -> dict[str, Any]:
+    """Runs the benchmark cases and returns the results as a JSON serializable dict.
+
+    Args:
+        names: The names of the cases to run, or None for all (default: None)
+        repeat: The number of repetitions per case and size (default: 5)
+        max_size: Skip sizes larger than this (default: None)
+
+    Returns:
+        The results
+
+    """
+    selected = [CASES[name] for name in names] if names else list(CASES.values())
+    root = tk.Tk() if any(c.needs_tk for c in selected) else None
+    if root is not None:
+        root.withdraw()
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        for bench_case in selected:
+            for size in bench_case.sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                samples = []
+                for __ in range(repeat):
+                    timer = Timer()
+                    bench_case.function(root, size, timer)  # type: ignore[arg-type]
+                    if root is not None:
+                        root.update()
+                    samples.append(timer.elapsed)
+                results[f"{bench_case.name}[{size}]"] = {
+                    "min": min(samples),
+                    "median": statistics.median(samples),
+                    "repeat": repeat,
+                }
+    finally:
+        if root is not None:
+            root.destroy()
+    return {
+        "tklife": tklife.__version__,
+        "python": platform.python_version(),
+        "tk": tk.TkVersion,
+        "results": results,
+    }
+
+
+@dataclasses.dataclass(frozen=True)
+class Regression:
+    """A result that is slower than its baseline by more than the tolerance."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Returns how many times slower the current result is."""
+        return self.current / self.baseline
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.25
+) -> list[Regression]:
+    """Compares results against a baseline using the median of each result.
+
+    Args:
+        current: The results of ``run``
+        baseline: The results of a previous ``run``
+        tolerance: The fraction a result may be slower than the baseline (default:
+            0.25)
+
+    Returns:
+        The regressions found, results missing from either side are ignored
+
+    """
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None or base["median"] <= 0:
+            continue
+        if result["median"] > base["median"] * (1 + tolerance):
+            regressions.append(Regression(name, base["median"], result["median"]))
+    return regressions
@@ -0,0 +1,92 @@
+"""Compares construction time of a 500 widget view with and without
+``SkeletonMixin.cache_template``.
+
+Both views run the current code: the uncached view only disables the cache, and
+compiles its template on every instance. The speedup is the gain of the cache, not a
+comparison with an earlier version of tklife.
+
+Requires a display, run under Xvfb on headless machines::
+
+    xvfb-run python -m benchmarks.template_plan
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from tklife.core import SkeletonMixin, SkelWidget
+
+ROWS = 100
+COLUMNS = 5
+
+
+def make_template():
+    """Returns a template of ``ROWS`` x ``COLUMNS`` widgets."""
+    return tuple(
+        [
+            SkelWidget(ttk.Label, {"text": f"Label {row}"}, {"sticky": tk.W}),
+            SkelWidget(ttk.Entry, {"textvariable": tk.StringVar}, {"sticky": tk.EW}),
+            SkelWidget(ttk.Checkbutton, {"variable": tk.BooleanVar}),
+            SkelWidget(ttk.Button, {"text": "..."}, label=f"button_{row}"),
+            SkelWidget(ttk.Combobox, {"values": ("a", "b")}, {"sticky": tk.EW}),
+        ]
+        for row in range(ROWS)
+    )
+
+
+class UncachedView(SkeletonMixin, ttk.Frame):
+    """View that compiles its template on every instance."""
+
+    @property
+    def template(self):
+        return make_template()
+
+
+class CachedView(SkeletonMixin, ttk.Frame):
+    """View that compiles its template once per class."""
+
+    cache_template = True
+
+    @property
+    def template(self):
+        return make_template()
+
+
+def measure(root: tk.Misc, view_class: type, repeat: int) -> float:
+    """Returns the mean construction time in seconds."""
+    total = 0.0
+    for __ in range(repeat):
+        start = time.perf_counter()
+        view = view_class(root, global_grid_args={"padx": 1, "pady": 1})
+        total += time.perf_counter() - start
+        view.destroy()
+    return total / repeat
+
+
+def main(argv=None) -> None:
+    """Runs the benchmark and prints the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        # Warm up the Tk class bindings and style database
+        measure(root, UncachedView, 1)
+        uncached = measure(root, UncachedView, args.repeat)
+        cached = measure(root, CachedView, args.repeat)
+    finally:
+        root.destroy()
+    print(f"widgets per view: {ROWS * COLUMNS}")
+    print(f"uncached template: {uncached * 1000:.2f} ms")
+    print(f"cached template:   {cached * 1000:.2f} ms")
+    print(f"speedup:           {uncached / cached:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+import tklife.event
+from tklife.aio import AsyncLoop
+from tklife.event import LeanEvent
+from tklife.proxy import CallProxyFactory
+
+
+def _destroy_event(widget):
+    event = LeanEvent()
+    event.widget = str(widget)
+    return event
+
+
+@pytest.fixture
+def scheduled():
+    """Callbacks scheduled with after, as (delay, callback)."""
+    return []
+
+
+@pytest.fixture
+def mock_root(mocker, scheduled):
+    root = mocker.MagicMock()
+    root.after.side_effect = (
+        lambda delay, callback: scheduled.append((delay, callback))
+        or f"after#{len(scheduled)}"
+    )
+    return root
+
+
+@pytest.fixture
+def async_loop(mock_root):
+    async_loop = AsyncLoop(mock_root, interval_ms=5)
+    yield async_loop
+    async_loop.close()
+
+
+def run_ticks(scheduled, limit=100):
+    delays = []
+    while scheduled and limit:
+        delay, callback = scheduled.pop(0)
+        delays.append(delay)
+        callback()
+        limit -= 1
+    return delays
+
+
+class TestAsyncLoop:
+    def test_create_task_runs_coroutine_on_ticks_while_pending(
+        self, async_loop, scheduled
+    ):
+        async def work():
+            await asyncio.sleep(0)
+            return "done"
+
+        task = async_loop.create_task(work())
+        assert async_loop.pending == 1
+        delays = run_ticks(scheduled)
+        assert task.result() == "done"
+        assert async_loop.pending == 0
+        assert delays[0] == 0
+        assert set(delays[1:]) <= {5}
+        assert not scheduled
+
+    def test_destroying_owner_cancels_owned_tasks(self, async_loop, scheduled, mocker):
+        owner = mocker.MagicMock()
+        task = async_loop.create_task(asyncio.sleep(10), owner=owner)
+        other = async_loop.create_task(asyncio.sleep(10))
+        owner.tk.call.assert_called_once_with(
+            "apply", tklife.event._ADD_BINDTAG, "tklife_destroy", str(owner)
+        )
+        on_destroy = owner.nametowidget(".")._register.call_args.args[0]
+        on_destroy(_destroy_event(".owner.child"))
+        assert not task.cancelled()
+        on_destroy(_destroy_event(owner))
+        run_ticks(scheduled, limit=3)
+        assert task.cancelled()
+        assert not other.done()
+
+    def test_task_exceptions_are_reported(self, async_loop, scheduled, mock_root):
+        error = RuntimeError("failed")
+
+        async def fail():
+            raise error
+
+        async_loop.create_task(fail())
+        run_ticks(scheduled)
+        mock_root.report_callback_exception.assert_called_once_with(
+            RuntimeError, error, error.__traceback__
+        )
+
+    def test_close_cancels_pending_tasks(self, async_loop):
+        task = async_loop.create_task(asyncio.sleep(10))
+        async_loop.close()
+        assert task.cancelled()
+        assert async_loop.loop.is_closed()
+
+    def test_destroying_root_closes_loop(self, async_loop, mock_root):
+        on_destroy = mock_root.nametowidget(".")._register.call_args.args[0]
+        on_destroy(_destroy_event(".child"))
+        assert not async_loop.loop.is_closed()
+        on_destroy(_destroy_event(mock_root))
+        assert async_loop.loop.is_closed()
+
+    def test_of_returns_one_loop_per_interpreter(self, mocker, mock_root):
+        widget = mocker.MagicMock()
+        widget.tk = mock_root.tk
+        widget.nametowidget.return_value = mock_root
+        async_loop = AsyncLoop.of(widget)
+        try:
+            assert async_loop.master is mock_root
+            assert AsyncLoop.of(widget) is async_loop
+        finally:
+            async_loop.close()
+        assert AsyncLoop.of(widget) is not async_loop
+        AsyncLoop.of(widget).close()
+
+
+class TestAsyncControllerMethods:
+    class Controller:
+        def __init__(self):
+            self.calls = []
+
+        async def load(self, path):
+            self.calls.append(path)
+
+    def test_proxy_schedules_coroutine_of_async_method(self, mocker):
+        mock_of = mocker.patch("tklife.aio.AsyncLoop.of")
+        skel = mocker.Mock()
+        controller = self.Controller()
+        factory = CallProxyFactory(skel)
+        proxy = factory.load
+        factory.set_controller(controller)
+        task = proxy("data.csv")
+        mock_of.assert_called_once_with(skel)
+        create_task = mock_of.return_value.create_task
+        assert task is create_task.return_value
+        coro = create_task.call_args.args[0]
+        assert create_task.call_args.kwargs == {"owner": skel}
+        with pytest.raises(StopIteration):
+            coro.send(None)
+        assert controller.calls == ["data.csv"]
+
+    def test_proxy_schedules_coroutine_without_target(self, mocker):
+        mock_of = mocker.patch("tklife.aio.AsyncLoop.of")
+        skel = mocker.Mock()
+        skel.controller = self.Controller()
+        proxy = CallProxyFactory(skel).load
+        assert proxy("data.csv") is mock_of.return_value.create_task.return_value
+        mock_of.return_value.create_task.call_args.args[0].close()
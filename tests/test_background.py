@@ -0,0 +1,363 @@
+import multiprocessing
+import threading
+import time
+from tkinter import TclError
+
+import pytest
+
+from tklife.background import (
+    BackgroundExecutor,
+    ProcessExecutor,
+    TaskCancelled,
+    background,
+    offload,
+)
+from tklife.controller import ControllerABC
+from tklife.core import CreatedWidget
+
+
+def square(value):
+    return value * value
+
+
+def fail():
+    raise ValueError("bad")
+
+
+def count(total, task):
+    for value in range(total):
+        task.report((value + 1) / total)
+    return total
+
+
+def sleep(seconds):
+    time.sleep(seconds)
+
+
+@pytest.fixture
+def scheduled():
+    """Callbacks scheduled with after, as (delay, callback)."""
+    return []
+
+
+@pytest.fixture
+def mock_root(mocker, scheduled):
+    root = mocker.MagicMock()
+    root.after.side_effect = (
+        lambda delay, callback: scheduled.append((delay, callback))
+        or f"after#{len(scheduled)}"
+    )
+    return root
+
+
+@pytest.fixture
+def executor(mock_root):
+    executor = BackgroundExecutor(mock_root, max_workers=2, interval_ms=5)
+    yield executor
+    executor.shutdown()
+
+
+def run_ticks(executor, scheduled, timeout=5.0):
+    """Runs the ticks of the executor until no task is pending."""
+    deadline = time.monotonic() + timeout
+    ticks = 0
+    while scheduled and time.monotonic() < deadline:
+        __, callback = scheduled.pop(0)
+        callback()
+        ticks += 1
+        if executor.pending:
+            time.sleep(0.001)
+    assert not executor.pending
+    return ticks
+
+
+class TestBackgroundExecutor:
+    def test_submit_delivers_result_on_tick(self, mocker, executor, scheduled):
+        on_done = mocker.Mock()
+        thread_ids = []
+
+        def work(value):
+            thread_ids.append(threading.get_ident())
+            return value * 2
+
+        task = executor.submit(work, 21, on_done=on_done)
+        assert scheduled[0][0] == 5
+        run_ticks(executor, scheduled)
+        on_done.assert_called_once_with(42)
+        assert task.done
+        assert thread_ids != [threading.get_ident()]
+        assert not scheduled
+
+    def test_error_is_passed_to_on_error(self, mocker, executor, scheduled):
+        on_error = mocker.Mock()
+        error = ValueError("bad")
+
+        def work():
+            raise error
+
+        executor.submit(work, on_error=on_error)
+        run_ticks(executor, scheduled)
+        on_error.assert_called_once_with(error)
+
+    def test_error_is_reported_without_on_error(self, executor, scheduled, mock_root):
+        def work():
+            raise ValueError("bad")
+
+        executor.submit(work)
+        run_ticks(executor, scheduled)
+        assert mock_root.report_callback_exception.call_args.args[0] is ValueError
+
+    def test_only_latest_progress_is_delivered(self, mocker, executor, scheduled):
+        on_progress = mocker.Mock()
+        reported = threading.Event()
+
+        def work(task):
+            for value in range(10):
+                task.report(value)
+            reported.set()
+
+        executor.submit(work, on_progress=on_progress, pass_task=True)
+        reported.wait(5)
+        run_ticks(executor, scheduled)
+        on_progress.assert_called_once_with(9)
+
+    def test_cancelled_task_is_not_delivered(self, mocker, executor, scheduled):
+        on_done = mocker.Mock()
+        started = threading.Event()
+        stopped = []
+
+        def work(task):
+            started.set()
+            while not task.cancelled:
+                time.sleep(0.001)
+            stopped.append(True)
+            task.raise_if_cancelled()
+
+        task = executor.submit(work, on_done=on_done, pass_task=True)
+        started.wait(5)
+        task.cancel()
+        run_ticks(executor, scheduled)
+        on_done.assert_not_called()
+        assert stopped == [True]
+        assert task.done
+
+    def test_raise_if_cancelled(self, executor):
+        task = executor.submit(lambda: None)
+        task.cancel()
+        with pytest.raises(TaskCancelled):
+            task.raise_if_cancelled()
+
+    def test_limit_per_owner(self, mock_master, executor, scheduled):
+        release = threading.Event()
+        first = executor.submit(release.wait, owner=mock_master, limit=1)
+        assert executor.submit(release.wait, owner=mock_master, limit=1) is None
+        assert executor.pending_for(mock_master) == 1
+        release.set()
+        run_ticks(executor, scheduled)
+        assert first.done
+        assert executor.pending_for(mock_master) == 0
+        assert executor.submit(lambda: None, owner=mock_master, limit=1) is not None
+
+    def test_owner_destroy_cancels_tasks(self, mocker, mock_master, executor):
+        watch = mocker.patch("tklife.background._watch_destroy")
+        release = threading.Event()
+        task = executor.submit(release.wait, owner=mock_master)
+        watch.assert_called_once()
+        owner, path, owner_destroyed = watch.call_args.args
+        assert (owner, path) == (mock_master, str(mock_master))
+        owner_destroyed()
+        assert task.cancelled
+        release.set()
+
+    def test_root_destroy_shuts_down(self, mocker, mock_root):
+        watch = mocker.patch("tklife.background._watch_destroy")
+        executor = BackgroundExecutor(mock_root)
+        assert watch.call_args.args[:2] == (mock_root, str(mock_root))
+        destroyed = watch.call_args.args[2]
+        destroyed()
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+
+class TestBackgroundDecorator:
+    def test_method_runs_owned_by_view(self, mocker, executor, scheduled):
+        mocker.patch.object(BackgroundExecutor, "of", return_value=executor)
+        done = []
+
+        class Controller:
+            view = mocker.MagicMock()
+
+            def show(self, result):
+                done.append(result)
+
+            @background(on_done="show", limit=1)
+            def load(self, path, task):
+                task.report(0.5)
+                return path.upper()
+
+        controller = Controller()
+        task = controller.load("file")
+        assert task.owner == str(controller.view)
+        run_ticks(executor, scheduled)
+        assert done == ["FILE"]
+        assert Controller.load.__name__ == "load"
+
+    def test_bare_decorator(self, mocker, executor, scheduled):
+        mocker.patch.object(BackgroundExecutor, "of", return_value=executor)
+
+        class Controller:
+            view = mocker.MagicMock()
+
+            @background
+            def load(self):
+                return 1
+
+        task = Controller().load()
+        run_ticks(executor, scheduled)
+        assert task.done
+
+
+@pytest.fixture
+def process_executor(mock_root):
+    executor = ProcessExecutor(mock_root, max_workers=2, interval_ms=5, max_rate=1000)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def mock_progressbar(mocker):
+    progressbar = mocker.MagicMock()
+    progressbar.cget.side_effect = {
+        "style": "",
+        "orient": "horizontal",
+        "maximum": 100,
+    }.get
+    return progressbar
+
+
+class TestProcessExecutor:
+    def test_submit_delivers_result(self, mocker, process_executor, scheduled):
+        on_done = mocker.Mock()
+        process_executor.submit(square, 7, on_done=on_done)
+        run_ticks(process_executor, scheduled)
+        on_done.assert_called_once_with(49)
+
+    def test_workers_are_reused(self, process_executor, scheduled):
+        results = []
+        for value in range(5):
+            process_executor.submit(square, value, on_done=results.append)
+        run_ticks(process_executor, scheduled)
+        assert sorted(results) == [0, 1, 4, 9, 16]
+
+    def test_error_has_remote_traceback(self, mocker, process_executor, scheduled):
+        on_error = mocker.Mock()
+        process_executor.submit(fail, on_error=on_error)
+        run_ticks(process_executor, scheduled)
+        error = on_error.call_args.args[0]
+        assert isinstance(error, ValueError)
+        assert "raise ValueError" in str(error.__cause__)
+
+    def test_unpicklable_arguments_raise(self, process_executor):
+        with pytest.raises(Exception):
+            process_executor.submit(square, lambda: None)
+        assert not process_executor.pending
+
+    def test_progress_drives_progressbar(
+        self, mocker, process_executor, scheduled, mock_progressbar
+    ):
+        on_done = mocker.Mock()
+        process_executor.submit(
+            count,
+            50,
+            pass_task=True,
+            progressbar=mock_progressbar,
+            on_done=on_done,
+        )
+        mock_progressbar.__setitem__.assert_called_once_with(
+            "style", "Horizontal.TProgressbar"
+        )
+        run_ticks(process_executor, scheduled)
+        on_done.assert_called_once_with(50)
+        assert mock_progressbar.configure.call_args_list[0] == mocker.call(
+            mode="determinate", value=0
+        )
+        assert mock_progressbar.configure.call_args == mocker.call(value=100.0)
+
+    def test_timeout_terminates_worker(self, mocker, process_executor, scheduled):
+        on_error = mocker.Mock()
+        task = process_executor.submit(sleep, 30, timeout=0.05, on_error=on_error)
+        run_ticks(process_executor, scheduled)
+        assert isinstance(on_error.call_args.args[0], TimeoutError)
+        assert task.done
+
+    def test_cancel_terminates_worker(self, mocker, process_executor, scheduled):
+        on_done = mocker.Mock()
+        task = process_executor.submit(sleep, 30, on_done=on_done)
+        worker_pids = {child.pid for child in multiprocessing.active_children()}
+        task.cancel()
+        assert task.done
+        assert not process_executor.pending
+        time.sleep(0.1)
+        alive = {child.pid for child in multiprocessing.active_children()}
+        assert worker_pids and not worker_pids & alive
+        on_done.assert_not_called()
+
+    def test_owner_destroyed_with_progressbar(
+        self, mocker, mock_master, process_executor, mock_progressbar
+    ):
+        watch = mocker.patch("tklife.background._watch_destroy")
+        tasks = [
+            process_executor.submit(
+                sleep, 30, owner=mock_master, progressbar=mock_progressbar
+            )
+            for __ in range(3)
+        ]
+        owner_destroyed = watch.call_args.args[2]
+        mock_progressbar.winfo_exists.return_value = 0
+        mock_progressbar.configure.side_effect = TclError("bad window path name")
+        owner_destroyed()
+        assert all(task.cancelled and task.done for task in tasks)
+        assert process_executor.pending == 0
+        assert process_executor.pending_for(mock_master) == 0
+
+    def test_waiting_task_can_be_cancelled(self, mock_root, scheduled):
+        executor = ProcessExecutor(mock_root, max_workers=1, interval_ms=5)
+        results = []
+        executor.submit(square, 2, on_done=results.append)
+        waiting = executor.submit(square, 3, on_done=results.append)
+        waiting.cancel()
+        run_ticks(executor, scheduled)
+        executor.shutdown()
+        assert results == [4]
+
+    def test_offload_method(self, mocker, process_executor, scheduled):
+        mocker.patch.object(ProcessExecutor, "of", return_value=process_executor)
+        done = []
+
+        class Controller:
+            view = mocker.MagicMock()
+            compute = offload(square, on_done=done.append, limit=1)
+
+        controller = Controller()
+        assert controller.compute(3) is not None
+        assert controller.compute(4) is None
+        run_ticks(process_executor, scheduled)
+        assert done == [9]
+
+    def test_offload_progressbar_of_view(
+        self, mocker, process_executor, scheduled, mock_progressbar
+    ):
+        mocker.patch.object(ProcessExecutor, "of", return_value=process_executor)
+        done = []
+
+        class Controller(ControllerABC):
+            compute = offload(count, progressbar="progress", on_done=done.append)
+
+        controller = Controller()
+        controller.set_view(mocker.MagicMock())
+        controller.view.created = {"progress": CreatedWidget(widget=mock_progressbar)}
+        task = controller.compute(4)
+        assert task.progressbar is mock_progressbar
+        run_ticks(process_executor, scheduled)
+        assert done == [4]
+        assert mock_progressbar.configure.call_args == mocker.call(value=100.0)
@@ -1,4 +1,5 @@
-from tkinter import Variable
+from tkinter import TclError, Variable, ttk
+from types import SimpleNamespace
 from typing import Iterable
 from unittest.mock import call
 
@@ -6,8 +7,17 @@ import pytest
 import pytest_mock
 from pytest_mock import MockerFixture
 
-from tklife.core import CreatedWidget, SkeletonMixin, SkelEventDef, SkelWidget
-from tklife.event import BaseEvent
+from tklife.core import (
+    CachedWidget,
+    CreatedWidget,
+    SkeletonMixin,
+    SkelEventDef,
+    SkelWidget,
+    WidgetCache,
+    WidgetPool,
+)
+from tklife.event import BaseEvent, TkEvent
+from tklife.profiling import CONSTRUCTION_PHASES
 from tklife.proxy import CallProxyFactory
 
 
@@ -608,6 +618,146 @@ class TestSkeletonMixin:
             getattr(mock_event, "bind").return_value,
         )
 
+    def test_add_to_group_adds_group_tag_to_cached_widgets(
+        self, mock_master, mock_mixin_class, mocker
+    ):
+        mock_add_bindtag = mocker.patch("tklife.core.add_bindtag")
+        widgets = [mocker.MagicMock() for __ in range(3)]
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            pass
+
+        created = Tested(mock_master)
+        created.widget_cache[0, 0] = CachedWidget(widgets[0], {})
+        created.widget_cache[0, 1] = CachedWidget(None, None)
+        created.widget_cache[1, 0] = CachedWidget(widgets[1], {})
+        created.add_to_group("rows")
+        tag, grouped = mock_add_bindtag.call_args.args
+        assert tag == created.group_tag("rows") == f"rows@{created}"
+        assert list(grouped) == widgets[:2]
+        created.add_row_to_group("rows", 1)
+        assert list(mock_add_bindtag.call_args.args[1]) == [widgets[1]]
+
+    def test_bind_group_calls_action_with_widget_position(
+        self, mock_master, mock_mixin_class, mocker
+    ):
+        mock_scope = mocker.patch("tklife.core.BindingScope")
+        widget = mocker.MagicMock()
+        action = mocker.Mock(return_value="break")
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            pass
+
+        created = Tested(mock_master)
+        created.widget_cache[2, 1] = CachedWidget(widget, {})
+        funcid = created.bind_group("rows", TkEvent.BUTTON, action, fields=("x",))
+        bind = mock_scope.return_value.bind
+        assert funcid is bind.return_value
+        event, bound_on, group_action = bind.call_args.args
+        assert (event, bound_on) == (TkEvent.BUTTON, created)
+        assert bind.call_args.kwargs == {
+            "classname": f"rows@{created}",
+            "fields": ("widget", "x"),
+        }
+        group_event = SimpleNamespace(widget=widget)
+        assert group_action(group_event) == "break"
+        action.assert_called_once_with(group_event, (2, 1))
+
+    def test_controller_setter_makes_proxies_call_controller_directly(
+        self, no_template_skeleton, mock_master, mock_controller, mocker
+    ):
+        mock_controller.button_a_command = mocker.Mock()
+        skeleton = no_template_skeleton(mock_master)
+        proxy = skeleton.controller.button_a_command
+        assert proxy is skeleton.controller.button_a_command
+        skeleton.controller = mock_controller
+        assert proxy.target is mock_controller.button_a_command
+        skeleton.controller = None
+        assert proxy.target is None
+
+    def test_direct_commands_rewrites_proxied_options_when_controller_is_set(
+        self, mock_master, mock_mixin_class, mock_controller, mocker
+    ):
+        mock_controller.button_a_command = mocker.Mock()
+        widget_class = mocker.Mock()
+        widget = widget_class.return_value
+        widget.cget.return_value = "123proxy"
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            direct_commands = True
+
+            @property
+            def template(self):
+                return (
+                    [
+                        SkelWidget(
+                            widget_class,
+                            {"command": self.controller.button_a_command},
+                        )
+                    ],
+                )
+
+        created = Tested(mock_master)
+        proxy = created.controller.button_a_command
+        widget_class.assert_called_once_with(created, command=proxy)
+        created.controller = mock_controller
+        widget.cget.assert_called_once_with("command")
+        widget.configure.assert_called_with(
+            {"command": mock_controller.button_a_command}
+        )
+        widget.deletecommand.assert_called_once_with("123proxy")
+
+    def test_direct_commands_passes_controller_method_once_controller_is_set(
+        self, mock_master, mock_mixin_class, mock_controller, mocker
+    ):
+        mock_controller.button_a_command = mocker.Mock()
+        widget_class = mocker.Mock()
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            direct_commands = True
+
+            @property
+            def template(self):
+                return (
+                    [
+                        SkelWidget(
+                            widget_class,
+                            {"command": self.controller.button_a_command},
+                        )
+                    ],
+                )
+
+        created = Tested(mock_master, mock_controller)
+        widget_class.assert_called_once_with(
+            created, command=mock_controller.button_a_command
+        )
+
+    def test_create_events_tracks_bindings_in_binding_scope(
+        self, mock_master, mock_mixin_class, mocker
+    ):
+        mock_scope = mocker.patch("tklife.core.BindingScope")
+        mock_event = mocker.Mock(spec=BaseEvent)
+        mock_toplevel = mocker.MagicMock()
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            @property
+            def events(self) -> Iterable[SkelEventDef]:
+                return [
+                    {
+                        "event": mock_event,
+                        "action": mocker.MagicMock(),
+                        "widget": mock_toplevel,
+                        "classname": "all",
+                    },
+                ]
+
+        created = Tested(mock_master)
+        mock_scope.assert_called_once_with(created)
+        assert created.binding_scope is mock_scope.return_value
+        mock_scope.return_value.track.assert_called_once_with(
+            mock_event, mock_toplevel, mock_event.bind.return_value, "all"
+        )
+
     @pytest.mark.parametrize(
         "in_args",
         [
@@ -795,6 +945,227 @@ class TestSkeletonMixin:
         tested.controller = mock_controller
         mock_controller.set_view.assert_called_once_with(tested)
 
+    def test_create_all_does_not_replace_variable_factories_in_template(
+        self, mock_master, mock_mixin_class, mock_tk_var, mocked_widget
+    ):
+        skel_widget = SkelWidget(mocked_widget, {"arg1": mock_tk_var}, {})
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return ([skel_widget],)
+
+        Tested(mock_master)
+        assert skel_widget.init_args == {"arg1": mock_tk_var}
+
+    def test_create_all_calls_overridden_widget_create_for_every_cell(
+        self, mock_master, mock_mixin_class, mocked_widget
+    ):
+        first = SkelWidget(mocked_widget)
+        second = SkelWidget(mocked_widget)
+        calls = []
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return ([first, None], [second])
+
+            def _widget_create(self, skel_widget, row_index, col_index):
+                calls.append((skel_widget, row_index, col_index))
+                return super()._widget_create(skel_widget, row_index, col_index)
+
+        Tested(mock_master)
+        assert calls == [(first, 0, 0), (None, 0, 1), (second, 1, 0)]
+
+    def test_cache_template_evaluates_template_once_per_class(
+        self, mock_master, mock_mixin_class, mocked_widget, mocker: MockerFixture
+    ):
+        template_calls = []
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            cache_template = True
+
+            @property
+            def template(self):
+                template_calls.append(self)
+                return ([SkelWidget(mocked_widget, {}, {"arg1": True}), None],)
+
+        first = Tested(mock_master, global_grid_args={"garg": True})
+        second = Tested(mock_master, global_grid_args={"garg": True})
+        assert template_calls == [first]
+        assert second.widget_cache == {
+            (0, 0): (mocked_widget.return_value, {"garg": True, "arg1": True}),
+            (0, 1): (None, None),
+        }
+        assert mocked_widget.mock_calls[3:] == [
+            call(second),
+            call().configure(),
+            call().grid(row=0, column=0, garg=True, arg1=True),
+        ]
+
+    def test_cache_template_calls_variable_factories_per_instance(
+        self, mock_master, mock_mixin_class, mocked_widget, mocker: MockerFixture
+    ):
+        var_factory = mocker.Mock(type(Variable))
+        var_factory.side_effect = lambda: mocker.Mock(Variable)
+
+        class Tested(SkeletonMixin, mock_mixin_class):
+            cache_template = True
+
+            @property
+            def template(self):
+                return ([SkelWidget(mocked_widget, {"textvariable": var_factory})],)
+
+        first = Tested(mock_master)
+        second = Tested(mock_master)
+        first_var, second_var = (
+            c.kwargs["textvariable"] for c in mocked_widget.call_args_list
+        )
+        assert var_factory.call_count == 2
+        assert first_var is not second_var
+        assert second.widget_cache[0, 0].widget == mocked_widget.return_value
+
+    def test_cache_template_plan_is_not_shared_with_subclasses(
+        self, mock_master, mock_mixin_class, mocker: MockerFixture
+    ):
+        parent_widget, child_widget = mocker.Mock(), mocker.Mock()
+
+        class Parent(SkeletonMixin, mock_mixin_class):
+            cache_template = True
+
+            @property
+            def template(self):
+                return ([SkelWidget(parent_widget)],)
+
+        class Child(Parent):
+            @property
+            def template(self):
+                return ([SkelWidget(child_widget)],)
+
+        Parent(mock_master)
+        Child(mock_master)
+        assert parent_widget.call_count == 1
+        assert child_widget.call_count == 1
+
+    def test_construction_stats_is_none_unless_profiled(
+        self, mock_master, mock_mixin_class
+    ):
+        class Tested(SkeletonMixin, mock_mixin_class):
+            pass
+
+        assert Tested(mock_master).construction_stats is None
+        assert Tested.construction_aggregate().count == 0
+
+    def test_profile_construction_records_phases_and_cells(
+        self, mock_master, mock_mixin_class, mocked_widget
+    ):
+        class Tested(SkeletonMixin, mock_mixin_class):
+            profile_construction = True
+
+            @property
+            def template(self):
+                return ([SkelWidget(mocked_widget, label="label"), None],)
+
+        skeleton = Tested(mock_master)
+        stats = skeleton.construction_stats
+        assert list(stats.phases) == list(CONSTRUCTION_PHASES)
+        assert [(c.row, c.column, c.label) for c in stats.cells.values()] == [
+            (0, 0, "label"),
+            (0, 1, None),
+        ]
+        Tested(mock_master)
+        assert Tested.construction_aggregate().count == 2
+        assert SkeletonMixin.construction_aggregate().count == 0
+
+
+class TestSkeletonMixinBulkCreate:
+    @pytest.fixture
+    def bulk_skeleton(self, mock_mixin_class, mocker: MockerFixture):
+        def factory(template, bulk_create="template", tk=None):
+            class Tested(SkeletonMixin, mock_mixin_class):
+                def __after_init__(self):
+                    self._w = ".tested"
+                    self._last_child_ids = None
+                    self.children = {}
+                    self.tk = tk or mocker.MagicMock()
+
+                @property
+                def template(self):
+                    return template
+
+            Tested.bulk_create = bulk_create
+            return Tested
+
+        return factory
+
+    def test_bulk_create_evaluates_a_single_script_for_template(
+        self, bulk_skeleton, mock_master
+    ):
+        skeleton = bulk_skeleton(
+            (
+                [
+                    SkelWidget(ttk.Label, {"text": "a b"}, {"sticky": "w"}),
+                    None,
+                ],
+                [SkelWidget(ttk.Entry, config_args={"width": 3}, label="entry")],
+            )
+        )(mock_master, global_grid_args={"padx": 1})
+        skeleton.tk.eval.assert_called_once_with(
+            "\n".join(
+                [
+                    "set tklife_bulk_step {initializing 0 0}",
+                    "ttk::label .tested.!label -text {a b}",
+                    "set tklife_bulk_step {gridding 0 0}",
+                    "grid configure .tested.!label -row 0 -column 0 -padx 1 -sticky w",
+                    "set tklife_bulk_step {initializing 1 0}",
+                    "ttk::entry .tested.!entry",
+                    "set tklife_bulk_step {configuring 1 0}",
+                    ".tested.!entry configure -width 3",
+                    "set tklife_bulk_step {gridding 1 0}",
+                    "grid configure .tested.!entry -row 1 -column 0 -padx 1",
+                ]
+            )
+        )
+        label, entry = skeleton.widget_cache[0, 0], skeleton.widget_cache[1, 0]
+        assert isinstance(label.widget, ttk.Label)
+        assert str(label.widget) == ".tested.!label"
+        assert label.grid_args == {"padx": 1, "sticky": "w"}
+        assert skeleton.widget_cache[0, 1] == (None, None)
+        assert skeleton.created["entry"].widget is entry.widget
+        assert skeleton.children == {"!label": label.widget, "!entry": entry.widget}
+
+    def test_bulk_create_by_row_evaluates_a_script_per_row(
+        self, bulk_skeleton, mock_master
+    ):
+        skeleton = bulk_skeleton(
+            ([SkelWidget(ttk.Label)], [SkelWidget(ttk.Label)]), bulk_create="row"
+        )(mock_master)
+        assert skeleton.tk.eval.call_count == 2
+
+    def test_bulk_create_creates_unsupported_widgets_in_template_order(
+        self, bulk_skeleton, mock_master, mocked_widget
+    ):
+        skeleton = bulk_skeleton(
+            ([SkelWidget(ttk.Label), SkelWidget(mocked_widget), SkelWidget(ttk.Label)],)
+        )(mock_master)
+        assert skeleton.tk.eval.call_count == 2
+        mocked_widget.assert_called_once_with(skeleton)
+        mocked_widget.return_value.grid.assert_called_once_with(row=0, column=1)
+        assert skeleton.widget_cache[0, 1] == (mocked_widget.return_value, {})
+
+    def test_bulk_create_reports_row_and_column_of_failed_step(
+        self, bulk_skeleton, mock_master, mocker: MockerFixture
+    ):
+        tk = mocker.MagicMock()
+        tk.eval.side_effect = TclError("bad option")
+        tk.getvar.return_value = "configuring 0 1"
+        Tested = bulk_skeleton(([SkelWidget(ttk.Label), SkelWidget(ttk.Label)],), tk=tk)
+        with pytest.raises(
+            ValueError,
+            match="Error configuring widget at row 0, column 1: bad option",
+        ):
+            Tested(mock_master)
+
 
 class TestCreatedWidget:
     @pytest.fixture
@@ -872,3 +1243,171 @@ class TestCreatedWidget:
     def test_dunder_setitem_raises_attribute_error(self, created_widget):
         with pytest.raises(AttributeError):
             created_widget["not_an_attribute"] = "value"
+
+
+class TestWidgetCache:
+    @pytest.fixture
+    def widgets(self, mocker: MockerFixture):
+        return [mocker.Mock() for __ in range(4)]
+
+    @pytest.fixture
+    def cache(self, widgets):
+        return WidgetCache(
+            [
+                ((0, 0), CachedWidget(widgets[0], {})),
+                ((0, 1), CachedWidget(None, None)),
+                ((1, 0), CachedWidget(widgets[1], {})),
+                ((2, 0), CachedWidget(widgets[2], {"sticky": "w"})),
+            ]
+        )
+
+    def test_behaves_like_dict(self, cache, widgets):
+        assert cache == {
+            (0, 0): (widgets[0], {}),
+            (0, 1): (None, None),
+            (1, 0): (widgets[1], {}),
+            (2, 0): (widgets[2], {"sticky": "w"}),
+        }
+        assert len(cache) == 4
+        assert (0, 1) in cache
+        assert (3, 0) not in cache
+        with pytest.raises(KeyError):
+            cache[3, 0]
+
+    def test_iterates_in_row_order(self, widgets):
+        cache = WidgetCache()
+        cache[1, 0] = CachedWidget(widgets[1], {})
+        cache[0, 0] = CachedWidget(widgets[0], {})
+        assert list(cache) == [(0, 0), (1, 0)]
+
+    def test_max_row_tracks_last_row(self, cache, widgets):
+        assert cache.max_row == 2
+        cache[5, 0] = CachedWidget(widgets[3], {})
+        assert cache.max_row == 5
+        del cache[5, 0]
+        assert cache.max_row == 2
+        cache.clear()
+        assert cache.max_row == -1
+
+    def test_position_of_returns_position_of_widget(self, cache, widgets):
+        assert cache.position_of(widgets[1]) == (1, 0)
+        del cache[1, 0]
+        assert cache.position_of(widgets[1]) is None
+        cache[1, 0] = CachedWidget(widgets[3], {})
+        assert cache.position_of(widgets[3]) == (1, 0)
+
+    def test_delete_row_removes_row_without_shifting(self, cache, widgets):
+        assert cache.delete_row(0) == {
+            0: (widgets[0], {}),
+            1: (None, None),
+        }
+        assert cache == {
+            (1, 0): (widgets[1], {}),
+            (2, 0): (widgets[2], {"sticky": "w"}),
+        }
+        assert cache.position_of(widgets[0]) is None
+
+    @pytest.mark.parametrize(
+        "start, offset, expected_moved, expected_positions",
+        [
+            (1, 1, [2, 3], [(0, 0), (2, 0), (3, 0)]),
+            (0, 2, [2, 3, 4], [(2, 0), (3, 0), (4, 0)]),
+            (3, 1, [], [(0, 0), (1, 0), (2, 0)]),
+        ],
+    )
+    def test_shift_rows_moves_rows_and_positions(
+        self, cache, widgets, start, offset, expected_moved, expected_positions
+    ):
+        assert cache.shift_rows(start, offset) == expected_moved
+        assert [cache.position_of(w) for w in widgets[:3]] == expected_positions
+        assert cache.max_row == expected_positions[-1][0]
+
+    def test_shift_rows_moves_rows_up(self, cache, widgets):
+        cache.delete_row(1)
+        assert cache.shift_rows(2, -1) == [1]
+        assert cache.position_of(widgets[2]) == (1, 0)
+        assert cache.max_row == 1
+
+    def test_shift_rows_raises_error_if_rows_would_be_replaced(self, cache):
+        with pytest.raises(ValueError):
+            cache.shift_rows(2, -1)
+
+    def test_renumber_rows_moves_rows_all_at_once(self, cache, widgets):
+        assert cache.renumber_rows({0: 2, 2: 0, 5: 6}) == [0, 2]
+        assert cache.position_of(widgets[0]) == (2, 0)
+        assert cache.position_of(widgets[2]) == (0, 0)
+        assert cache[2, 1] == (None, None)
+        assert cache.max_row == 2
+
+    @pytest.mark.parametrize("mapping", [{0: 1}, {0: 3, 1: 3}])
+    def test_renumber_rows_raises_error_if_rows_would_be_replaced(self, cache, mapping):
+        with pytest.raises(ValueError):
+            cache.renumber_rows(mapping)
+        assert cache.max_row == 2
+
+
+class TestWidgetPool:
+    @pytest.fixture
+    def key(self):
+        return WidgetPool.key_of(ttk.Label, {"text": "a"}, ["style"])
+
+    def _parkable(self, mocker: MockerFixture, key):
+        widget = mocker.Mock(spec=ttk.Label)
+        widget.__pool_key__ = key
+        return widget
+
+    def test_key_of_differs_by_argument_names_and_create_only_options(self, key):
+        assert key == WidgetPool.key_of(ttk.Label, {"text": "b"}, ["style"])
+        assert key != WidgetPool.key_of(ttk.Label, {"text": "a"}, [])
+        assert key != WidgetPool.key_of(ttk.Label, {"text": "a", "width": 2}, ["style"])
+        assert WidgetPool.key_of(ttk.Frame, {"class_": "A"}, []) != WidgetPool.key_of(
+            ttk.Frame, {"class_": "B"}, []
+        )
+
+    def test_key_of_returns_none_if_widget_cannot_be_pooled(self, mocked_widget):
+        class CustomLabel(ttk.Label):
+            def __init__(self, master=None, **kw):
+                super().__init__(master, **kw)
+
+        assert WidgetPool.key_of(mocked_widget, {}, []) is None
+        assert WidgetPool.key_of(CustomLabel, {}, []) is None
+        assert WidgetPool.key_of(ttk.Frame, {"class_": ["unhashable"]}, []) is None
+
+    def test_acquire_returns_most_recently_released_widget(
+        self, key, mocker: MockerFixture
+    ):
+        pool = WidgetPool()
+        widgets = [self._parkable(mocker, key) for __ in range(2)]
+        assert all(pool.release(widget) for widget in widgets)
+        widgets[0].grid_remove.assert_called_once_with()
+        assert len(pool) == 2
+        assert pool.acquire(key) is widgets[1]
+        assert pool.acquire(key) is widgets[0]
+        assert pool.acquire(key) is None
+        assert (pool.hits, pool.misses) == (2, 1)
+        assert len(pool) == 0
+
+    def test_release_returns_false_if_widget_cannot_be_pooled(
+        self, mocker: MockerFixture
+    ):
+        pool = WidgetPool()
+        widget = mocker.Mock(spec=ttk.Label)
+        assert not pool.release(widget)
+        assert not WidgetPool(0).release(self._parkable(mocker, "key"))
+        widget.grid_remove.assert_not_called()
+
+    def test_release_evicts_least_recently_released_widget(
+        self, key, mocker: MockerFixture
+    ):
+        pool = WidgetPool(2)
+        widgets = [self._parkable(mocker, key) for __ in range(2)]
+        other = self._parkable(mocker, "other")
+        for widget in [*widgets, other]:
+            pool.release(widget)
+        widgets[0].destroy.assert_called_once_with()
+        assert pool.evictions == 1
+        assert pool.acquire(key) is widgets[1]
+        assert pool.acquire(key) is None
+        pool.clear()
+        other.destroy.assert_called_once_with()
+        assert len(pool) == 0
@@ -1,3 +1,4 @@
+from tkinter import StringVar
 from typing import Iterable, Optional
 from unittest.mock import call
 
@@ -5,7 +6,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from tklife.core import SkeletonMixin, SkelWidget
-from tklife.dynamic import AppendableMixin
+from tklife.dynamic import AppendableMixin, VirtualRowsMixin
 
 
 def _generate_expected_cache(
@@ -226,10 +227,7 @@ class TestAppendableMixin:
             (
                 1,
                 [call().destroy()],
-                [
-                    call().grid(row=0, column=0, garg1=True),
-                    call().grid(row=0, column=1),
-                ],
+                [],  # Rows before the destroyed row do not move
                 {(0, 0): {"garg1": True}, (0, 1): {}},
             ),
         ],
@@ -468,3 +466,490 @@ class TestAppendableMixin:
             mocked_widget.mock_calls[len([e for e in existing if e is not None]) * 3 :]
             == expected_calls
         )
+
+    def test_destroy_row_regrids_only_rows_after_destroyed_row(
+        self, mock_master, mock_controller, mock_mixin_class, mocker: MockerFixture
+    ):
+        mocked_widgets = [mocker.Mock() for __ in range(3)]
+
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return tuple(
+                    [SkelWidget(widget, {}, {"sticky": "w"}, label=str(index))]
+                    for index, widget in enumerate(mocked_widgets)
+                )
+
+        skeleton = Tested(mock_master, mock_controller)
+        skeleton.destroy_row(1)
+        assert mocked_widgets[0].return_value.grid.call_count == 1
+        mocked_widgets[1].return_value.destroy.assert_called_once_with()
+        mocked_widgets[2].return_value.grid.assert_called_with(
+            row=1, column=0, sticky="w"
+        )
+        assert "1" not in skeleton.created
+        assert skeleton.find_row_of("2") == 1
+        assert skeleton.widget_cache.max_row == 1
+
+    def test_find_row_of_returns_row_index_after_insert(
+        self, mock_master, mock_controller, mock_mixin_class, mocker: MockerFixture
+    ):
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return ([SkelWidget(mocker.Mock(), label="0")],)
+
+        skeleton = Tested(mock_master, mock_controller)
+        skeleton.insert_row_at(0, [SkelWidget(mocker.Mock(), label="1")])
+        assert skeleton.find_row_of("0") == 1
+        assert skeleton.find_row_of("1") == 0
+
+    @pytest.mark.parametrize("index", [-1, 3])
+    def test_insert_row_at_raises_index_error_if_out_of_range(
+        self, mock_master, mock_controller, mock_mixin_class, mocked_widget, index
+    ):
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return ([SkelWidget(mocked_widget)],)
+
+        skeleton = Tested(mock_master, mock_controller)
+        with pytest.raises(IndexError):
+            skeleton.insert_row_at(index, [SkelWidget(mocked_widget)])
+
+    def test_insert_row_at_appends_to_empty_widget(
+        self, mock_master, mock_controller, mock_mixin_class, mocked_widget
+    ):
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            pass
+
+        skeleton = Tested(mock_master, mock_controller)
+        assert skeleton.insert_row_at(0, [SkelWidget(mocked_widget)]) == 0
+        assert skeleton.widget_cache == {(0, 0): (mocked_widget.return_value, {})}
+
+    @pytest.fixture
+    def three_row_skeleton(
+        self, mock_master, mock_controller, mock_mixin_class, mocker: MockerFixture
+    ):
+        mocked_widgets = [mocker.Mock() for __ in range(3)]
+
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return tuple(
+                    [SkelWidget(widget, label=str(index)), None]
+                    for index, widget in enumerate(mocked_widgets)
+                )
+
+        return Tested(mock_master, mock_controller), mocked_widgets
+
+    def test_append_rows_appends_rows_after_last_row(
+        self, three_row_skeleton, mocker: MockerFixture
+    ):
+        skeleton, __ = three_row_skeleton
+        new_widgets = [mocker.Mock() for __ in range(2)]
+        actual = skeleton.append_rows(
+            [SkelWidget(widget, label=f"new{i}")]
+            for i, widget in enumerate(new_widgets)
+        )
+        assert actual == [3, 4]
+        new_widgets[1].return_value.grid.assert_called_once_with(row=4, column=0)
+        assert skeleton.find_row_of("new1") == 4
+
+    def test_insert_rows_at_moves_later_rows_once(
+        self, three_row_skeleton, mocker: MockerFixture
+    ):
+        skeleton, mocked_widgets = three_row_skeleton
+        new_widgets = [mocker.Mock() for __ in range(2)]
+        actual = skeleton.insert_rows_at(
+            1, ([SkelWidget(widget)] for widget in new_widgets)
+        )
+        assert actual == [1, 2]
+        assert mocked_widgets[0].return_value.grid.call_count == 1
+        assert mocked_widgets[1].return_value.grid.mock_calls == [
+            call(row=1, column=0),
+            call(row=3, column=0),
+        ]
+        assert mocked_widgets[2].return_value.grid.mock_calls == [
+            call(row=2, column=0),
+            call(row=4, column=0),
+        ]
+        new_widgets[1].return_value.grid.assert_called_once_with(row=2, column=0)
+        assert skeleton.widget_cache[3, 1] == (None, None)
+        assert [skeleton.find_row_of(str(i)) for i in range(3)] == [0, 3, 4]
+
+    def test_insert_rows_at_raises_index_error_if_out_of_range(
+        self, three_row_skeleton, mocked_widget
+    ):
+        skeleton, __ = three_row_skeleton
+        with pytest.raises(IndexError):
+            skeleton.insert_rows_at(4, [[SkelWidget(mocked_widget)]])
+
+    @pytest.mark.parametrize(
+        "destroyed, expected_rows",
+        [
+            ([0, 2], [None, 0, None]),
+            ([2, 0, 2, 7], [None, 0, None]),
+            ([1], [0, None, 1]),
+            ([], [0, 1, 2]),
+        ],
+    )
+    def test_destroy_rows_destroys_rows_and_moves_remaining_once(
+        self, three_row_skeleton, destroyed, expected_rows
+    ):
+        skeleton, mocked_widgets = three_row_skeleton
+        skeleton.destroy_rows(destroyed)
+        assert [skeleton.find_row_of(str(i)) for i in range(3)] == expected_rows
+        for index, (widget, expected_row) in enumerate(
+            zip(mocked_widgets, expected_rows)
+        ):
+            if expected_row is None:
+                widget.return_value.destroy.assert_called_once_with()
+                continue
+            assert widget.return_value.grid.call_count == (
+                1 if expected_row == index else 2
+            )
+            widget.return_value.grid.assert_called_with(row=expected_row, column=0)
+        assert skeleton.widget_cache.max_row == (
+            len(expected_rows) - expected_rows.count(None) - 1
+        )
+
+    def test_destroyed_rows_are_reused_from_widget_pool(
+        self,
+        mock_master,
+        mock_controller,
+        mock_mixin_class,
+        mocker: MockerFixture,
+    ):
+        mocker.patch("tklife.core._bulk_command", return_value="ttk::label")
+        mocked_widget = mocker.Mock(side_effect=lambda *a, **k: mocker.Mock())
+
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            widget_pool_size = 1
+
+        skeleton = Tested(mock_master, mock_controller)
+        skeleton.append_rows([SkelWidget(mocked_widget, {"text": i})] for i in range(2))
+        parked = skeleton.widget_cache[1, 0].widget
+        skeleton.destroy_rows([0, 1])
+        parked.grid_remove.assert_called_once_with()
+        parked.destroy.assert_not_called()
+        assert skeleton.widget_pool.evictions == 1
+
+        assert skeleton.append_row([SkelWidget(mocked_widget, {"text": "new"})]) == 0
+        assert mocked_widget.call_count == 2
+        assert skeleton.widget_cache[0, 0].widget is parked
+        parked.configure.assert_any_call(text="new")
+        parked.grid.assert_called_with(row=0, column=0)
+        assert (skeleton.widget_pool.hits, skeleton.widget_pool.misses) == (1, 2)
+
+    @pytest.mark.parametrize(
+        "src, dst, expected_rows",
+        [(0, 2, [2, 0, 1]), (2, 0, [1, 2, 0]), (1, 1, [0, 1, 2])],
+    )
+    def test_move_row_moves_rows_in_between_by_one(
+        self, three_row_skeleton, src, dst, expected_rows
+    ):
+        skeleton, mocked_widgets = three_row_skeleton
+        skeleton.move_row(src, dst)
+        assert [skeleton.find_row_of(str(i)) for i in range(3)] == expected_rows
+        for index, (widget, row) in enumerate(zip(mocked_widgets, expected_rows)):
+            assert widget.return_value.grid.call_count == (1 if row == index else 2)
+            widget.return_value.grid.assert_called_with(row=row, column=0)
+
+    def test_swap_rows_regrids_only_swapped_rows(self, three_row_skeleton):
+        skeleton, mocked_widgets = three_row_skeleton
+        skeleton.swap_rows(0, 2)
+        assert [skeleton.find_row_of(str(i)) for i in range(3)] == [2, 1, 0]
+        assert mocked_widgets[1].return_value.grid.call_count == 1
+        mocked_widgets[0].return_value.grid.assert_called_with(row=2, column=0)
+
+    @pytest.mark.parametrize(
+        "method, args", [("move_row", (0, 3)), ("swap_rows", (-1, 0))]
+    )
+    def test_move_and_swap_raise_index_error_if_out_of_range(
+        self, three_row_skeleton, method, args
+    ):
+        skeleton, __ = three_row_skeleton
+        with pytest.raises(IndexError):
+            getattr(skeleton, method)(*args)
+
+    @pytest.mark.parametrize(
+        "start, reverse, expected_rows",
+        [(0, True, [2, 1, 0]), (1, True, [0, 2, 1]), (0, False, [0, 1, 2])],
+    )
+    def test_sort_rows_regrids_each_moved_cell_once(
+        self, three_row_skeleton, start, reverse, expected_rows
+    ):
+        skeleton, mocked_widgets = three_row_skeleton
+        skeleton.sort_rows(
+            lambda row: [w.return_value for w in mocked_widgets].index(row[0].widget),
+            reverse=reverse,
+            start=start,
+        )
+        assert [skeleton.find_row_of(str(i)) for i in range(3)] == expected_rows
+        for index, (widget, row) in enumerate(zip(mocked_widgets, expected_rows)):
+            assert widget.return_value.grid.call_count == (1 if row == index else 2)
+        assert skeleton.widget_cache[expected_rows[0], 1] == (None, None)
+
+    @pytest.mark.parametrize(
+        "method, args, expected",
+        [
+            ("move_row", (0, 2), [(0, 0), (1, 0), (2, 0)]),
+            ("swap_rows", (0, 2), [(0, 0), (2, 0)]),
+            ("sort_rows", (lambda row: -row[0].widget.index,), [(0, 0), (2, 0)]),
+            ("insert_rows_at", (1, [[None]]), [(2, 0), (3, 0)]),
+        ],
+    )
+    def test_moved_rows_are_gridded_with_grid_widget(
+        self, three_row_skeleton, mocker: MockerFixture, method, args, expected
+    ):
+        skeleton, mocked_widgets = three_row_skeleton
+        for index, widget in enumerate(mocked_widgets):
+            widget.return_value.index = index
+        grid_widget = mocker.spy(skeleton, "_grid_widget")
+        getattr(skeleton, method)(*args)
+        assert sorted(c.args[:2] for c in grid_widget.call_args_list) == expected
+
+
+class TestAppendableMixinReconcile:
+    @pytest.fixture
+    def reconciled(
+        self, mock_master, mock_controller, mock_mixin_class, mocker: MockerFixture
+    ):
+        header = mocker.Mock()
+        row_widget = mocker.Mock(side_effect=lambda *a, **k: mocker.Mock())
+
+        class Tested(SkeletonMixin, AppendableMixin, mock_mixin_class):
+            @property
+            def template(self):
+                return [[SkelWidget(header)]]
+
+        skeleton = Tested(mock_master, mock_controller)
+
+        def reconcile(records, **kwargs):
+            skeleton.reconcile_rows(
+                records,
+                key=lambda record: record[0],
+                row_template=lambda record: [
+                    SkelWidget(row_widget, {"text": record[1]}),
+                    None,
+                ],
+                **kwargs,
+            )
+
+        reconcile([("a", 1), ("b", 2)])
+        return skeleton, reconcile, row_widget
+
+    def _widget_of(self, skeleton, key):
+        return skeleton.widget_cache[skeleton.row_of_key(key), 0].widget
+
+    def test_reconcile_rows_creates_rows_after_last_row(self, reconciled):
+        skeleton, __, row_widget = reconciled
+        assert [skeleton.row_of_key(k) for k in "ab"] == [1, 2]
+        assert row_widget.call_count == 2
+        assert skeleton.widget_cache[2, 1] == (None, None)
+        assert skeleton.row_of_key("z") is None
+
+    def test_reconcile_rows_only_moves_rows_whose_index_changes(self, reconciled):
+        skeleton, reconcile, row_widget = reconciled
+        a, b = (self._widget_of(skeleton, k) for k in "ab")
+        reconcile([("c", 3), ("b", 2), ("a", 1)])
+        assert [skeleton.row_of_key(k) for k in "cba"] == [1, 2, 3]
+        assert row_widget.call_count == 3
+        b.grid.assert_called_once_with(row=2, column=0)
+        a.grid.assert_called_with(row=3, column=0)
+        assert a.grid.call_count == 2
+        a.configure.assert_called_once_with()
+
+    def test_reconcile_rows_destroys_rows_of_removed_keys(self, reconciled):
+        skeleton, reconcile, __ = reconciled
+        a, b = (self._widget_of(skeleton, k) for k in "ab")
+        reconcile([("b", 2)])
+        a.destroy.assert_called_once_with()
+        assert skeleton.row_of_key("a") is None
+        assert skeleton.row_of_key("b") == 1
+        b.grid.assert_called_with(row=1, column=0)
+        assert skeleton.widget_cache.max_row == 1
+
+    def test_reconcile_rows_updates_changed_records_in_place(self, reconciled):
+        skeleton, reconcile, row_widget = reconciled
+        a, b = (self._widget_of(skeleton, k) for k in "ab")
+        reconcile([("a", 5), ("b", 2)])
+        assert row_widget.call_count == 2
+        a.configure.assert_called_with(text=5)
+        assert b.configure.call_count == 1
+
+    def test_reconcile_rows_sets_existing_variables_in_place(
+        self, reconciled, mocker: MockerFixture
+    ):
+        skeleton, __, ___ = reconciled
+        a = self._widget_of(skeleton, "a")
+        a.cget.return_value = "PY_VAR1"
+        variable = mocker.Mock(spec=StringVar)
+        variable.get.return_value = "new"
+        skeleton.reconcile_rows(
+            [("a", 5), ("b", 2)],
+            key=lambda record: record[0],
+            row_template=lambda record: [
+                SkelWidget(mocker.Mock(), {"textvariable": variable})
+            ],
+        )
+        a.cget.assert_called_once_with("textvariable")
+        a.setvar.assert_called_once_with("PY_VAR1", "new")
+        assert a.configure.call_count == 1
+
+    def test_reconcile_rows_calls_update_row(self, reconciled, mocker: MockerFixture):
+        skeleton, reconcile, __ = reconciled
+        update_row = mocker.Mock()
+        reconcile([("a", 5), ("b", 2)], update_row=update_row)
+        update_row.assert_called_once_with(("a", 5), skeleton.widget_cache.row(1))
+
+    def test_reconcile_rows_moves_rows_after_reconciled_rows(
+        self, reconciled, mocked_widget
+    ):
+        skeleton, reconcile, __ = reconciled
+        footer_row = skeleton.append_row([SkelWidget(mocked_widget, label="footer")])
+        assert footer_row == 3
+        reconcile([("a", 1), ("c", 3), ("b", 2)])
+        assert skeleton.find_row_of("footer") == 4
+        mocked_widget.return_value.grid.assert_called_with(row=4, column=0)
+        reconcile([])
+        assert skeleton.find_row_of("footer") == 1
+
+    def test_reconcile_rows_raises_error_if_keys_are_not_unique(self, reconciled):
+        __, reconcile, ___ = reconciled
+        with pytest.raises(ValueError):
+            reconcile([("a", 1), ("a", 2)])
+
+    def test_destroy_rows_forgets_reconciled_keys(self, reconciled):
+        skeleton, reconcile, row_widget = reconciled
+        skeleton.destroy_row(1)
+        assert skeleton.row_of_key("a") is None
+        reconcile([("a", 1), ("b", 2)])
+        assert row_widget.call_count == 3
+        assert [skeleton.row_of_key(k) for k in "ab"] == [1, 2]
+
+
+class TestVirtualRowsMixin:
+    @pytest.fixture
+    def virtual_skeleton(
+        self, mock_master, mock_controller, mock_mixin_class, mocker: MockerFixture
+    ):
+        mocked_widget = mocker.Mock(side_effect=lambda *a, **k: mocker.Mock())
+
+        class Tested(SkeletonMixin, VirtualRowsMixin, mock_mixin_class):
+            row_height = 25
+
+            @property
+            def row_template(self):
+                return [SkelWidget(mocked_widget), None]
+
+        skeleton = Tested(mock_master, mock_controller)
+        skeleton.canvas.winfo_height.return_value = 100
+        return skeleton, mocked_widget
+
+    def _shown_texts(self, skeleton):
+        return [
+            cached.widget.configure.call_args.kwargs["text"]
+            for __, cached in sorted(skeleton.widget_cache.items())
+            if cached.widget is not None
+        ]
+
+    def test_init_binds_refresh_to_canvas_configure(self, virtual_skeleton):
+        skeleton, __ = virtual_skeleton
+        skeleton.canvas.tk.call.assert_called_once()
+        assert skeleton.canvas.tk.call.call_args.args[:3] == (
+            "bind",
+            str(skeleton.canvas),
+            "<Configure>",
+        )
+
+    def test_append_rows_creates_widgets_only_for_rows_in_view(self, virtual_skeleton):
+        skeleton, mocked_widget = virtual_skeleton
+        actual = skeleton.append_rows((f"row{i}",) for i in range(1000))
+        assert actual == list(range(1000))
+        # 4 rows fit in view, plus one overscan row
+        assert mocked_widget.call_count == 5
+        assert skeleton.widget_cache.max_row == 4
+        assert self._shown_texts(skeleton) == [f"row{i}" for i in range(5)]
+        skeleton.rowconfigure.assert_called_with(4, minsize=25)
+
+    def test_append_row_creates_no_more_widgets_than_records(self, virtual_skeleton):
+        skeleton, mocked_widget = virtual_skeleton
+        assert skeleton.append_row(("only",)) == 0
+        assert mocked_widget.call_count == 1
+        skeleton.v_scroll.set.assert_called_with(0, 1)
+
+    def test_scroll_to_reuses_widgets(self, virtual_skeleton):
+        skeleton, mocked_widget = virtual_skeleton
+        skeleton.append_rows((f"row{i}",) for i in range(1000))
+        skeleton.scroll_to(10)
+        assert mocked_widget.call_count == 5
+        assert self._shown_texts(skeleton) == [f"row{i}" for i in range(10, 15)]
+        skeleton.v_scroll.set.assert_called_with(0.01, 0.014)
+
+    def test_scroll_to_is_clamped_and_hides_slots_past_the_end(self, virtual_skeleton):
+        skeleton, __ = virtual_skeleton
+        skeleton.append_rows((f"row{i}",) for i in range(1000))
+        skeleton.scroll_to(5000)
+        assert skeleton.first_row == 996
+        skeleton.widget_cache[4, 0].widget.grid_remove.assert_called_once_with()
+        skeleton.scroll_to(-3)
+        assert skeleton.first_row == 0
+        skeleton.widget_cache[4, 0].widget.grid.assert_called_with()
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            (("moveto", "0.5"), 500),
+            (("scroll", "1", "units"), 1),
+            (("scroll", "2", "pages"), 8),
+        ],
+    )
+    def test_v_scroll_command_scrolls_model(self, virtual_skeleton, args, expected):
+        skeleton, __ = virtual_skeleton
+        skeleton.append_rows((f"row{i}",) for i in range(1000))
+        skeleton._v_scroll_command(*args)
+        assert skeleton.first_row == expected
+
+    def test_move_swap_and_sort_rows_reorder_model(self, virtual_skeleton):
+        skeleton, __ = virtual_skeleton
+        skeleton.append_rows([("a",), ("b",), ("c",)])
+        skeleton.move_row(0, 2)
+        assert skeleton.model == [("b",), ("c",), ("a",)]
+        skeleton.swap_rows(0, 1)
+        assert skeleton.model == [("c",), ("b",), ("a",)]
+        skeleton.sort_rows(lambda record: record[0])
+        assert self._shown_texts(skeleton) == ["a", "b", "c"]
+        with pytest.raises(IndexError):
+            skeleton.move_row(0, 3)
+
+    def test_insert_and_destroy_rows_update_model(self, virtual_skeleton):
+        skeleton, mocked_widget = virtual_skeleton
+        skeleton.append_rows((f"row{i}",) for i in range(3))
+        assert skeleton.insert_rows_at(1, [("a",), ("b",)]) == [1, 2]
+        assert skeleton.find_row_of(("b",)) == 2
+        skeleton.destroy_rows([0, 2, 99])
+        assert skeleton.model == [("a",), ("row1",), ("row2",)]
+        assert skeleton.find_row_of(("b",)) is None
+        skeleton.destroy_row(0)
+        assert self._shown_texts(skeleton) == ["row1", "row2"]
+        assert skeleton.widget_cache.max_row == 1
+        with pytest.raises(IndexError):
+            skeleton.insert_row_at(5, ("c",))
+
+    def test_reconcile_rows_and_row_of_key_use_model(self, virtual_skeleton):
+        skeleton, mocked_widget = virtual_skeleton
+        assert skeleton.row_of_key("a") is None
+        records = [(f"row{i}", i) for i in range(1000)]
+        skeleton.reconcile_rows(records, key=lambda record: record[1])
+        assert skeleton.model == records
+        assert mocked_widget.call_count == 5
+        assert skeleton.row_of_key(500) == 500
+        skeleton.reconcile_rows(records[::-1], key=lambda record: record[1])
+        assert skeleton.row_of_key(500) == 499
+        assert skeleton.row_of_key(1000) is None
+        assert mocked_widget.call_count == 5
+        assert self._shown_texts(skeleton) == [f"row{i}" for i in range(999, 994, -1)]
+        with pytest.raises(ValueError):
+            skeleton.reconcile_rows([("a", 1), ("b", 1)], key=lambda record: record[1])
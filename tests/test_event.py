@@ -1,9 +1,24 @@
+import copy
+import pickle
 import tkinter as tk
 from types import SimpleNamespace
 
 import pytest
 
-from tklife.event import CompositeEvent, EventsEnum, TkEvent, TkEventMod
+import tklife.event
+from tklife.event import (
+    BaseEvent,
+    BindingScope,
+    BusEvent,
+    CompositeEvent,
+    EventBus,
+    EventDispatcher,
+    EventsEnum,
+    LeanEvent,
+    RateLimitedAction,
+    TkEvent,
+    TkEventMod,
+)
 
 
 class TestEventEnum:
@@ -139,6 +154,755 @@ class TestCompositeEvent:
         )
 
 
+def _destroy_event(path):
+    event = LeanEvent()
+    event.widget = path
+    return event
+
+
+def _line(funcid):
+    return f'if {{"[{funcid} %# %b]" == "break"}} break'
+
+
+def _append(scripts, funcid, sequence="<<Test>>"):
+    # Same as Tk does for bind with add="+"
+    previous = scripts.get((".widget", sequence))
+    line = _line(funcid) + "\n"
+    scripts[".widget", sequence] = f"{previous}\n{line}" if previous else line
+
+
+@pytest.fixture
+def scripts():
+    """The bind scripts of a fake Tcl interpreter, by (tag, sequence)."""
+    return {}
+
+
+@pytest.fixture
+def callbacks():
+    """The callbacks bound with the bind method of tcl_widget, by funcid."""
+    return {}
+
+
+@pytest.fixture
+def tcl_widget(mocker, scripts, callbacks):
+    """A widget storing its bind scripts in scripts."""
+
+    def call(command, tag, sequence, script=None):
+        if command == "apply":
+            # add_bindtag and remove_bindtag: stored as the tags added per path
+            scripts.setdefault(("bindtags", script), []).append(sequence)
+            return ""
+        if script is None:
+            return scripts.get((tag, sequence), "")
+        scripts[tag, sequence] = script
+        return ""
+
+    def bind(sequence, func, add=""):
+        funcid = f"{len(callbacks)}callback"
+        callbacks[funcid] = func
+        if not add:
+            scripts.pop((".widget", sequence), None)
+        _append(scripts, funcid, sequence)
+        return funcid
+
+    mock = mocker.Mock(tk.Misc)
+    mock.tk = mocker.Mock()
+    mock.tk.call.side_effect = call
+    mock.bind.side_effect = bind
+    mock.nametowidget.return_value = mock
+    mock.__str__ = lambda __: ".widget"
+    return mock
+
+
+class TestBindingRegistry:
+    line = staticmethod(_line)
+    append = staticmethod(_append)
+
+    @pytest.fixture
+    def mock_widget(self, tcl_widget):
+        return tcl_widget
+
+    @pytest.fixture
+    def parse_spy(self, mocker):
+        return mocker.spy(tklife.event, "_parse_bindings")
+
+    def test_get_bindings_only_parses_unknown_scripts(
+        self, mock_widget, scripts, parse_spy
+    ):
+        event = CompositeEvent("<<Test>>")
+        self.append(scripts, "1a")
+        assert event.get_bindings(mock_widget) == {"1a": self.line("1a")}
+        assert event.get_bindings(mock_widget) == {"1a": self.line("1a")}
+        assert parse_spy.call_count == 1
+
+        self.append(scripts, "2b")
+        assert list(event.get_bindings(mock_widget)) == ["1a", "2b"]
+        assert parse_spy.call_count == 2
+        assert parse_spy.call_args.args[0] == f"\n{self.line('2b')}\n"
+
+    def test_unbind_removes_only_funcid_without_parsing_again(
+        self, mock_widget, scripts, parse_spy
+    ):
+        event = CompositeEvent("<<Test>>")
+        for funcid in ("1a", "2b", "3c"):
+            self.append(scripts, funcid)
+        event.unbind(mock_widget, "2b")
+        assert scripts[".widget", "<<Test>>"] == "\n".join(
+            [self.line("1a"), self.line("3c")]
+        )
+        mock_widget.deletecommand.assert_called_once_with("2b")
+        event.unbind(mock_widget, "1a")
+        assert event.get_bindings(mock_widget) == {"3c": self.line("3c")}
+        assert parse_spy.call_count == 1
+
+    def test_get_bindings_reparses_scripts_replaced_outside_tklife(
+        self, mock_widget, scripts
+    ):
+        event = CompositeEvent("<<Test>>")
+        self.append(scripts, "1a")
+        event.get_bindings(mock_widget)
+        scripts[".widget", "<<Test>>"] = self.line("9z")
+        assert event.get_bindings(mock_widget) == {"9z": self.line("9z")}
+        event.unbind(mock_widget)
+        assert scripts[".widget", "<<Test>>"] == ""
+        assert event.get_bindings(mock_widget) == {}
+
+    def test_destroyed_path_is_evicted(self, mock_widget, scripts, parse_spy):
+        event = CompositeEvent("<<Test>>")
+        entries = tklife.event._registry._BindingRegistry__entries
+        key = (id(mock_widget.tk), ".widget", "<<Test>>")
+        self.append(scripts, "1a")
+        event.get_bindings(mock_widget)
+        assert key in entries
+        destroyed = next(
+            call.args[0]
+            for call in mock_widget._register.call_args_list
+            if call.args[0].func is tklife.event._path_destroyed
+        )
+        # Tk deletes the bindings and bindtags of the destroyed widget
+        scripts.clear()
+        destroyed(_destroy_event(".widget"))
+        assert key not in entries
+        # A new widget with the same path
+        self.append(scripts, "2b")
+        assert event.get_bindings(mock_widget) == {"2b": self.line("2b")}
+        assert parse_spy.call_args.args[0] == scripts[".widget", "<<Test>>"]
+        assert scripts["bindtags", ".widget"] == ["tklife_destroy"]
+
+
+class TestEventDispatcher:
+    @pytest.fixture
+    def event(self):
+        return CompositeEvent("<<Dispatched>>")
+
+    @pytest.fixture
+    def dispatch(self, event, tcl_widget, callbacks):
+        """Calls the Tcl binding of the dispatcher, as Tk would."""
+
+        def dispatch(tk_event=None):
+            (funcid,) = event.get_bindings(tcl_widget)
+            return callbacks[funcid](tk_event)
+
+        return dispatch
+
+    def test_bind_creates_one_tcl_binding_per_sequence(
+        self, event, tcl_widget, scripts, callbacks
+    ):
+        ids = [
+            event.bind(tcl_widget, lambda __: None, dispatch=True) for __ in range(3)
+        ]
+        assert len(set(ids)) == 3
+        assert tcl_widget.bind.call_count == 1
+        (funcid,) = event.get_bindings(tcl_widget)
+        assert isinstance(callbacks[funcid], EventDispatcher)
+        assert len(callbacks[funcid]) == 3
+
+    def test_handlers_run_by_priority_then_order_added(
+        self, event, tcl_widget, dispatch
+    ):
+        calls = []
+        for name, priority in (("a", 0), ("b", 5), ("c", 0), ("d", -1)):
+            event.bind(
+                tcl_widget,
+                lambda tk_event, name=name: calls.append((name, tk_event)),
+                dispatch=True,
+                priority=priority,
+            )
+        assert dispatch("event") is None
+        assert calls == [("b", "event"), ("a", "event"), ("c", "event"), ("d", "event")]
+
+    def test_break_stops_later_handlers(self, event, tcl_widget, dispatch, mocker):
+        later = mocker.Mock()
+        event.bind(tcl_widget, lambda __: "break", dispatch=True, priority=1)
+        event.bind(tcl_widget, later, dispatch=True)
+        assert dispatch() == "break"
+        later.assert_not_called()
+
+    def test_unbind_removes_handler_without_changing_tcl_binding(
+        self, event, tcl_widget, scripts, dispatch, mocker
+    ):
+        removed, kept = mocker.Mock(), mocker.Mock()
+        handler_id = event.bind(tcl_widget, removed, dispatch=True)
+        event.bind(tcl_widget, kept, dispatch=True)
+        script = dict(scripts)
+        tcl_widget.tk.call.reset_mock()
+        event.unbind(tcl_widget, handler_id)
+        event.unbind(tcl_widget, handler_id)
+        assert scripts == script
+        assert all(c.args[-1] is None for c in tcl_widget.tk.call.call_args_list)
+        dispatch()
+        removed.assert_not_called()
+        kept.assert_called_once_with(None)
+        tcl_widget.deletecommand.assert_not_called()
+
+    def test_handler_removed_by_earlier_handler_is_skipped(
+        self, event, tcl_widget, dispatch, mocker
+    ):
+        later = mocker.Mock()
+        later_id = None
+        event.bind(
+            tcl_widget,
+            lambda __: event.unbind(tcl_widget, later_id),
+            dispatch=True,
+        )
+        later_id = event.bind(tcl_widget, later, dispatch=True)
+        dispatch()
+        later.assert_not_called()
+
+    def test_close_removes_tcl_binding(self, event, tcl_widget, callbacks):
+        event.bind(tcl_widget, lambda __: None, dispatch=True)
+        (funcid,) = event.get_bindings(tcl_widget)
+        callbacks[funcid].close()
+        assert event.get_bindings(tcl_widget) == {}
+        tcl_widget.deletecommand.assert_called_once_with(funcid)
+        event.bind(tcl_widget, lambda __: None, dispatch=True)
+        assert tcl_widget.bind.call_count == 2
+
+    def test_bind_rebinds_if_tcl_binding_was_removed(
+        self, event, tcl_widget, scripts, dispatch, mocker
+    ):
+        dropped = mocker.Mock()
+        event.bind(tcl_widget, dropped, dispatch=True)
+        scripts.clear()
+        event.bind(tcl_widget, lambda __: None, dispatch=True)
+        assert tcl_widget.bind.call_count == 2
+        dispatch()
+        dropped.assert_not_called()
+
+    def test_destroying_widget_drops_dispatcher(
+        self, event, tcl_widget, scripts, callbacks, mocker
+    ):
+        handler = mocker.Mock()
+        event.bind(tcl_widget, handler, dispatch=True)
+        key = (id(tcl_widget.tk), ".widget", event.value)
+        dispatcher = tklife.event._dispatchers[key]
+        assert scripts["bindtags", ".widget"] == ["tklife_destroy"]
+        destroyed = next(
+            call.args[0]
+            for call in tcl_widget._register.call_args_list
+            if call.args[0].func is tklife.event._path_destroyed
+        )
+        destroyed(_destroy_event(".widget"))
+        assert key not in tklife.event._dispatchers
+        assert len(dispatcher) == 0
+        tcl_widget.deletecommand.assert_called_once_with("0callback")
+
+
+class TestLeanEvent:
+    @pytest.fixture
+    def registered(self):
+        return {}
+
+    @pytest.fixture
+    def mock_widget(self, mocker, registered):
+        def register(func, subst=None, needcleanup=1):
+            registered.update(func=func, subst=subst, needcleanup=needcleanup)
+            return "123lean"
+
+        mock = mocker.Mock(tk.Misc)
+        mock.tk = mocker.Mock()
+        mock.tk.getint.side_effect = int
+        mock._register.side_effect = register
+        mock.__str__ = lambda __: ".widget"
+        return mock
+
+    def test_bind_substitutes_only_given_fields(self, mock_widget, registered):
+        action = lambda __: None
+        funcid = TkEvent.MOTION.bind(
+            mock_widget, action, add="+", fields=("x", "y", "widget")
+        )
+        assert funcid == "123lean"
+        assert registered["func"] is action
+        assert registered["needcleanup"]
+        mock_widget.tk.call.assert_called_once_with(
+            "bind",
+            ".widget",
+            "<Motion>",
+            '+if {"[123lean %x %y %W]" == "break"} break\n',
+        )
+
+    def test_bind_class_does_not_cleanup_command(self, mock_widget, registered):
+        TkEvent.MOTION.bind(mock_widget, print, classname="all", fields=())
+        assert not registered["needcleanup"]
+        mock_widget.tk.call.assert_called_once_with(
+            "bind", "all", "<Motion>", 'if {"[123lean ]" == "break"} break\n'
+        )
+
+    def test_substitution_converts_fields_like_tkinter(self, mock_widget, registered):
+        mock_widget.nametowidget.side_effect = KeyError
+        TkEvent.MOUSEWHEEL.bind(
+            mock_widget, print, fields=("delta", "x", "widget", "type", "keysym")
+        )
+        (event,) = registered["subst"]("-120", "??", ".gone", "38", "a")
+        assert isinstance(event, LeanEvent)
+        assert (event.delta, event.x, event.widget) == (-120, "??", ".gone")
+        assert (event.type, event.keysym) == (tk.EventType.MouseWheel, "a")
+        with pytest.raises(AttributeError):
+            event.y
+        assert "delta=-120" in repr(event)
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ("5", "1", "1", "20", "38", "16", "1000", "30", "10", "12", "a", "0")
+            + ("a", "97", ".", "6", "100", "120", "-120"),
+            ("5", "??", "??", "??", "??", "??", "??", "??", "??", "??", "??", "??")
+            + ("??", "??", "??", "??", "??", "??", "??"),
+        ],
+    )
+    def test_substitution_matches_tkinter(self, mock_widget, registered, values):
+        codes = {code: name for name, (code, __) in tklife.event._EVENT_FIELDS.items()}
+        fields = [codes[code] for code in tk.Misc._subst_format]
+        TkEvent.MOTION.bind(mock_widget, print, fields=fields)
+        # Converted by a Tcl interpreter, which has no bind command without Tk
+        interp = tk.Tcl()
+        mock_widget.tk = interp.tk
+        mock_widget.nametowidget.side_effect = interp.nametowidget
+        (expected,) = tk.Misc._substitute(interp, *values)
+        (event,) = registered["subst"](*values)
+        assert {
+            name: getattr(event, name) for name in fields if hasattr(event, name)
+        } == vars(expected)
+
+    def test_bind_raises_error_for_unknown_or_dispatched_fields(self, mock_widget):
+        with pytest.raises(ValueError):
+            TkEvent.MOTION.bind(mock_widget, print, fields=("nope",))
+        with pytest.raises(ValueError):
+            TkEvent.MOTION.bind(mock_widget, print, fields=("x",), dispatch=True)
+        mock_widget.tk.call.assert_not_called()
+
+
+class TestRateLimitedAction:
+    @pytest.fixture
+    def scheduled(self):
+        """Callbacks scheduled with after or after_idle, as (delay, callback)."""
+        return []
+
+    @pytest.fixture
+    def clock(self, mocker):
+        clock = mocker.patch("tklife.event.time.monotonic")
+        clock.return_value = 0.0
+        return clock
+
+    @pytest.fixture
+    def mock_widget(self, mocker, scheduled):
+        def after(delay, callback):
+            scheduled.append((delay, callback))
+            return f"after#{len(scheduled)}"
+
+        mock = mocker.Mock(tk.Misc)
+        mock.after.side_effect = after
+        mock.after_idle.side_effect = lambda callback: after(None, callback)
+        return mock
+
+    @staticmethod
+    def fire(scheduled):
+        __, callback = scheduled.pop(0)
+        callback()
+
+    def test_bind_throttled_binds_rate_limited_action(self, mock_widget, mocker):
+        action = mocker.Mock()
+        mock_widget.bind.return_value = "1callback"
+        limited = TkEvent.MOTION.bind_throttled(mock_widget, action, 50, add="+")
+        assert isinstance(limited, RateLimitedAction)
+        assert limited.funcid == "1callback"
+        mock_widget.bind.assert_called_once_with("<Motion>", limited, add="+")
+
+    def test_throttled_delivers_first_and_latest_event_per_interval(
+        self, mock_widget, scheduled, mocker
+    ):
+        action = mocker.Mock()
+        limited = RateLimitedAction(mock_widget, action, 50)
+        for event in range(5):
+            limited(event)
+        action.assert_called_once_with(0)
+        assert [delay for delay, __ in scheduled] == [50]
+        self.fire(scheduled)
+        action.assert_called_with(4)
+        assert (limited.delivered, limited.dropped) == (2, 3)
+        # The window is renewed after a delivery, then ends without events
+        self.fire(scheduled)
+        assert scheduled == []
+        limited(5)
+        action.assert_called_with(5)
+
+    def test_debounced_delivers_latest_event_after_quiet_period(
+        self, mock_widget, scheduled, clock, mocker
+    ):
+        action = mocker.Mock()
+        limited = RateLimitedAction(mock_widget, action, 100, debounce=True)
+        limited("a")
+        clock.return_value = 0.06
+        limited("b")
+        assert len(scheduled) == 1
+        clock.return_value = 0.1
+        self.fire(scheduled)
+        action.assert_not_called()
+        assert scheduled[0][0] == 60
+        clock.return_value = 0.16
+        self.fire(scheduled)
+        action.assert_called_once_with("b")
+        assert (limited.delivered, limited.dropped) == (1, 1)
+
+    @pytest.mark.parametrize("debounce", [False, True])
+    def test_zero_interval_delivers_once_per_idle_tick(
+        self, mock_widget, scheduled, debounce, mocker
+    ):
+        action = mocker.Mock()
+        limited = RateLimitedAction(mock_widget, action, 0, debounce=debounce)
+        for event in range(3):
+            limited(event)
+        mock_widget.after_idle.assert_called_once()
+        self.fire(scheduled)
+        action.assert_called_once_with(2)
+        assert scheduled == []
+
+    def test_flush_and_unbind(self, mock_widget, scheduled, mocker):
+        action = mocker.Mock()
+        mock_widget.bind.return_value = "1callback"
+        mock_widget.tk = mocker.Mock()
+        mock_widget.tk.call.return_value = ""
+        limited = CompositeEvent("<<Test>>").bind_debounced(mock_widget, action, 10)
+        limited("a")
+        limited.flush()
+        action.assert_called_once_with("a")
+        mock_widget.after_cancel.assert_called_once_with("after#1")
+        limited("b")
+        limited.unbind()
+        assert mock_widget.after_cancel.call_count == 2
+        mock_widget.deletecommand.assert_called_once_with("1callback")
+        limited.flush()
+        assert action.call_count == 1
+
+
+class TestEventBus:
+    @pytest.fixture
+    def custom_event(self):
+        class Custom(EventsEnum):
+            SAVED = "<<Saved>>"
+
+        return Custom.SAVED
+
+    @pytest.fixture
+    def mock_widget(self, mocker):
+        mock = mocker.Mock(tk.Misc)
+        mock.tk = mocker.Mock()
+        mock.tk.call.return_value = ""
+        mock.bindtags.return_value = (".widget", "Frame", ".", "all")
+        mock.nametowidget.return_value.tk = mock.tk
+        mock.nametowidget.return_value.after_idle.return_value = "after#1"
+        mock.__str__ = lambda __: ".widget"
+        return mock
+
+    @pytest.fixture
+    def bus(self, mock_widget):
+        return EventBus.of(mock_widget)
+
+    def test_of_returns_one_bus_per_interpreter(self, bus, mock_widget, mocker):
+        assert EventBus.of(mock_widget) is bus
+        other = mocker.Mock(tk.Misc)
+        other.tk = mocker.Mock()
+        other.nametowidget.return_value.tk = other.tk
+        assert EventBus.of(other) is not bus
+
+    def test_publish_delivers_python_data_to_widget_then_any_widget_handlers(
+        self, bus, custom_event, mock_widget
+    ):
+        calls = []
+        payload = {"id": 1}
+        custom_event.subscribe(mock_widget, lambda e: calls.append(("any", e)), True)
+        custom_event.subscribe(mock_widget, lambda e: calls.append(("widget", e)))
+        custom_event.publish(mock_widget, data=payload)
+        assert [name for name, __ in calls] == ["widget", "any"]
+        bus_event = calls[0][1]
+        assert isinstance(bus_event, BusEvent)
+        assert bus_event.data is payload
+        assert (bus_event.event, bus_event.widget) == (custom_event, mock_widget)
+        mock_widget.event_generate.assert_not_called()
+
+    def test_publish_without_widget_only_reaches_any_widget_handlers(
+        self, bus, custom_event, mock_widget, mocker
+    ):
+        widget_handler, any_handler = mocker.Mock(), mocker.Mock()
+        bus.subscribe(custom_event, widget_handler, mock_widget)
+        bus.subscribe(custom_event, any_handler)
+        bus.publish(custom_event, "data")
+        widget_handler.assert_not_called()
+        assert any_handler.call_args.args[0].widget is None
+
+    def test_publish_without_widget_skips_widget_with_path_none(
+        self, bus, custom_event, mocker
+    ):
+        widget = mocker.Mock(tk.Misc, __str__=lambda __: "None")
+        widget_handler = mocker.Mock()
+        bus.subscribe(custom_event, widget_handler, widget)
+        bus.publish(custom_event)
+        widget_handler.assert_not_called()
+
+    def test_break_stops_later_handlers(self, bus, custom_event, mocker):
+        later = mocker.Mock()
+        bus.subscribe(custom_event, lambda __: "break")
+        bus.subscribe(custom_event, later)
+        bus.publish(custom_event)
+        later.assert_not_called()
+
+    def test_idle_publish_delivers_queued_events_once_per_idle_tick(
+        self, bus, custom_event, mock_widget, mocker
+    ):
+        handler = mocker.Mock()
+        bus.subscribe(custom_event, handler)
+        for data in range(3):
+            bus.publish(custom_event, data, idle=True)
+        handler.assert_not_called()
+        root = mock_widget.nametowidget.return_value
+        root.after_idle.assert_called_once_with(bus.flush)
+        root.after_idle.call_args.args[0]()
+        assert [c.args[0].data for c in handler.call_args_list] == [0, 1, 2]
+        root.after_cancel.assert_called_once_with("after#1")
+        bus.flush()
+        assert handler.call_count == 3
+
+    def test_unsubscribe_removes_topic(self, bus, custom_event, mock_widget, mocker):
+        handler = mocker.Mock()
+        subscription = custom_event.subscribe(mock_widget, handler)
+        assert bus.has_subscribers(custom_event)
+        custom_event.unsubscribe(mock_widget, subscription)
+        custom_event.unsubscribe(mock_widget, subscription)
+        assert not bus.has_subscribers(custom_event)
+        custom_event.publish(mock_widget)
+        handler.assert_not_called()
+
+    def test_publish_falls_back_to_tcl_if_tcl_binding_exists(
+        self, bus, custom_event, mock_widget
+    ):
+        mock_widget.tk.call.side_effect = lambda command, tag, sequence: (
+            "script" if tag == "all" else ""
+        )
+        custom_event.publish(mock_widget, data="text")
+        mock_widget.event_generate.assert_called_once_with("<<Saved>>", data="text")
+        bus.tcl_fallback = False
+        custom_event.publish(mock_widget, data="text")
+        assert mock_widget.event_generate.call_count == 1
+
+
+class TestHandlerProfiling:
+    @pytest.fixture
+    def profiler(self):
+        profiler = tklife.profiling.enable_handler_profiling()
+        yield profiler
+        tklife.profiling.disable_handler_profiling()
+
+    def test_bind_wraps_action_while_profiling(self, mocker, profiler):
+        widget = mocker.Mock(tk.Frame)
+        action = mocker.Mock(return_value="break", __qualname__="action")
+        TkEvent.MOTION.bind(widget, action)
+        timed = widget.bind.call_args.args[1]
+        assert timed is not action
+        assert timed("event") == "break"
+        action.assert_called_once_with("event")
+        assert list(profiler.stats) == [
+            ("<Motion>", "Mock", f"{action.__module__}.action")
+        ]
+
+    def test_bind_uses_classname_as_widget_class(self, mocker, profiler):
+        widget = mocker.Mock(tk.Frame)
+        TkEvent.MOTION.bind(widget, mocker.Mock(__qualname__="a"), classname="all")
+        widget.bind_class.call_args.args[2]("event")
+        assert [key[1] for key in profiler.stats] == ["all"]
+
+    def test_bind_throttled_times_delivered_action(self, mocker, profiler):
+        widget = mocker.Mock(tk.Frame)
+        action = mocker.Mock(__qualname__="action")
+        limited = TkEvent.MOTION.bind_throttled(widget, action, 50)
+        widget.bind.assert_called_once_with("<Motion>", limited, add="")
+        limited("event")
+        action.assert_called_once_with("event")
+        assert [key[2] for key in profiler.stats] == [f"{action.__module__}.action"]
+
+    def test_bind_does_not_wrap_without_profiling(self, mocker):
+        widget = mocker.Mock(tk.Frame)
+        action = mocker.Mock()
+        TkEvent.MOTION.bind(widget, action)
+        widget.bind.assert_called_once_with("<Motion>", action, add="")
+
+
+class TestBindingScope:
+    @pytest.fixture
+    def mock_unbind(self, mocker):
+        return mocker.patch.object(BaseEvent, "unbind", autospec=True)
+
+    @pytest.fixture
+    def scope(self, mock_master):
+        return BindingScope(mock_master)
+
+    @staticmethod
+    def destroy_event(widget):
+        event = LeanEvent()
+        event.widget = widget
+        return event
+
+    def test_watches_owner_through_bindtag(self, scope, mock_master):
+        mock_master.tk.call.assert_called_once_with(
+            "apply", tklife.event._ADD_BINDTAG, "tklife_destroy", str(mock_master)
+        )
+
+    def test_release_unbinds_tracked_bindings(self, scope, mock_master, mock_unbind):
+        outstanding = BindingScope.outstanding
+        scope.track(TkEvent.MOTION, mock_master, "1callback", classname="all")
+        assert len(scope) == 1
+        assert BindingScope.outstanding == outstanding + 1
+        assert scope.release() == 1
+        mock_unbind.assert_called_once_with(
+            TkEvent.MOTION, mock_master, "1callback", classname="all"
+        )
+        assert len(scope) == 0
+        assert BindingScope.outstanding == outstanding
+
+    def test_release_releases_rate_limited_actions_and_subscriptions(
+        self, scope, mock_master, mocker
+    ):
+        limited = mocker.Mock(RateLimitedAction)
+        unsubscribe = mocker.patch.object(BaseEvent, "unsubscribe", autospec=True)
+        scope.track(TkEvent.CONFIGURE, mock_master, limited)
+        scope.track(TkEvent.CONFIGURE, mock_master, 3)
+        scope.release()
+        limited.unbind.assert_called_once_with()
+        unsubscribe.assert_called_once_with(TkEvent.CONFIGURE, mock_master, 3)
+
+    def test_release_ignores_destroyed_widgets(self, scope, mock_master, mock_unbind):
+        mock_unbind.side_effect = tk.TclError('bad window path name ".widget"')
+        scope.track(TkEvent.MOTION, mock_master, "1callback")
+        assert scope.release() == 1
+
+    def test_owner_destroy_releases_bindings(self, scope, mock_master, mock_unbind):
+        on_destroy = mock_master.nametowidget(".")._register.call_args.args[0]
+        scope.track(TkEvent.MOTION, mock_master, "1callback")
+        on_destroy(self.destroy_event(".owner.child"))
+        mock_unbind.assert_not_called()
+        on_destroy(self.destroy_event(str(mock_master)))
+        mock_unbind.assert_called_once()
+
+    def test_destroy_bind_without_add_keeps_release(
+        self, tcl_widget, scripts, mocker, mock_unbind
+    ):
+        scope = BindingScope(tcl_widget)
+        scope.track(TkEvent.MOTION, tcl_widget, "1callback")
+        funcid = TkEvent.DESTROY.bind(tcl_widget, mocker.Mock(), add="")
+        assert list(TkEvent.DESTROY.get_bindings(tcl_widget)) == [funcid]
+        assert scripts["bindtags", ".widget"] == ["tklife_destroy"]
+        assert ("tklife_destroy", "<Destroy>") in scripts
+        destroyed = tcl_widget._register.call_args.args[0]
+        destroyed(self.destroy_event(".widget"))
+        mock_unbind.assert_called_once_with(
+            TkEvent.MOTION, tcl_widget, "1callback", classname=None
+        )
+        assert len(scope) == 0
+
+    def test_bind_tracks_binding(self, scope, mocker, mock_unbind):
+        widget = mocker.Mock(tk.Misc)
+        widget.bind_class.return_value = "1callback"
+        action = mocker.Mock()
+        assert scope.bind(TkEvent.MOTION, widget, action, classname="tag") == (
+            "1callback"
+        )
+        widget.bind_class.assert_called_once_with("tag", "<Motion>", action, add="")
+        scope.release()
+        mock_unbind.assert_called_once_with(
+            TkEvent.MOTION, widget, "1callback", classname="tag"
+        )
+
+
+class TestBindtags:
+    def test_add_bindtag_uses_single_tcl_call(self, mocker):
+        widgets = [mocker.Mock(__str__=lambda __, p=p: p) for p in (".a", ".b")]
+        tklife.event.add_bindtag("rows", widgets)
+        widgets[0].tk.call.assert_called_once_with(
+            "apply", tklife.event._ADD_BINDTAG, "rows", ".a", ".b"
+        )
+        widgets[1].tk.call.assert_not_called()
+
+    def test_remove_bindtag_uses_single_tcl_call(self, mocker):
+        widgets = [mocker.Mock(__str__=lambda __, p=p: p) for p in (".a", ".b")]
+        tklife.event.remove_bindtag("rows", iter(widgets))
+        widgets[0].tk.call.assert_called_once_with(
+            "apply", tklife.event._REMOVE_BINDTAG, "rows", ".a", ".b"
+        )
+
+    def test_bindtag_scripts_insert_and_remove_tag_once(self):
+        interp = tk.Tcl()
+        # A stand-in for the bindtags command of Tk
+        interp.eval(
+            "proc bindtags {w {tags {}}} {global T\n"
+            "if {$tags eq {}} {return $T($w)}\nset T($w) $tags}\n"
+            "set T(.a) {.a Button . all}\nset T(.b) {.b rows Label . all}"
+        )
+        interp.call("apply", tklife.event._ADD_BINDTAG, "rows", ".a", ".b")
+        assert interp.eval("set T(.a)") == ".a rows Button . all"
+        assert interp.eval("set T(.b)") == ".b rows Label . all"
+        interp.call("apply", tklife.event._REMOVE_BINDTAG, "rows", ".a", ".b")
+        assert interp.eval("set T(.a)") == ".a Button . all"
+        assert interp.eval("set T(.b)") == ".b Label . all"
+
+    def test_add_bindtag_does_nothing_without_widgets(self):
+        tklife.event.add_bindtag("rows", [])
+
+
+class TestInternedEvents:
+    def test_composite_events_are_interned_by_value(self):
+        event = TkEventMod.CONTROL + TkEvent.KEYPRESS + "<z>"
+        assert event is TkEventMod.CONTROL + TkEvent.KEYPRESS + "<z>"
+        assert event is CompositeEvent("<Control-KeyPress-z>")
+        assert event is copy.deepcopy(event)
+        assert event is pickle.loads(pickle.dumps(event))
+        assert {event: 1}[CompositeEvent("<Control-KeyPress-z>")] == 1
+
+    def test_composite_event_subclasses_are_interned_separately(self):
+        class Other(CompositeEvent):
+            pass
+
+        assert Other("<<Interned>>") is not CompositeEvent("<<Interned>>")
+        assert Other("<<Interned>>") != CompositeEvent("<<Interned>>")
+        assert Other("<<Interned>>") is Other("<<Interned>>")
+
+    @pytest.mark.parametrize(
+        "sequence, expected",
+        [
+            ("<Configure>", TkEvent.CONFIGURE),
+            ("<Control>", TkEventMod.CONTROL),
+            ("<<ComboboxSelected>>", tklife.event.TtkComboboxEvents.COMBOBOX_SELECTED),
+            ("<Control-KeyPress-z>", TkEventMod.CONTROL + TkEvent.KEYPRESS + "<z>"),
+        ],
+    )
+    def test_parse_returns_interned_event(self, sequence, expected):
+        assert BaseEvent.parse(sequence) is expected
+        assert TkEvent.parse(sequence) is BaseEvent.parse(sequence)
+
+    @pytest.mark.parametrize("sequence", ["Configure", "<Configure", ""])
+    def test_parse_raises_error_for_invalid_sequences(self, sequence):
+        with pytest.raises(ValueError):
+            BaseEvent.parse(sequence)
+
+
 @pytest.mark.parametrize(
     "term1, term2, expected",
     [
@@ -209,3 +973,13 @@ class TestEvents:
         event.unbind(widget, func_id)
 
         assert func_id not in event.get_bindings(widget)
+
+    def test_unbind_keeps_bindings_added_outside_tklife(self, widget):
+        event = TkEvent.BUTTON + "<1>"
+        func_id = event.bind(widget, self.action, add="+")
+        event.get_bindings(widget)
+        external_id = widget.bind(event.value, self.action, add="+")
+
+        event.unbind(widget, func_id)
+
+        assert list(event.get_bindings(widget)) == [external_id]
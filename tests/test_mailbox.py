@@ -0,0 +1,168 @@
+import threading
+
+import pytest
+
+from tklife.core import CreatedWidget
+from tklife.mailbox import UIMailbox
+
+
+@pytest.fixture
+def scheduled():
+    """Callbacks scheduled with after, as (delay, callback)."""
+    return []
+
+
+@pytest.fixture
+def mock_root(mocker, scheduled):
+    root = mocker.MagicMock()
+    root.after.side_effect = (
+        lambda delay, callback: scheduled.append((delay, callback))
+        or f"after#{len(scheduled)}"
+    )
+    return root
+
+
+@pytest.fixture
+def mailbox(mock_root):
+    return UIMailbox(mock_root, frame_ms=10, budget_ms=1000, idle_ms=50)
+
+
+@pytest.fixture
+def mock_variable(mocker):
+    variable = mocker.Mock()
+    variable.__str__ = mocker.Mock(return_value="PY_VAR0")
+    return variable
+
+
+def run_frames(mailbox, scheduled):
+    """Runs the ticks of the mailbox until it is empty."""
+    frames = 0
+    while mailbox.pending:
+        __, callback = scheduled.pop(0)
+        callback()
+        frames += 1
+    return frames
+
+
+class TestUIMailbox:
+    def test_later_set_overwrites_earlier(self, mailbox, mock_variable, scheduled):
+        for value in range(100):
+            mailbox.set(mock_variable, value)
+        assert mailbox.pending == 1
+        assert mailbox.coalesced == 99
+        assert run_frames(mailbox, scheduled) == 1
+        mock_variable.set.assert_called_once_with(99)
+
+    def test_set_created_widget_variable(
+        self, mocker, mailbox, mock_variable, scheduled
+    ):
+        created = CreatedWidget(mocker.Mock(), variable=mock_variable)
+        mailbox.set(created, True, name="variable")
+        run_frames(mailbox, scheduled)
+        mock_variable.set.assert_called_once_with(True)
+
+    def test_configure_merges_options(self, mailbox, mock_master, scheduled):
+        mailbox.configure(mock_master, text="a", state="disabled")
+        mailbox.configure(mock_master, text="b")
+        run_frames(mailbox, scheduled)
+        mock_master.configure.assert_called_once_with(text="b", state="disabled")
+
+    def test_configure_skips_destroyed_widget(self, mailbox, mock_master, scheduled):
+        mock_master.winfo_exists.return_value = 0
+        mailbox.configure(mock_master, text="a")
+        run_frames(mailbox, scheduled)
+        mock_master.configure.assert_not_called()
+
+    def test_rows_are_appended_together(self, mocker, mailbox, scheduled):
+        widget = mocker.Mock()
+        mailbox.append_row(widget, ["a"])
+        mailbox.append_row(widget, ["b"])
+        run_frames(mailbox, scheduled)
+        widget.append_rows.assert_called_once_with([["a"], ["b"]])
+
+    def test_mutations_keep_posting_order(self, mocker, mailbox, scheduled):
+        calls = []
+        mailbox.post("a", calls.append, 1)
+        mailbox.post(None, calls.append, 2)
+        mailbox.post(None, calls.append, 3)
+        mailbox.post("a", calls.append, 4)
+        run_frames(mailbox, scheduled)
+        assert calls == [2, 3, 4]
+
+    def test_budget_spreads_mutations_over_frames(self, mocker, mock_root, scheduled):
+        mocker.patch(
+            "tklife.mailbox.time.perf_counter",
+            side_effect=[float(t) for t in range(10)],
+        )
+        mailbox = UIMailbox(mock_root, frame_ms=10, budget_ms=1500)
+        calls = []
+        for value in range(3):
+            mailbox.post(None, calls.append, value)
+        assert run_frames(mailbox, scheduled) == 2
+        assert calls == [0, 1, 2]
+
+    def test_errors_are_reported(self, mailbox, mock_root, scheduled):
+        calls = []
+
+        def fail():
+            raise ValueError("bad")
+
+        mailbox.post(None, fail)
+        mailbox.post(None, calls.append, 1)
+        run_frames(mailbox, scheduled)
+        assert mock_root.report_callback_exception.call_args.args[0] is ValueError
+        assert calls == [1]
+
+    def test_ticks_every_frame_only_while_pending(
+        self, mailbox, mock_variable, scheduled
+    ):
+        assert [delay for delay, __ in scheduled] == [50]
+        scheduled.pop(0)[1]()
+        assert scheduled[-1][0] == 50
+        mailbox.set(mock_variable, 1)
+        mailbox.budget_ms = 0
+        mailbox.post(None, mock_variable.get)
+        scheduled.pop(0)[1]()
+        assert scheduled[-1][0] == 10
+        scheduled.pop(0)[1]()
+        assert scheduled[-1][0] == 50
+        mock_variable.get.assert_called_once_with()
+
+    def test_close_stops_ticking(self, mailbox, mock_root, mock_variable):
+        mailbox.close()
+        mock_root.after_cancel.assert_called_once_with("after#1")
+        mailbox.set(mock_variable, 1)
+        assert mailbox.pending == 0
+
+    def test_posts_from_threads_do_not_call_tk(
+        self, mocker, mailbox, mock_root, scheduled
+    ):
+        variables = [
+            mocker.Mock(__str__=mocker.Mock(return_value=f"v{i}")) for i in range(4)
+        ]
+
+        def work(variable):
+            for value in range(500):
+                mailbox.set(variable, value)
+
+        threads = [threading.Thread(target=work, args=(v,)) for v in variables]
+        mock_root.reset_mock()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert mock_root.method_calls == []
+        run_frames(mailbox, scheduled)
+        for variable in variables:
+            variable.set.assert_called_once_with(499)
+
+    def test_root_destroy_closes(self, mocker, mock_root, mock_variable, scheduled):
+        watch = mocker.patch("tklife.mailbox._watch_destroy")
+        mailbox = UIMailbox(mock_root)
+        mailbox.set(mock_variable, 1)
+        assert watch.call_args.args[:2] == (mock_root, str(mock_root))
+        watch.call_args.args[2]()
+        mock_root.after_cancel.assert_called_once_with("after#1")
+        mailbox.set(mock_variable, 2)
+        assert mailbox.pending == 0
+        mock_variable.set.assert_not_called()
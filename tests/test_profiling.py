@@ -0,0 +1,132 @@
+import logging
+
+import pytest
+
+from tklife import profiling
+from tklife.profiling import (
+    CellTiming,
+    ConstructionAggregate,
+    ConstructionStats,
+    HandlerProfiler,
+    LatencyHistogram,
+)
+
+
+class TestConstructionStats:
+    def test_phase_records_wall_time(self, mocker):
+        mocker.patch("tklife.profiling.time.perf_counter", side_effect=[1.0, 3.5])
+        stats = ConstructionStats()
+        with stats.phase("init"):
+            pass
+        assert stats.phases == {"init": 2.5}
+
+    def test_phase_records_wall_time_when_block_raises(self, mocker):
+        mocker.patch("tklife.profiling.time.perf_counter", side_effect=[1.0, 2.0])
+        stats = ConstructionStats()
+        with pytest.raises(RuntimeError):
+            with stats.phase("init"):
+                raise RuntimeError()
+        assert stats.phases == {"init": 1.0}
+
+    def test_total_sums_phases(self):
+        stats = ConstructionStats(phases={"init": 1.0, "create_all": 2.0})
+        assert stats.total == 3.0
+
+    def test_slowest_cells_returns_slowest_first(self):
+        stats = ConstructionStats()
+        stats.add_cell(0, 0, None, 1.0)
+        stats.add_cell(0, 1, "label", 3.0)
+        stats.add_cell(1, 0, None, 2.0)
+        assert stats.slowest_cells(2) == [
+            CellTiming(0, 1, "label", 3.0),
+            CellTiming(1, 0, None, 2.0),
+        ]
+
+
+class TestConstructionAggregate:
+    def test_add_aggregates_phases(self):
+        aggregate = ConstructionAggregate()
+        aggregate.add(ConstructionStats(phases={"init": 1.0, "create_all": 4.0}))
+        aggregate.add(ConstructionStats(phases={"init": 3.0, "create_all": 2.0}))
+        assert aggregate.count == 2
+        assert aggregate.totals == {"init": 4.0, "create_all": 6.0}
+        assert aggregate.maximums == {"init": 3.0, "create_all": 4.0}
+        assert aggregate.means == {"init": 2.0, "create_all": 3.0}
+
+    def test_means_is_empty_without_stats(self):
+        assert ConstructionAggregate().means == {}
+
+
+class TestLatencyHistogram:
+    def test_add_counts_calls_in_buckets(self):
+        histogram = LatencyHistogram((1.0, 10.0))
+        histogram.add(0.0005)
+        histogram.add(0.001)
+        histogram.add(0.005)
+        histogram.add(0.5)
+        assert histogram.counts == [2, 1, 1]
+        assert histogram.count == 4
+        assert histogram.maximum == 0.5
+        assert histogram.mean == pytest.approx(0.5065 / 4)
+
+    def test_mean_is_zero_without_calls(self):
+        assert LatencyHistogram().mean == 0.0
+
+
+class TestHandlerProfiler:
+    def handler(self, event):
+        return "break"
+
+    def test_wrap_records_call_time_and_returns_result(self, mocker):
+        mocker.patch("tklife.profiling.time.perf_counter", side_effect=[1.0, 1.003])
+        profiler = HandlerProfiler()
+        timed = profiler.wrap("<Motion>", "Frame", self.handler)
+        assert timed("event") == "break"
+        key = (
+            "<Motion>",
+            "Frame",
+            f"{__name__}.TestHandlerProfiler.handler",
+        )
+        assert profiler.stats[key].counts[2] == 1
+        assert profiler.stats[key].total == pytest.approx(0.003)
+
+    def test_wrap_records_call_time_when_action_raises(self, mocker):
+        mocker.patch("tklife.profiling.time.perf_counter", side_effect=[1.0, 1.5])
+        profiler = HandlerProfiler()
+
+        def failing(event):
+            raise RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            profiler.wrap("<Motion>", "Frame", failing)("event")
+        assert [h.maximum for h in profiler.stats.values()] == [0.5]
+
+    def test_record_calls_on_slow(self, mocker):
+        on_slow = mocker.Mock()
+        profiler = HandlerProfiler(slow_ms=100, on_slow=on_slow)
+        profiler.record(("<Motion>", "Frame", "handler"), 0.05)
+        on_slow.assert_not_called()
+        profiler.record(("<Motion>", "Frame", "handler"), 0.2)
+        on_slow.assert_called_once_with(("<Motion>", "Frame", "handler"), 0.2)
+
+    def test_record_logs_slow_calls_without_on_slow(self, caplog):
+        profiler = HandlerProfiler(slow_ms=100)
+        with caplog.at_level(logging.WARNING, logger="tklife.profiling"):
+            profiler.record(("<Motion>", "Frame", "handler"), 0.2)
+        assert "handler bound to <Motion> on Frame" in caplog.text
+
+    def test_slowest_returns_most_total_time_first(self):
+        profiler = HandlerProfiler()
+        profiler.record(("<Motion>", "Frame", "a"), 0.1)
+        profiler.record(("<Motion>", "Frame", "b"), 0.3)
+        profiler.record(("<Motion>", "Frame", "a"), 0.1)
+        assert [key[2] for key, __ in profiler.slowest()] == ["b", "a"]
+
+    def test_enable_and_disable_handler_profiling(self):
+        profiler = profiling.enable_handler_profiling(slow_ms=16)
+        try:
+            assert profiling.handler_profiler() is profiler
+            assert profiler.slow_ms == 16
+        finally:
+            profiling.disable_handler_profiling()
+        assert profiling.handler_profiler() is None
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from pytest_mock import MockerFixture
 
@@ -32,3 +34,47 @@ class TestCallProxyFactory:
         skel = mocker.Mock()
         expected = CallProxy(skel, "func")
         assert CallProxyFactory(skel).func == expected
+
+    def test_dunder_get_attr_returns_same_proxy_per_name(self, mocker: MockerFixture):
+        factory = CallProxyFactory(mocker.Mock())
+        assert factory.func is factory.func
+        assert factory.func is not factory.other
+
+    def test_dunder_get_attr_raises_attribute_error_for_special_names(
+        self, mocker: MockerFixture
+    ):
+        factory = CallProxyFactory(mocker.Mock())
+        with pytest.raises(AttributeError):
+            factory.__deepcopy__
+        assert copy.copy(factory).skel is factory.skel
+
+    def test_set_controller_makes_proxies_call_controller_directly(
+        self, mocker: MockerFixture
+    ):
+        skel = mocker.Mock()
+        controller = mocker.Mock()
+        factory = CallProxyFactory(skel)
+        proxy = factory.func
+        factory.set_controller(controller)
+        skel.controller = factory
+        proxy(1)
+        controller.func.assert_called_once_with(1)
+        assert factory.other.target is controller.other
+        factory.set_controller(None)
+        assert proxy.target is None
+        with pytest.raises(TklProxyError):
+            proxy()
+
+
+class TestCallProxyRetarget:
+    def test_retarget_leaves_missing_methods_to_call_time(self, mocker: MockerFixture):
+        controller = mocker.Mock(spec=["other"])
+        proxy = CallProxy(mocker.Mock(), "func")
+        proxy.retarget(controller)
+        assert proxy.target is None
+
+    def test_target_is_not_compared(self, mocker: MockerFixture):
+        skel = mocker.Mock()
+        proxy = CallProxy(skel, "func")
+        proxy.retarget(mocker.Mock())
+        assert proxy == CallProxy(skel, "func")
@@ -0,0 +1,130 @@
+from tkinter import TclError
+
+import pytest
+
+from tklife.event import BaseEvent, LeanEvent, TkEvent
+from tklife.replay import EventRecorder, EventReplayer, RecordedEvent
+
+
+def _lean(**fields):
+    event = LeanEvent()
+    for name, value in fields.items():
+        setattr(event, name, value)
+    return event
+
+
+@pytest.fixture
+def mock_bind(mocker):
+    return mocker.patch.object(
+        BaseEvent, "bind", autospec=True, side_effect=lambda *_, **__: "funcid"
+    )
+
+
+@pytest.fixture
+def mock_unbind(mocker):
+    return mocker.patch.object(BaseEvent, "unbind", autospec=True)
+
+
+class TestEventRecorder:
+    def test_start_binds_events_on_all_tag(self, mock_bind, mock_master):
+        recorder = EventRecorder(mock_master, {TkEvent.MOTION: ("x", "y")})
+        recorder.start()
+        assert recorder.recording
+        mock_bind.assert_called_once_with(
+            TkEvent.MOTION,
+            mock_master,
+            mock_bind.call_args.args[2],
+            add="+",
+            classname="all",
+            fields=("widget", "x", "y"),
+        )
+
+    def test_stop_unbinds_events(self, mock_bind, mock_unbind, mock_master):
+        with EventRecorder(mock_master, {TkEvent.MOTION: ("x",)}) as recorder:
+            pass
+        mock_unbind.assert_called_once_with(
+            TkEvent.MOTION, mock_master, "funcid", classname="all"
+        )
+        assert not recorder.recording
+
+    def test_records_fields_and_time(self, mocker, mock_bind, mock_master):
+        mocker.patch("tklife.replay.time.perf_counter", side_effect=[10.0, 10.25])
+        recorder = EventRecorder(mock_master, {TkEvent.KEYPRESS: ("keysym", "state")})
+        recorder.start()
+        record = mock_bind.call_args.args[2]
+        record(_lean(widget=".entry", keysym="a", state="??"))
+        assert recorder.events == [
+            RecordedEvent(250, "<KeyPress>", ".entry", {"keysym": "a"})
+        ]
+
+    def test_save_and_load_round_trip(self, tmp_path, mock_master):
+        events = [
+            RecordedEvent(5, "<KeyPress>", ".entry", {"keysym": "a", "state": 0}),
+            RecordedEvent(12, "<Motion>", ".", {}),
+        ]
+        recorder = EventRecorder(mock_master)
+        recorder.events = list(events)
+        recorder.save(tmp_path / "session.jsonl")
+        assert EventReplayer.load(mock_master, tmp_path / "session.jsonl").events == (
+            events
+        )
+
+    def test_load_rejects_other_files(self, tmp_path, mock_master):
+        (tmp_path / "other.json").write_text("{}\n")
+        with pytest.raises(ValueError):
+            EventReplayer.load(mock_master, tmp_path / "other.json")
+
+
+class TestEventReplayer:
+    def test_replay_generates_events(self, mock_master):
+        replayer = EventReplayer(
+            mock_master,
+            [RecordedEvent(0, "<Button>", ".b", {"num": 1, "x": 2})],
+        )
+        replayer.replay()
+        mock_master.tk.call.assert_called_once_with(
+            "event", "generate", ".b", "<Button>", "-button", 1, "-x", 2
+        )
+        assert len(replayer.latencies) == 1
+
+    def test_replay_skips_missing_widgets(self, mock_master):
+        mock_master.tk.call.side_effect = TclError('bad window path name ".b"')
+        replayer = EventReplayer(mock_master, [RecordedEvent(0, "<Motion>", ".b", {})])
+        replayer.replay()
+        assert replayer.skipped == 1
+        assert replayer.latencies == []
+
+    def test_play_compresses_time(self, mocker, mock_master):
+        mocker.patch("tklife.replay.time.perf_counter", return_value=0.0)
+        callback = mocker.Mock()
+        replayer = EventReplayer(
+            mock_master,
+            [
+                RecordedEvent(100, "<Motion>", ".", {}),
+                RecordedEvent(300, "<Motion>", ".", {}),
+            ],
+        )
+        replayer.play(speed=2.0, callback=callback)
+        assert replayer.playing
+        delays = []
+        while mock_master.after.call_args is not None and replayer.playing:
+            delay, step, *args = mock_master.after.call_args.args
+            mock_master.after.reset_mock()
+            delays.append(delay)
+            step(*args)
+        assert delays == [50, 150]
+        assert mock_master.tk.call.call_count == 2
+        callback.assert_called_once_with(replayer)
+        assert not replayer.playing
+
+    def test_play_rejects_non_positive_speed(self, mock_master):
+        with pytest.raises(ValueError):
+            EventReplayer(mock_master, []).play(speed=0)
+
+    def test_cancel_cancels_scheduled_event(self, mock_master):
+        mock_master.after.return_value = "after#1"
+        replayer = EventReplayer(mock_master, [RecordedEvent(0, "<Motion>", ".", {})])
+        replayer.play()
+        replayer.cancel()
+        mock_master.after_cancel.assert_called_once_with("after#1")
+        assert not replayer.playing
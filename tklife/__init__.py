@@ -1,8 +1,15 @@
 """Make Tkinter life easier."""
 
-from tklife import constants, controller, core, event, menu  # noqa: F401
+from tklife import constants, controller, core, event, menu, profiling  # noqa: F401
 from tklife.core import *  # noqa: F401
 
 __version__ = "2.5.0-dev0"
 
-__all__ = ["constants", "controller", "core", "event", "menu"] + core.__all__
+__all__ = [
+    "constants",
+    "controller",
+    "core",
+    "event",
+    "menu",
+    "profiling",
+] + core.__all__
@@ -75,6 +75,8 @@ class ExampleModal(ModalDialog[str]):
 
 
 class AppendExampleScrolledFrame(SkeletonMixin, AppendableMixin, ScrolledFrame):
+    widget_pool_size = 30
+
     def __after_init__(self):
         GreenScrollbar.set_style(self.h_scroll)
         super().__after_init__()
@@ -108,14 +110,15 @@ class ExampleController(ControllerABC):
             ]
             if self.insert_at == -1:
                 added_row = add_to.append_row(new_row)
-                add_to.widget_cache[added_row, 1].widget.insert(0, self.entry_text)  # type: ignore
             else:
                 try:
                     added_row = add_to.insert_row_at(self.insert_at, new_row)
-                    add_to.widget_cache[added_row, 1].widget.insert(0, self.entry_text)  # type: ignore
-                except KeyError:
+                except (IndexError, KeyError):
                     added_row = add_to.append_row(new_row)
-                    add_to.widget_cache[added_row, 1].widget.insert(0, self.entry_text)  # type: ignore
+            entry = add_to.widget_cache[added_row, 1].widget
+            # Pooled entries keep their text
+            entry.delete(0, tk.END)  # type: ignore
+            entry.insert(0, self.entry_text)  # type: ignore
 
         def _get_delete_this_row_command(self):
             def delete_this_row():
@@ -0,0 +1,181 @@
+"""Contains the integration of asyncio with the Tk mainloop, used to run coroutines
+(such as ``async def`` controller methods) without freezing the window."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import TYPE_CHECKING
+
+from tklife.event import _watch_destroy
+
+if TYPE_CHECKING:
+    from typing import Any, Coroutine, Optional, TypeVar
+
+    from tklife.event import Widget
+
+    T = TypeVar("T")
+
+__all__ = ["AsyncLoop"]
+
+
+class AsyncLoop:
+    """Runs an asyncio event loop from the Tk mainloop.
+
+    The loop is run for one iteration on a Tk timer, only while tasks created with
+    ``create_task`` are pending, so coroutines run on the Tk thread and can use
+    widgets. Blocking work, such as reading large files, should be awaited with
+    ``asyncio.to_thread`` or ``loop.run_in_executor``; its result wakes the loop on
+    the next tick.
+
+    Tasks can be owned by a widget, and are cancelled when it is destroyed.
+    Exceptions raised by tasks are reported with ``report_callback_exception``,
+    like the exceptions of other Tk callbacks.
+
+    Note:
+        Use ``AsyncLoop.of`` rather than creating instances directly; there is a
+        single loop per interpreter. It is closed when the root window is destroyed.
+
+    Args:
+        master: The root window of the interpreter
+        interval_ms: The time between two iterations of the loop in milliseconds
+
+    """
+
+    def __init__(self, master: Widget, interval_ms: int = 10) -> None:
+        self.master = master
+        self.interval_ms = interval_ms
+        self.loop = asyncio.new_event_loop()
+        self.__tasks: set[asyncio.Task[Any]] = set()
+        self.__owned: dict[str, set[asyncio.Task[Any]]] = {}
+        self.__owners: dict[asyncio.Task[Any], str] = {}
+        self.__after_id: Optional[str] = None
+        self.__watched: set[str] = set()
+        # Watched through a bindtag, so binding <Destroy> without add="+" does not
+        # replace it
+        _watch_destroy(master, str(master), self.close)
+
+    @classmethod
+    def of(cls, widget: Widget) -> AsyncLoop:
+        """Returns the loop of the interpreter of a widget.
+
+        Args:
+            widget: Any widget of the interpreter
+
+        Returns:
+            The loop
+
+        """
+        loop = _loops.get(id(widget.tk))
+        # The id of a destroyed interpreter can be reused
+        if loop is None or loop.master.tk is not widget.tk or loop.loop.is_closed():
+            loop = _loops[id(widget.tk)] = cls(widget.nametowidget("."))
+        return loop
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of tasks that are not done."""
+        return len(self.__tasks)
+
+    def create_task(
+        self, coro: Coroutine[Any, Any, T], owner: Optional[Widget] = None
+    ) -> asyncio.Task[T]:
+        """Schedules a coroutine on the loop.
+
+        Args:
+            coro: The coroutine
+
+        Keyword Args:
+            owner: A widget whose destruction cancels the task, or None
+                (default: None)
+
+        Returns:
+            The task
+
+        """
+        task = self.loop.create_task(coro)
+        self.__tasks.add(task)
+        task.add_done_callback(self.__task_done)
+        if owner is not None:
+            self.__own(owner, task)
+        self.__schedule(0)
+        return task
+
+    def cancel_owned(self, owner: Widget) -> int:
+        """Cancels the tasks owned by a widget.
+
+        Args:
+            owner: The widget
+
+        Returns:
+            The number of tasks cancelled
+
+        """
+        tasks = self.__owned.pop(str(owner), set())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.__schedule(0)
+        return len(tasks)
+
+    def close(self) -> None:
+        """Cancels every task, lets them handle the cancellation and closes the
+        loop. Must not be called from a coroutine of the loop."""
+        if self.__after_id is not None:
+            self.master.after_cancel(self.__after_id)
+            self.__after_id = None
+        if self.loop.is_closed():
+            return
+        tasks = list(self.__tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.__owned.clear()
+        self.__owners.clear()
+        self.loop.close()
+
+    def __own(self, owner: Widget, task: asyncio.Task[Any]) -> None:
+        path = str(owner)
+        owned = self.__owned.get(path)
+        if owned is None:
+            owned = self.__owned[path] = set()
+        if path not in self.__watched:
+            self.__watched.add(path)
+            _watch_destroy(owner, path, functools.partial(self.__owner_destroyed, path))
+        owned.add(task)
+        self.__owners[task] = path
+
+    def __owner_destroyed(self, path: str) -> None:
+        self.__watched.discard(path)
+        self.cancel_owned(path)  # type: ignore[arg-type]
+
+    def __schedule(self, delay_ms: int) -> None:
+        if self.__after_id is None:
+            self.__after_id = self.master.after(delay_ms, self.__tick)
+
+    def __tick(self) -> None:
+        self.__after_id = None
+        # A coroutine can process Tk events (such as with update), running this tick
+        if not self.loop.is_running():
+            self.loop.call_soon(self.loop.stop)
+            self.loop.run_forever()
+        if self.__tasks:
+            self.__schedule(self.interval_ms)
+
+    def __task_done(self, task: asyncio.Task[Any]) -> None:
+        self.__tasks.discard(task)
+        path = self.__owners.pop(task, None)
+        if path is not None and path in self.__owned:
+            self.__owned[path].discard(task)
+        if task.cancelled():
+            return
+        ex = task.exception()
+        if ex is not None:
+            self.master.report_callback_exception(type(ex), ex, ex.__traceback__)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.master} pending={self.pending}>"
+
+
+_loops: dict[int, AsyncLoop] = {}
@@ -0,0 +1,959 @@
+"""Contains the background executors, used to run slow controller methods on a thread
+or process pool and deliver their results to the Tk thread."""
+
+from __future__ import annotations
+
+import collections
+import functools
+import inspect
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from tklife.event import _watch_destroy
+from tklife.style import progressbar as progressbar_style
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.context import BaseContext
+    from tkinter import ttk
+    from typing import Any, Callable, Optional, Union
+
+    from tklife.controller import ControllerABC
+    from tklife.event import Widget
+
+    Handler = Union[str, Callable[[Any], Any], None]
+
+__all__ = [
+    "TaskCancelled",
+    "BackgroundTask",
+    "BackgroundExecutor",
+    "background",
+    "WorkerTask",
+    "ProcessTask",
+    "ProcessExecutor",
+    "offload",
+]
+
+T = TypeVar("T")
+
+_DONE = "done"
+_ERROR = "error"
+_PROGRESS = "progress"
+
+
+class TaskCancelled(Exception):
+    """Raised in a worker by ``BackgroundTask.raise_if_cancelled`` to stop a
+    cancelled task."""
+
+
+class BackgroundTask(Generic[T]):
+    """A callable running on a worker thread, and the handle used to follow it.
+
+    The worker can check ``cancelled`` (or call ``raise_if_cancelled``) to stop
+    early, and ``report`` progress. Callbacks are always called on the Tk thread.
+
+    Note:
+        Tasks are created by ``BackgroundExecutor.submit``.
+
+    Args:
+        executor: The executor running the task
+        owner: The path of the widget owning the task
+        on_done: Called with the return value
+        on_error: Called with the exception raised
+        on_progress: Called with the values reported
+
+    """
+
+    owner: Optional[str]
+    """The path of the widget owning the task, if any."""
+
+    future: Optional[Future[None]]
+    """The future of the worker, once submitted."""
+
+    def __init__(
+        self,
+        executor: _TkExecutor,
+        owner: Optional[str] = None,
+        on_done: Optional[Callable[[T], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.owner = owner
+        self.future = None
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._executor = executor
+        self.__cancelled = threading.Event()
+        self.__finished = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the task was cancelled. Safe to use from the worker."""
+        return self.__cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        """Whether the result, exception or cancellation of the task was handled on
+        the Tk thread."""
+        return self.__finished
+
+    def cancel(self) -> None:
+        """Cancels the task. A task that did not start yet does not run; a running
+        task is only stopped if it checks ``cancelled``. The callbacks of a cancelled
+        task are not called. Must be called on the Tk thread."""
+        if self.__finished:
+            return
+        self.__cancelled.set()
+        self._executor._cancel(self)  # pylint: disable=protected-access
+
+    def raise_if_cancelled(self) -> None:
+        """Raises TaskCancelled if the task was cancelled. Call it from the worker.
+
+        Raises:
+            TaskCancelled: Raised when the task was cancelled
+
+        """
+        if self.__cancelled.is_set():
+            raise TaskCancelled()
+
+    def report(self, value: Any) -> None:
+        """Reports progress from the worker. Only the latest value reported between
+        two deliveries is passed to ``on_progress``.
+
+        Args:
+            value: Any value, such as a fraction of the work done
+
+        """
+        self._executor.post(self, _PROGRESS, value)  # type: ignore[attr-defined]
+
+    def _finish(self) -> None:
+        self.__finished = True
+
+    def _deliver(self, kind: str, value: Any) -> None:
+        """Calls the callback of a message on the Tk thread."""
+        if kind == _PROGRESS:
+            if self.on_progress is not None:
+                self.on_progress(value)
+        elif kind == _DONE:
+            if self.on_done is not None:
+                self.on_done(value)
+        elif self.on_error is not None:
+            self.on_error(value)
+        else:
+            self._executor.master.report_callback_exception(
+                type(value), value, value.__traceback__
+            )
+
+    def __repr__(self) -> str:
+        state = "done" if self.done else "cancelled" if self.cancelled else "pending"
+        return f"<{self.__class__.__name__} {state} owner={self.owner}>"
+
+
+class _TkExecutor:
+    """The base of the executors: tracks the pending tasks and their owners, and
+    drains the messages of the workers on an ``after`` tick while tasks are
+    pending."""
+
+    max_workers = 4
+    """The number of workers of executors created by ``of``."""
+
+    def __init__(self, master: Widget, interval_ms: int) -> None:
+        self.master = master
+        self.interval_ms = interval_ms
+        self._pending: set[BackgroundTask[Any]] = set()
+        self._shut_down = False
+        self.__owned: dict[str, set[BackgroundTask[Any]]] = {}
+        self.__after_id: Optional[str] = None
+        # Watched through a bindtag, so binding <Destroy> without add="+" does not
+        # replace it
+        _watch_destroy(master, str(master), self.shutdown)
+
+    @classmethod
+    def of(cls: Any, widget: Widget) -> Any:
+        """Returns the executor of the interpreter of a widget, with ``max_workers``
+        workers.
+
+        Args:
+            widget: Any widget of the interpreter
+
+        Returns:
+            The executor
+
+        """
+        key = (cls, id(widget.tk))
+        executor = _executors.get(key)
+        # The id of a destroyed interpreter can be reused
+        if (
+            executor is None
+            or executor.master.tk is not widget.tk
+            or executor._shut_down
+        ):
+            executor = _executors[key] = cls(widget.nametowidget("."), cls.max_workers)
+        return executor
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of tasks that are not done."""
+        return len(self._pending)
+
+    def pending_for(self, owner: Widget) -> int:
+        """Returns the number of tasks of an owner that are not done.
+
+        Args:
+            owner: The owner widget
+
+        Returns:
+            The number of tasks
+
+        """
+        return len(self.__owned.get(str(owner), ()))
+
+    def cancel_owned(self, owner: Widget) -> int:
+        """Cancels the tasks owned by a widget.
+
+        Args:
+            owner: The widget
+
+        Returns:
+            The number of tasks cancelled
+
+        """
+        tasks = list(self.__owned.get(str(owner), ()))
+        for task in tasks:
+            task.cancel()
+        return len(tasks)
+
+    def shutdown(self) -> None:
+        """Cancels every task and stops the workers without waiting for the running
+        tasks."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        if self.__after_id is not None:
+            self.master.after_cancel(self.__after_id)
+            self.__after_id = None
+        for task in list(self._pending):
+            task.cancel()
+        self._close()
+
+    def drain(self) -> None:
+        """Delivers the queued results, exceptions and progress. Called by the
+        ``after`` tick of the executor."""
+        raise NotImplementedError
+
+    def _admit(self, owner: Optional[Widget], limit: Optional[int]) -> bool:
+        """Returns whether a task of an owner can be submitted."""
+        if self._shut_down:
+            raise RuntimeError(f"The {self.__class__.__name__} was shut down")
+        if owner is None or limit is None:
+            return True
+        return len(self.__owned.get(str(owner), ())) < limit
+
+    def _add(self, task: BackgroundTask[Any], owner: Optional[Widget]) -> None:
+        self._pending.add(task)
+        if owner is not None:
+            owned = self.__owned.get(task.owner)  # type: ignore[arg-type]
+            if owned is None:
+                owned = self.__owned[task.owner] = set()  # type: ignore[index]
+                _watch_destroy(
+                    owner,
+                    task.owner,  # type: ignore[arg-type]
+                    functools.partial(self.__owner_destroyed, task.owner),
+                )
+            owned.add(task)
+        self._schedule()
+
+    def _finish(self, task: BackgroundTask[Any]) -> None:
+        self._pending.discard(task)
+        if task.owner is not None and task.owner in self.__owned:
+            self.__owned[task.owner].discard(task)
+        task._finish()  # pylint: disable=protected-access
+
+    def _cancel(self, task: BackgroundTask[Any]) -> None:
+        """Stops a task whose cancellation was just requested."""
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        """Stops the workers."""
+        raise NotImplementedError
+
+    def _schedule(self) -> None:
+        if self.__after_id is None:
+            self.__after_id = self.master.after(self.interval_ms, self.__tick)
+
+    def __tick(self) -> None:
+        self.__after_id = None
+        self.drain()
+        if self._pending:
+            self._schedule()
+
+    def __owner_destroyed(self, path: str) -> None:
+        self.cancel_owned(path)  # type: ignore[arg-type]
+        self.__owned.pop(path, None)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.master} pending={self.pending}>"
+
+
+class BackgroundExecutor(_TkExecutor):
+    """Runs callables on a bounded thread pool and delivers their results,
+    exceptions and progress to the Tk thread, through a single queue drained by one
+    ``after`` tick while tasks are pending.
+
+    Tasks can be owned by a widget: they are cancelled when it is destroyed, and the
+    number of tasks pending per owner can be limited.
+
+    Note:
+        Use ``BackgroundExecutor.of`` rather than creating instances directly; there
+        is a single executor per interpreter. It is shut down when the root window
+        is destroyed. Every method but ``post`` must be called on the Tk thread.
+
+    Args:
+        master: The root window of the interpreter
+        max_workers: The number of worker threads
+        interval_ms: The time between two drains of the queue in milliseconds
+
+    """
+
+    def __init__(
+        self, master: Widget, max_workers: int = 4, interval_ms: int = 15
+    ) -> None:
+        super().__init__(master, interval_ms)
+        self.__pool = ThreadPoolExecutor(max_workers, thread_name_prefix="tklife")
+        self.__queue: queue.SimpleQueue[tuple[BackgroundTask[Any], str, Any]] = (
+            queue.SimpleQueue()
+        )
+
+    def submit(
+        self,
+        function: Callable[..., T],
+        *args: Any,
+        owner: Optional[Widget] = None,
+        limit: Optional[int] = None,
+        on_done: Optional[Callable[[T], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        pass_task: bool = False,
+        **kwargs: Any,
+    ) -> Optional[BackgroundTask[T]]:
+        """Runs a function on a worker thread. Other arguments are passed to it.
+
+        Args:
+            function: The function
+
+        Keyword Args:
+            owner: A widget whose destruction cancels the task (default: None)
+            limit: The maximum number of pending tasks of the owner; the task is not
+                submitted if it is reached (default: None)
+            on_done: Called with the return value (default: None)
+            on_error: Called with the exception raised, or None to report it with
+                ``report_callback_exception`` (default: None)
+            on_progress: Called with the values reported (default: None)
+            pass_task: Whether to pass the task as the ``task`` keyword argument
+                (default: False)
+
+        Raises:
+            RuntimeError: Raised when the executor was shut down
+
+        Returns:
+            The task, or None if the limit of the owner was reached
+
+        """
+        if not self._admit(owner, limit):
+            return None
+        task: BackgroundTask[T] = BackgroundTask(
+            self,
+            None if owner is None else str(owner),
+            on_done,
+            on_error,
+            on_progress,
+        )
+        if pass_task:
+            kwargs["task"] = task
+        self._add(task, owner)
+        task.future = self.__pool.submit(self.__run, task, function, args, kwargs)
+        return task
+
+    def post(self, task: BackgroundTask[Any], kind: str, value: Any) -> None:
+        """Queues a message of a task for the Tk thread. Safe to call from any
+        thread.
+
+        Args:
+            task: The task
+            kind: The kind of message
+            value: The value of the message
+
+        """
+        self.__queue.put((task, kind, value))
+
+    def drain(self) -> None:
+        """Delivers the queued results, exceptions and progress. Called by the
+        ``after`` tick of the executor."""
+        progress: dict[BackgroundTask[Any], Any] = {}
+        while True:
+            try:
+                task, kind, value = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == _PROGRESS:
+                # Only the latest progress of a task is delivered
+                progress[task] = value
+                continue
+            self._finish(task)
+            if task.cancelled:
+                continue
+            if task in progress:
+                task._deliver(_PROGRESS, progress.pop(task))
+            task._deliver(kind, value)
+        for task, value in progress.items():
+            if not task.done and not task.cancelled:
+                task._deliver(_PROGRESS, value)
+
+    def _cancel(self, task: BackgroundTask[Any]) -> None:
+        # Tasks cancelled before they started never post a message
+        if task.future is not None and task.future.cancel():
+            self._finish(task)
+
+    def _close(self) -> None:
+        self.__pool.shutdown(wait=False, cancel_futures=True)
+
+    def __run(
+        self,
+        task: BackgroundTask[Any],
+        function: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        try:
+            result = function(*args, **kwargs)
+        except TaskCancelled:
+            self.post(task, _DONE, None)
+        except BaseException as ex:  # pylint: disable=broad-except
+            self.post(task, _ERROR, ex)
+        else:
+            self.post(task, _DONE, result)
+
+
+class WorkerTask:
+    """The task passed to functions running in a worker process, used to report
+    progress to the Tk thread. Reports are dropped when they come faster than the
+    rate of the executor.
+
+    Args:
+        connection: The connection to the executor
+        interval: The minimum time between two reports in seconds
+
+    """
+
+    def __init__(self, connection: Connection, interval: float) -> None:
+        self.__connection = connection
+        self.__interval = interval
+        self.__last = float("-inf")
+
+    def report(self, value: Any) -> None:
+        """Reports progress. For tasks driving a progress bar, the value is the
+        fraction of the work done, from 0 to 1.
+
+        Args:
+            value: Any picklable value
+
+        """
+        now = time.monotonic()
+        if now - self.__last >= self.__interval:
+            self.__last = now
+            self.__connection.send((_PROGRESS, value))
+
+
+class _RemoteTraceback(Exception):
+    """Holds the formatted traceback of an exception raised in a worker process."""
+
+    def __init__(self, text: str) -> None:
+        super().__init__(text)
+        self.text = text
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def _worker_main(connection: Connection, interval: float) -> None:
+    """Runs the tasks received on a connection until it receives None."""
+    while True:
+        payload = connection.recv_bytes()
+        if not payload:
+            return
+        try:
+            function, args, kwargs, pass_task = pickle.loads(payload)
+            if pass_task:
+                kwargs["task"] = WorkerTask(connection, interval)
+            message: tuple[str, Any] = (_DONE, function(*args, **kwargs))
+            connection.send(message)
+        except BaseException as ex:  # pylint: disable=broad-except
+            text = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+            try:
+                connection.send((_ERROR, (ex, text)))
+            except Exception:  # pylint: disable=broad-except
+                # The exception or the return value cannot be pickled
+                connection.send((_ERROR, (RuntimeError(repr(ex)), text)))
+
+
+class _Worker:
+    """A worker process and the connection used to send it tasks."""
+
+    def __init__(self, context: BaseContext, interval: float) -> None:
+        self.connection, child = context.Pipe()
+        self.process = context.Process(  # type: ignore[attr-defined]
+            target=_worker_main, args=(child, interval), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.task: Optional[ProcessTask[Any]] = None
+        self.deadline = float("inf")
+
+    def stop(self) -> None:
+        try:
+            self.connection.send_bytes(b"")
+        except OSError:
+            pass
+        self.connection.close()
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.connection.close()
+
+
+class ProcessTask(BackgroundTask[T]):
+    """A callable running in a worker process, and the handle used to follow it.
+
+    Cancelling the task, or reaching its timeout, terminates its worker process.
+    When the task drives a progress bar, it is styled with
+    ``tklife.style.progressbar`` if it has no style, reset when the task starts and
+    filled when it is done.
+
+    Note:
+        Tasks are created by ``ProcessExecutor.submit``.
+
+    Args:
+        executor: The executor running the task
+        owner: The path of the widget owning the task
+        on_done: Called with the return value
+        on_error: Called with the exception raised
+        on_progress: Called with the values reported
+        timeout: The maximum time the task can run in seconds
+        progressbar: A progress bar set to the fractions reported
+
+    """
+
+    def __init__(
+        self,
+        executor: _TkExecutor,
+        owner: Optional[str] = None,
+        on_done: Optional[Callable[[T], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        timeout: Optional[float] = None,
+        progressbar: Optional[ttk.Progressbar] = None,
+    ) -> None:
+        super().__init__(executor, owner, on_done, on_error, on_progress)
+        self.timeout = timeout
+        self.progressbar = progressbar
+
+    def raise_if_cancelled(self) -> None:
+        """Does nothing: cancelled tasks are terminated with their worker process."""
+
+    def report(self, value: Any) -> None:
+        """Not available: use the ``WorkerTask`` passed to the function.
+
+        Raises:
+            TypeError: Always raised
+
+        """
+        raise TypeError("Progress is reported with the WorkerTask of the worker")
+
+    def _start(self) -> None:
+        progressbar = self.__progressbar()
+        if progressbar is not None:
+            if not progressbar.cget("style"):
+                style = (
+                    progressbar_style.Vertical
+                    if str(progressbar.cget("orient")) == "vertical"
+                    else progressbar_style.Horizontal
+                )
+                style.set_style(progressbar)
+            progressbar.configure(mode="determinate", value=0)
+
+    def _deliver(self, kind: str, value: Any) -> None:
+        progressbar = self.__progressbar()
+        if progressbar is not None:
+            maximum = float(progressbar.cget("maximum"))
+            if kind == _PROGRESS:
+                progressbar.configure(value=float(value) * maximum)
+            else:
+                progressbar.configure(value=maximum if kind == _DONE else 0)
+        super()._deliver(kind, value)
+
+    def _finish(self) -> None:
+        super()._finish()
+        if self.cancelled:
+            progressbar = self.__progressbar()
+            if progressbar is not None:
+                progressbar.configure(value=0)
+
+    def __progressbar(self) -> Optional[ttk.Progressbar]:
+        """Returns the progress bar of the task, unless it was destroyed."""
+        # The progress bar is usually destroyed with the owner cancelling the task
+        if self.progressbar is not None and self.progressbar.winfo_exists():
+            return self.progressbar
+        return None
+
+
+class ProcessExecutor(_TkExecutor):
+    """Runs picklable callables in a bounded pool of worker processes, for
+    CPU-bound work that threads cannot run in parallel, and delivers their results,
+    exceptions and progress to the Tk thread on one ``after`` tick while tasks are
+    pending.
+
+    Functions and their arguments are pickled when submitted, so they must be
+    defined at module level. Worker processes are started when needed and reused;
+    cancelling a running task, or reaching its timeout, terminates its worker
+    process. Progress reports are limited to ``max_rate`` per second in the worker.
+
+    Note:
+        Use ``ProcessExecutor.of`` rather than creating instances directly; there is
+        a single executor per interpreter. It is shut down when the root window is
+        destroyed. Every method must be called on the Tk thread.
+
+    Args:
+        master: The root window of the interpreter
+        max_workers: The number of worker processes
+        interval_ms: The time between two drains of the workers in milliseconds
+        max_rate: The maximum number of progress reports per second and task
+        context: The multiprocessing context used to start the workers
+
+    """
+
+    def __init__(
+        self,
+        master: Widget,
+        max_workers: int = 4,
+        interval_ms: int = 15,
+        max_rate: float = 20.0,
+        context: Optional[BaseContext] = None,
+    ) -> None:
+        super().__init__(master, interval_ms)
+        self.max_workers = max_workers
+        self.max_rate = max_rate
+        self.__context = context or multiprocessing.get_context()
+        self.__idle: list[_Worker] = []
+        self.__busy: list[_Worker] = []
+        self.__waiting: collections.deque[tuple[ProcessTask[Any], bytes]] = (
+            collections.deque()
+        )
+
+    def submit(
+        self,
+        function: Callable[..., T],
+        *args: Any,
+        owner: Optional[Widget] = None,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        progressbar: Optional[ttk.Progressbar] = None,
+        on_done: Optional[Callable[[T], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        pass_task: bool = False,
+        **kwargs: Any,
+    ) -> Optional[ProcessTask[T]]:
+        """Runs a function in a worker process. Other arguments are passed to it.
+
+        Args:
+            function: The function, defined at module level
+
+        Keyword Args:
+            owner: A widget whose destruction cancels the task (default: None)
+            limit: The maximum number of pending tasks of the owner; the task is not
+                submitted if it is reached (default: None)
+            timeout: The maximum time the task can run in seconds; TimeoutError is
+                passed to on_error when it is reached (default: None)
+            progressbar: A progress bar set to the fractions reported
+                (default: None)
+            on_done: Called with the return value (default: None)
+            on_error: Called with the exception raised, or None to report it with
+                ``report_callback_exception`` (default: None)
+            on_progress: Called with the values reported (default: None)
+            pass_task: Whether to pass a ``WorkerTask`` as the ``task`` keyword
+                argument (default: False)
+
+        Raises:
+            RuntimeError: Raised when the executor was shut down
+            pickle.PicklingError: Raised when the function or arguments cannot be
+                pickled
+
+        Returns:
+            The task, or None if the limit of the owner was reached
+
+        """
+        if not self._admit(owner, limit):
+            return None
+        payload = pickle.dumps((function, args, kwargs, pass_task))
+        task: ProcessTask[T] = ProcessTask(
+            self,
+            None if owner is None else str(owner),
+            on_done,
+            on_error,
+            on_progress,
+            timeout,
+            progressbar,
+        )
+        self._add(task, owner)
+        self.__waiting.append((task, payload))
+        self.__dispatch()
+        return task
+
+    def drain(self) -> None:
+        """Delivers the results, exceptions and progress of the workers, stops the
+        tasks that reached their timeout and starts the waiting tasks. Called by the
+        ``after`` tick of the executor."""
+        now = time.monotonic()
+        for worker in list(self.__busy):
+            task = worker.task
+            assert task is not None
+            progress, message = self.__receive(worker)
+            alive = worker.process.is_alive()
+            if message is None and not alive:
+                message = (
+                    _ERROR,
+                    BrokenProcessPool(
+                        "The worker process exited with code "
+                        f"{worker.process.exitcode}"
+                    ),
+                )
+            elif message is None and now >= worker.deadline:
+                alive = False
+                message = (
+                    _ERROR,
+                    TimeoutError(f"The task did not finish in {task.timeout}s"),
+                )
+            if progress is not None:
+                task._deliver(_PROGRESS, progress)
+            if message is None:
+                continue
+            self.__busy.remove(worker)
+            worker.task = None
+            if alive:
+                self.__idle.append(worker)
+            else:
+                worker.kill()
+            self._finish(task)
+            task._deliver(*message)
+        self.__dispatch()
+
+    def _cancel(self, task: BackgroundTask[Any]) -> None:
+        for index, (waiting, __) in enumerate(self.__waiting):
+            if waiting is task:
+                del self.__waiting[index]
+                break
+        else:
+            for worker in self.__busy:
+                if worker.task is task:
+                    self.__busy.remove(worker)
+                    worker.kill()
+                    break
+        self._finish(task)
+
+    def _close(self) -> None:
+        self.__waiting.clear()
+        for worker in self.__busy:
+            worker.kill()
+        for worker in self.__idle:
+            worker.stop()
+        self.__busy.clear()
+        self.__idle.clear()
+
+    @staticmethod
+    def __receive(worker: _Worker) -> tuple[Any, Optional[tuple[str, Any]]]:
+        """Returns the latest progress and the result or exception received from a
+        worker."""
+        progress = None
+        try:
+            while worker.connection.poll():
+                kind, value = worker.connection.recv()
+                if kind == _PROGRESS:
+                    # Only the latest progress of a task is delivered
+                    progress = value
+                    continue
+                if kind == _ERROR:
+                    value, text = value
+                    value.__cause__ = _RemoteTraceback(text)
+                return progress, (kind, value)
+        except (EOFError, OSError):
+            pass
+        except Exception as ex:  # pylint: disable=broad-except
+            # The return value or exception cannot be unpickled
+            return progress, (_ERROR, ex)
+        return progress, None
+
+    def __dispatch(self) -> None:
+        while self.__waiting and (self.__idle or len(self.__busy) < self.max_workers):
+            task, payload = self.__waiting.popleft()
+            worker = (
+                self.__idle.pop()
+                if self.__idle
+                else _Worker(self.__context, 1 / self.max_rate)
+            )
+            worker.task = task
+            worker.deadline = (
+                float("inf")
+                if task.timeout is None
+                else time.monotonic() + task.timeout
+            )
+            worker.connection.send_bytes(payload)
+            self.__busy.append(worker)
+            task._start()  # pylint: disable=protected-access
+
+
+_executors: dict[tuple[type, int], _TkExecutor] = {}
+
+
+def _handler(
+    controller: ControllerABC, handler: Handler
+) -> Optional[Callable[[Any], Any]]:
+    """Returns the callable of a handler given as a controller method name."""
+    if isinstance(handler, str):
+        return getattr(controller, handler)
+    return handler
+
+
+def background(
+    method: Optional[Callable[..., Any]] = None,
+    *,
+    limit: Optional[int] = None,
+    on_done: Handler = None,
+    on_error: Handler = None,
+    on_progress: Handler = None,
+) -> Any:
+    """Decorates a ``ControllerABC`` method to run it on the ``BackgroundExecutor``
+    of its view, owned by the view. Calling the method returns its
+    ``BackgroundTask``, or None if the limit of pending tasks of the view was
+    reached. A method having a ``task`` parameter is passed its task, to check for
+    cancellation and report progress.
+
+    Example:
+        @background(on_done="show_rows", on_progress="show_progress", limit=1)
+        def load(self, path, task):
+            ...
+
+    Keyword Args:
+        limit: The maximum number of pending tasks of the view (default: None)
+        on_done: The name of a controller method, or a callable, called with the
+            return value on the Tk thread (default: None)
+        on_error: The name of a controller method, or a callable, called with the
+            exception raised on the Tk thread, or None to report it with
+            ``report_callback_exception`` (default: None)
+        on_progress: The name of a controller method, or a callable, called with the
+            latest progress reported on the Tk thread (default: None)
+
+    Returns:
+        The decorated method, or a decorator if no method is given
+
+    """
+
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        pass_task = "task" in inspect.signature(method).parameters
+
+        @functools.wraps(method)
+        def submit(self: ControllerABC, *args: Any, **kwargs: Any) -> Any:
+            view = self.view
+            return BackgroundExecutor.of(view).submit(  # type: ignore[arg-type]
+                method,
+                self,
+                *args,
+                owner=view,  # type: ignore[arg-type]
+                limit=limit,
+                on_done=_handler(self, on_done),
+                on_error=_handler(self, on_error),
+                on_progress=_handler(self, on_progress),
+                pass_task=pass_task,
+                **kwargs,
+            )
+
+        return submit
+
+    if method is not None:
+        return decorator(method)
+    return decorator
+
+
+def offload(
+    function: Callable[..., Any],
+    *,
+    limit: Optional[int] = None,
+    timeout: Optional[float] = None,
+    progressbar: Optional[str] = None,
+    on_done: Handler = None,
+    on_error: Handler = None,
+    on_progress: Handler = None,
+) -> Callable[..., Any]:
+    """Creates a ``ControllerABC`` method running a module level function on the
+    ``ProcessExecutor`` of its view, owned by the view. Calling the method pickles
+    its arguments, passes them to the function in a worker process and returns the
+    ``ProcessTask``, or None if the limit of pending tasks of the view was reached.
+    A function having a ``task`` parameter is passed a ``WorkerTask`` to report
+    progress.
+
+    Example:
+        def parse(path, task):
+            ...
+
+        class Controller(ControllerABC):
+            parse = offload(parse, progressbar="progress", on_done="show_rows")
+
+    Args:
+        function: The function, defined at module level
+
+    Keyword Args:
+        limit: The maximum number of pending tasks of the view (default: None)
+        timeout: The maximum time the task can run in seconds (default: None)
+        progressbar: The name of a progress bar of the view, set to the fractions
+            reported (default: None)
+        on_done: The name of a controller method, or a callable, called with the
+            return value on the Tk thread (default: None)
+        on_error: The name of a controller method, or a callable, called with the
+            exception raised on the Tk thread, or None to report it with
+            ``report_callback_exception`` (default: None)
+        on_progress: The name of a controller method, or a callable, called with the
+            latest progress reported on the Tk thread (default: None)
+
+    Returns:
+        The method
+
+    """
+    pass_task = "task" in inspect.signature(function).parameters
+
+    @functools.wraps(function)
+    def submit(self: ControllerABC, *args: Any, **kwargs: Any) -> Any:
+        view = self.view
+        return ProcessExecutor.of(view).submit(  # type: ignore[arg-type]
+            function,
+            *args,
+            owner=view,  # type: ignore[arg-type]
+            limit=limit,
+            timeout=timeout,
+            progressbar=(
+                None if progressbar is None else view.created[progressbar].widget
+            ),
+            on_done=_handler(self, on_done),
+            on_error=_handler(self, on_error),
+            on_progress=_handler(self, on_progress),
+            pass_task=pass_task,
+            **kwargs,
+        )
+
+    return submit
@@ -13,6 +13,14 @@ class ControllerABC:
 
     Controllers allow for access to created widgets in the view via attribute access.
 
+    Methods can be defined with ``async def``. When called through the call proxies
+    of the view (such as a ``command``), their coroutines are scheduled on the
+    ``tklife.aio.AsyncLoop`` of the view instead of blocking the mainloop, and are
+    cancelled when the view is destroyed. Blocking methods can be decorated with
+    ``tklife.background.background`` to run them on a worker thread instead, and
+    CPU-bound functions can be offloaded to worker processes with
+    ``tklife.background.offload``.
+
     Attributes:
         view (SkeletonProtocol): The view associated with this controller
 
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
+import time
 import tkinter
+from collections import OrderedDict, deque
+from collections.abc import Hashable, MutableMapping
+from tkinter import ttk
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -15,10 +20,13 @@ from typing import (
     TypeVar,
     final,
 )
+from weakref import WeakKeyDictionary
 
 import tklife
 from tklife.controller import ControllerABC
-from tklife.proxy import CallProxyFactory
+from tklife.event import BindingScope, add_bindtag
+from tklife.profiling import ConstructionAggregate, ConstructionStats
+from tklife.proxy import CallProxy, CallProxyFactory
 
 if TYPE_CHECKING:
     from typing import Any, Iterable, NotRequired, Optional, Type, Union
@@ -30,6 +38,8 @@ __all__ = [
     "SkelEventDef",
     "CreatedWidget",
     "CachedWidget",
+    "WidgetCache",
+    "WidgetPool",
     "SkeletonProtocol",
 ]
 
@@ -348,6 +358,340 @@ class CachedWidget(NamedTuple):
     grid_args: Union[dict[str, Any], None]
 
 
+class WidgetCache(MutableMapping[tuple[int, int], CachedWidget]):
+    """Stores cached widgets by (row, column), row by row.
+
+    Behaves like a ``dict[tuple[int, int], CachedWidget]``, iterating in row order, but
+    also tracks the last row and the position of every widget so that appending and
+    looking up rows does not scan every cell.
+
+    Args:
+        items: Initial (row, column) to CachedWidget items
+
+    """
+
+    def __init__(
+        self, items: Iterable[tuple[tuple[int, int], CachedWidget]] = ()
+    ) -> None:
+        self.__rows: dict[int, dict[int, CachedWidget]] = {}
+        self.__positions: dict[int, tuple[int, int]] = {}
+        self.__len = 0
+        self.__max_row = -1
+        for key, value in items:
+            self[key] = value
+
+    @property
+    def max_row(self) -> int:
+        """Returns the index of the last row, or -1 if there are no rows.
+
+        Returns:
+            The last row index
+
+        """
+        return self.__max_row
+
+    def position_of(self, widget: tkinter.Misc) -> Optional[tuple[int, int]]:
+        """Returns the (row, column) of a widget.
+
+        Args:
+            widget: The widget to find
+
+        Returns:
+            The (row, column) of the widget, or None if it is not in the cache
+
+        """
+        return self.__positions.get(id(widget))
+
+    def row(self, row: int) -> dict[int, CachedWidget]:
+        """Returns the cached widgets in a row.
+
+        Args:
+            row: The row index
+
+        Returns:
+            A new dict of column to cached widget, empty if the row does not exist
+
+        """
+        return dict(self.__rows.get(row, {}))
+
+    def delete_row(self, row: int) -> dict[int, CachedWidget]:
+        """Removes a row without shifting the rows after it.
+
+        Args:
+            row: The row index
+
+        Returns:
+            The removed column to cached widget dict, empty if the row did not exist
+
+        """
+        removed = self.__rows.pop(row, {})
+        for col, cached in removed.items():
+            self.__unindex((row, col), cached)
+        self.__len -= len(removed)
+        self.__update_max_row()
+        return removed
+
+    def shift_rows(self, start: int, offset: int) -> list[int]:
+        """Moves every row at or after start by offset rows.
+
+        Args:
+            start: The first row to move
+            offset: The number of rows to move by, negative moves rows up
+
+        Returns:
+            The new indexes of the rows that moved, in ascending order
+
+        Raises:
+            ValueError: Raised when a moved row would replace a row that is not moved
+
+        """
+        if not offset or start > self.__max_row:
+            return []
+        if offset < 0 and any(
+            row in self.__rows for row in range(max(start + offset, 0), start)
+        ):
+            raise ValueError(f"Cannot move rows from {start} by {offset}")
+        rows = range(start, self.__max_row + 1)
+        moved = []
+        for row in reversed(rows) if offset > 0 else rows:
+            columns = self.__rows.pop(row, None)
+            if columns is None:
+                continue
+            self.__rows[row + offset] = columns
+            for col, cached in columns.items():
+                if cached.widget is not None:
+                    self.__positions[id(cached.widget)] = (row + offset, col)
+            moved.append(row + offset)
+        self.__max_row += offset
+        return sorted(moved)
+
+    def renumber_rows(self, mapping: dict[int, int]) -> list[int]:
+        """Moves rows to new indexes all at once.
+
+        Args:
+            mapping: The new index of each row to move, keyed by its current index.
+                Rows that do not exist are ignored.
+
+        Returns:
+            The new indexes of the rows that moved, in ascending order
+
+        Raises:
+            ValueError: Raised when two rows would move to the same index, or a row
+                would replace a row that is not moved
+
+        """
+        mapping = {old: new for old, new in mapping.items() if old in self.__rows}
+        targets = set(mapping.values())
+        if len(targets) != len(mapping) or any(
+            target in self.__rows and target not in mapping for target in targets
+        ):
+            raise ValueError(f"Cannot renumber rows using {mapping}")
+        detached = {new: self.__rows.pop(old) for old, new in mapping.items()}
+        for row, columns in detached.items():
+            self.__rows[row] = columns
+            for col, cached in columns.items():
+                if cached.widget is not None:
+                    self.__positions[id(cached.widget)] = (row, col)
+        self.__max_row = max(self.__max_row, *targets) if targets else self.__max_row
+        self.__update_max_row()
+        return sorted(targets)
+
+    def __unindex(self, key: tuple[int, int], cached: CachedWidget) -> None:
+        if cached.widget is not None and self.__positions.get(id(cached.widget)) == key:
+            del self.__positions[id(cached.widget)]
+
+    def __update_max_row(self) -> None:
+        while self.__max_row >= 0 and self.__max_row not in self.__rows:
+            self.__max_row -= 1
+
+    def __getitem__(self, key: tuple[int, int]) -> CachedWidget:
+        row, col = key
+        try:
+            return self.__rows[row][col]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: tuple[int, int], value: CachedWidget) -> None:
+        row, col = key
+        columns = self.__rows.setdefault(row, {})
+        previous = columns.get(col)
+        if previous is None:
+            self.__len += 1
+        else:
+            self.__unindex(key, previous)
+        columns[col] = value
+        if value.widget is not None:
+            self.__positions[id(value.widget)] = (row, col)
+        if row > self.__max_row:
+            self.__max_row = row
+
+    def __delitem__(self, key: tuple[int, int]) -> None:
+        row, col = key
+        try:
+            previous = self.__rows[row].pop(col)
+        except KeyError:
+            raise KeyError(key) from None
+        self.__unindex(key, previous)
+        self.__len -= 1
+        if not self.__rows[row]:
+            del self.__rows[row]
+            self.__update_max_row()
+
+    def __iter__(self):
+        for row in sorted(self.__rows):
+            for col in self.__rows[row]:
+                yield row, col
+
+    def __len__(self) -> int:
+        return self.__len
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            row, col = key  # type: ignore[misc]
+        except (TypeError, ValueError):
+            return False
+        return col in self.__rows.get(row, ())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+_CREATE_ONLY_OPTIONS = frozenset(
+    {"class", "class_", "colormap", "container", "screen", "use", "visual"}
+)
+"""Widget options that can only be set when the widget is created."""
+
+
+class WidgetPool:
+    """Parks the widgets of destroyed rows so that new rows can reuse them instead of
+    creating new Tk widgets.
+
+    Only stock tkinter and ttk widgets are pooled. A parked widget is reused for a
+    cell with the same widget class, the same init and config argument names and the
+    same creation-only options, and is reconfigured with the init arguments of the
+    new cell. State that is not set by options, such as the text of an Entry without
+    a textvariable or bindings added to the widget, is kept.
+
+    Args:
+        maxsize: The maximum number of parked widgets. When exceeded, the least
+            recently parked widget is destroyed.
+
+    Attributes:
+        maxsize: The maximum number of parked widgets
+        hits: The number of widgets reused
+        misses: The number of poolable widgets that had to be created
+        evictions: The number of parked widgets destroyed to respect maxsize
+
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__parked: OrderedDict[tkinter.Widget, Hashable] = OrderedDict()
+        self.__by_key: dict[Hashable, deque[tkinter.Widget]] = {}
+
+    @staticmethod
+    def key_of(
+        widget_class: Any, init_args: dict[str, Any], config_names: Iterable[str]
+    ) -> Optional[Hashable]:
+        """Returns the pool key of a widget to create.
+
+        Args:
+            widget_class: The class of the widget
+            init_args: The init arguments of the widget
+            config_names: The names of the config arguments of the widget
+
+        Returns:
+            The key, or None if the widget cannot be pooled
+
+        """
+        if _bulk_command(widget_class) is None:
+            return None
+        key = (
+            widget_class,
+            tuple(sorted(init_args)),
+            tuple(sorted(config_names)),
+            tuple(
+                (name, value)
+                for name, value in sorted(init_args.items())
+                if name in _CREATE_ONLY_OPTIONS
+            ),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def acquire(self, key: Hashable) -> Optional[tkinter.Widget]:
+        """Takes the most recently parked widget having the given key out of the
+        pool.
+
+        Args:
+            key: The key returned by ``key_of``
+
+        Returns:
+            The parked widget, or None if there is none
+
+        """
+        widgets = self.__by_key.get(key)
+        if not widgets:
+            self.misses += 1
+            return None
+        widget = widgets.pop()
+        if not widgets:
+            del self.__by_key[key]
+        del self.__parked[widget]
+        self.hits += 1
+        return widget
+
+    def release(self, widget: tkinter.Widget) -> bool:
+        """Removes a widget from the grid and parks it.
+
+        Args:
+            widget: The widget to park
+
+        Returns:
+            True if the widget was parked, False if it cannot be pooled and should be
+            destroyed by the caller
+
+        """
+        key = getattr(widget, "__pool_key__", None)
+        if key is None or self.maxsize <= 0:
+            return False
+        widget.grid_remove()
+        self.__parked[widget] = key
+        self.__by_key.setdefault(key, deque()).append(widget)
+        while len(self.__parked) > self.maxsize:
+            self.__evict()
+        return True
+
+    def clear(self) -> None:
+        """Destroys every parked widget."""
+        while self.__parked:
+            self.__evict()
+
+    def __evict(self) -> None:
+        widget, key = self.__parked.popitem(last=False)
+        widgets = self.__by_key[key]
+        widgets.popleft()
+        if not widgets:
+            del self.__by_key[key]
+        widget.destroy()
+        self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self.__parked)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(maxsize={self.maxsize}, parked={len(self)}, "
+            f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+        )
+
+
 class SkeletonProtocol(Protocol):
     """Protocol for SkeletonMixin."""
 
@@ -379,18 +723,218 @@ class SkeletonProtocol(Protocol):
         """Binds events to widgets."""
 
     created: CreatedWidgetDict
+    widget_pool: Optional[WidgetPool]
     _global_gridargs: dict[str, Any]
-    _w_cache: dict[tuple[int, int], CachedWidget]
+    _w_cache: WidgetCache
 
     @property
-    def widget_cache(self) -> dict[tuple[int, int], CachedWidget]:
+    def widget_cache(self) -> WidgetCache:
         """Stores the widgets created as well as grid cooridates and arguments."""
 
 
+class _PlannedCell(NamedTuple):
+    """A single template cell with its arguments pre-sorted for replay."""
+
+    row: int
+    column: int
+    widget: Optional[Type[tkinter.Widget]]
+    init_args: dict[str, Any]
+    init_factories: tuple[tuple[str, Callable[[], Any]], ...]
+    config_args: dict[str, Any]
+    config_factories: tuple[tuple[str, Callable[[], Any]], ...]
+    grid_args: dict[str, Any]
+    label: Optional[str]
+    source: Optional[SkelWidget] = None
+
+    @classmethod
+    def compile(
+        cls, skel_widget: SkelWidget | None, row: int, column: int
+    ) -> _PlannedCell:
+        """Splits the arguments of a SkelWidget into static values and factories
+        (classes, such as ``tkinter.StringVar``) that must be called per instance."""
+        if skel_widget is None:
+            return cls(row, column, None, {}, (), {}, (), {}, None)
+        init_args, init_factories = _split_factories(skel_widget.init_args)
+        config_args, config_factories = _split_factories(skel_widget.config_args)
+        return cls(
+            row,
+            column,
+            skel_widget.widget,
+            init_args,
+            init_factories,
+            config_args,
+            config_factories,
+            skel_widget.grid_args,
+            skel_widget.label,
+            skel_widget,
+        )
+
+    def resolve_init_args(self) -> dict[str, Any]:
+        """Returns the init arguments with factories called."""
+        if not self.init_factories:
+            return self.init_args
+        return {**self.init_args, **{k: f() for k, f in self.init_factories}}
+
+    def resolve_config_args(self) -> dict[str, Any]:
+        """Returns the config arguments with factories called."""
+        if not self.config_factories:
+            return self.config_args
+        return {**self.config_args, **{k: f() for k, f in self.config_factories}}
+
+
+def _split_factories(
+    args: dict[str, Any],
+) -> tuple[dict[str, Any], tuple[tuple[str, Callable[[], Any]], ...]]:
+    static = {k: v for k, v in args.items() if not isinstance(v, type)}
+    factories = tuple((k, v) for k, v in args.items() if isinstance(v, type))
+    return static, factories
+
+
+class _TemplatePlan:
+    """A template compiled into a flat sequence of cells.
+
+    Args:
+        template: The template to compile, as returned by ``SkeletonMixin.template``
+
+    """
+
+    cells: tuple[_PlannedCell, ...]
+
+    def __init__(self, template: Iterable[Iterable[SkelWidget | None]]) -> None:
+        self.cells = tuple(
+            _PlannedCell.compile(skel_widget, row_index, col_index)
+            for row_index, row in enumerate(template)
+            for col_index, skel_widget in enumerate(row)
+        )
+        self.__global_grid_args: Optional[dict[str, Any]] = None
+        self.__merged_grid_args: tuple[dict[str, Any], ...] = ()
+
+    def merged_grid_args(
+        self, global_grid_args: dict[str, Any]
+    ) -> tuple[dict[str, Any], ...]:
+        """Returns the grid arguments of every cell merged with the global grid
+        arguments. The result is reused while the global grid arguments are equal.
+
+        Args:
+            global_grid_args: The global grid arguments of the skeleton
+
+        Returns:
+            Grid arguments for each cell, in the same order as ``cells``
+
+        """
+        if self.__global_grid_args != global_grid_args:
+            self.__merged_grid_args = tuple(
+                {**global_grid_args, **cell.grid_args} for cell in self.cells
+            )
+            self.__global_grid_args = dict(global_grid_args)
+        return self.__merged_grid_args
+
+
+_BULK_COMMANDS: dict[type, str] = {
+    **{
+        widget_class: widget_class.__name__.lower()
+        for widget_class in (
+            tkinter.Button,
+            tkinter.Canvas,
+            tkinter.Checkbutton,
+            tkinter.Entry,
+            tkinter.Frame,
+            tkinter.Label,
+            tkinter.LabelFrame,
+            tkinter.Listbox,
+            tkinter.Message,
+            tkinter.Radiobutton,
+            tkinter.Scale,
+            tkinter.Scrollbar,
+            tkinter.Spinbox,
+            tkinter.Text,
+        )
+    },
+    **{
+        widget_class: f"ttk::{widget_class.__name__.lower()}"
+        for widget_class in (
+            ttk.Button,
+            ttk.Checkbutton,
+            ttk.Combobox,
+            ttk.Entry,
+            ttk.Frame,
+            ttk.Label,
+            ttk.Labelframe,
+            ttk.Menubutton,
+            ttk.Notebook,
+            ttk.Panedwindow,
+            ttk.Progressbar,
+            ttk.Radiobutton,
+            ttk.Scale,
+            ttk.Scrollbar,
+            ttk.Separator,
+            ttk.Sizegrip,
+            ttk.Spinbox,
+            ttk.Treeview,
+        )
+    },
+}
+"""Widget classes that can be created by a Tcl script, and their Tcl commands."""
+
+_BULK_STEP_VAR = "tklife_bulk_step"
+
+
+def _direct_options(options: dict[str, Any]) -> dict[str, Any]:
+    """Returns options with the call proxies that have a target replaced by it."""
+    if not any(
+        isinstance(value, CallProxy) and value.target is not None
+        for value in options.values()
+    ):
+        return options
+    return {
+        option: (
+            value.target
+            if isinstance(value, CallProxy) and value.target is not None
+            else value
+        )
+        for option, value in options.items()
+    }
+
+
+def _bulk_command(widget_class: type) -> Optional[str]:
+    """Returns the Tcl command that creates ``widget_class``, or None when the class
+    (or a subclass overriding ``__init__``, ``configure`` or ``grid_configure``)
+    cannot be created without running its Python constructor."""
+    if not isinstance(widget_class, type):
+        return None
+    for base in widget_class.__mro__:
+        command = _BULK_COMMANDS.get(base)
+        if command is None:
+            continue
+        if (
+            widget_class.__init__ is base.__init__
+            and widget_class.configure is base.configure
+            and widget_class.grid_configure is tkinter.Grid.grid_configure
+        ):
+            return command
+        return None
+    return None
+
+
+def _tcl_command(*words: Any) -> str:
+    """Returns a Tcl command with every word quoted."""
+    return " ".join(
+        tkinter._stringify(word) for word in words  # pylint: disable=protected-access
+    )
+
+
+def _untimed(__name: str) -> contextlib.AbstractContextManager[None]:
+    return contextlib.nullcontext()
+
+
 class _SkeletonMeta(type):
     def __new__(mcs, name, bases: tuple[type, ...], namespace):
         if Generic not in bases and len(bases) > 1 and bases[0] != SkeletonMixin:
             raise TypeError(f"{SkeletonMixin} should be first base class")
+        # Every class gets its own plan and stats slots so subclasses never replay
+        # the template of, or add stats to, their parent
+        namespace["_template_plan"] = None
+        namespace["_construction_aggregate"] = None
         return super().__new__(mcs, name, bases, namespace)
 
 
@@ -422,13 +966,47 @@ class SkeletonMixin(_Skel):
     Attributes:
         created: The created widgets
         assigned_events: The assigned events
+        cache_template: Set to True on a subclass to compile the template once per
+            class and replay it for every instance. Only use this when the template
+            does not depend on instance state (such as ``self.controller`` or bound
+            methods), since the template is evaluated once, on the first instance.
+        bulk_create: Set to ``"template"`` or ``"row"`` on a subclass to create,
+            configure and grid stock tkinter and ttk widgets with a single Tcl script
+            per template or per row. Other widgets are created as usual. Overrides of
+            ``_widget_create`` and ``_grid_widget`` are not called for widgets
+            created by script.
+        profile_construction: Set to True on a subclass to record the wall time of
+            each construction phase in ``construction_stats``, and aggregate them per
+            class in ``construction_aggregate()``.
+        construction_stats: The construction stats of this instance, or None if
+            ``profile_construction`` is not set. Cells created by a bulk script are not
+            timed individually.
+        widget_pool_size: Set to a positive number on a subclass to park the widgets
+            of destroyed rows in ``widget_pool`` and reuse them for new rows, instead
+            of destroying them.
+        widget_pool: The widget pool of this instance, or None if
+            ``widget_pool_size`` is not set.
+        direct_commands: Set to True on a subclass to make widget options set to
+            controller call proxies (such as ``command=self.controller.save``)
+            call the controller method directly once the controller is assigned,
+            skipping the proxy. Only use this when the controller is assigned once.
 
     """
 
     created: CreatedWidgetDict
     assigned_events: dict[str, TkEventId]
+    cache_template: bool = False
+    bulk_create: Optional[Literal["template", "row"]] = None
+    profile_construction: bool = False
+    construction_stats: Optional[ConstructionStats]
+    widget_pool_size: int = 0
+    widget_pool: Optional[WidgetPool]
+    direct_commands: bool = False
+    _template_plan: Optional[_TemplatePlan]
+    _construction_aggregate: Optional[ConstructionAggregate]
     _global_gridargs: dict[str, Any]
-    _w_cache: dict[tuple[int, int], CachedWidget]
+    _w_cache: WidgetCache
+    _created_labels: dict[int, str]
 
     def __init__(
         self,
@@ -440,26 +1018,71 @@ class SkeletonMixin(_Skel):
     ) -> None:
         # Set the controller first
         self.__controller = None
-        if controller is None:
-            self.__proxy_factory = (
-                CallProxyFactory(self) if proxy_factory is None else proxy_factory
-            )
-        else:
+        self.__binding_scope: Optional[BindingScope] = None
+        self.__proxied_options: WeakKeyDictionary[
+            tkinter.Misc, dict[str, CallProxy]
+        ] = WeakKeyDictionary()
+        self.__proxy_factory = (
+            CallProxyFactory(self) if proxy_factory is None else proxy_factory
+        )
+        if controller is not None:
             self.controller = controller
 
-        self.__before_init__()
+        stats = ConstructionStats() if self.profile_construction else None
+        self.construction_stats = stats
+        phase = stats.phase if stats is not None else _untimed
+
+        with phase("before_init"):
+            self.__before_init__()
         # Init the frame or the menu mixin... or not
-        super().__init__(master=master, **kwargs)  # type: ignore
-        self.__after_init__()
+        with phase("init"):
+            super().__init__(master=master, **kwargs)  # type: ignore
+        with phase("after_init"):
+            self.__after_init__()
 
         self.created: CreatedWidgetDict = {}
         self.assigned_events = {}
         self._global_gridargs = global_grid_args if global_grid_args else {}
-        self._w_cache = {}
-        self._create_all()
-        self._grid_config()
-        self.__after_widgets__()
-        self._create_events()
+        self._w_cache = WidgetCache()
+        self._created_labels = {}
+        self.widget_pool = (
+            WidgetPool(self.widget_pool_size) if self.widget_pool_size > 0 else None
+        )
+        with phase("create_all"):
+            self._create_all()
+        with phase("grid_config"):
+            self._grid_config()
+        with phase("after_widgets"):
+            self.__after_widgets__()
+        with phase("create_events"):
+            self._create_events()
+        if stats is not None:
+            self.construction_aggregate().add(stats)
+
+    @classmethod
+    def construction_aggregate(cls) -> ConstructionAggregate:
+        """Returns the aggregated construction stats of every instance of this class
+        created while ``profile_construction`` was set.
+
+        Returns:
+            The construction aggregate of this class
+
+        """
+        if cls._construction_aggregate is None:
+            cls._construction_aggregate = ConstructionAggregate()
+        return cls._construction_aggregate
+
+    def _add_created(self, label: str, created: CreatedWidget) -> None:
+        """Stores a created widget by label."""
+        self.created[label] = created
+        self._created_labels[id(created.widget)] = label
+
+    def _forget_created(self, widget: tkinter.Misc) -> None:
+        """Removes the created widget entry of a widget, if it has one."""
+        label = self._created_labels.pop(id(widget), None)
+        if label is not None and label in self.created:
+            if self.created[label].widget is widget:
+                del self.created[label]
 
     def __before_init__(self):
         """Hook that is called immediately before super().__init__ is called."""
@@ -510,7 +1133,7 @@ class SkeletonMixin(_Skel):
 
     @property
     @final
-    def widget_cache(self) -> dict[tuple[int, int], CachedWidget]:
+    def widget_cache(self) -> WidgetCache:
         """Stores the widgets created as well as grid cooridates and arguments (rows,
         cols). **Do not override this property**.
 
@@ -522,59 +1145,254 @@ class SkeletonMixin(_Skel):
 
     def _widget_create(self, skel_widget, row_index, col_index):
         """Creates a widget."""
-        if skel_widget is None:
+        return self._create_planned(
+            _PlannedCell.compile(skel_widget, row_index, col_index)
+        )
+
+    def _create_planned(self, cell: _PlannedCell) -> tkinter.Widget | None:
+        """Creates the widget of a compiled template cell."""
+        row_index, col_index = cell.row, cell.column
+        if cell.widget is None:
             self._w_cache[(row_index, col_index)] = CachedWidget(None, None)
             return None
         try:
-            for arg, val in skel_widget.init_args.items():
-                if isinstance(val, type(tkinter.Variable)):
-                    skel_widget.init_args[arg] = val()
-            w = skel_widget.widget(self, **skel_widget.init_args)
-            if "image" in skel_widget.init_args:
-                w.__image__ = skel_widget.init_args["image"]
+            init_args = cell.resolve_init_args()
+            if self.direct_commands:
+                init_args = _direct_options(init_args)
+            w = self._pooled_widget(cell, init_args)
+            if w is None:
+                w = cell.widget(self, **init_args)
+            if "image" in init_args:
+                w.__image__ = init_args["image"]
         except Exception as ex:
             raise ValueError(
                 f"Error initializing widget at row {row_index}, column {col_index}: "
                 f"{ex}"
             ) from ex
         try:
-            for arg, val in skel_widget.config_args.items():
-                if isinstance(val, type(tkinter.Variable)):
-                    skel_widget.config_args[arg] = val()
-            w.configure(**skel_widget.config_args)
-            if "image" in skel_widget.config_args:
-                w.__image__ = skel_widget.config_args["image"]
+            config_args = cell.resolve_config_args()
+            if self.direct_commands:
+                config_args = _direct_options(config_args)
+                self.__track_proxied_options(w, init_args, config_args)
+            w.configure(**config_args)
+            if "image" in config_args:
+                w.__image__ = config_args["image"]
         except Exception as ex:
             raise ValueError(
                 f"Error configuring widget at row {row_index}, column {col_index}: "
                 f"{ex}"
             ) from ex
 
-        if skel_widget.label is not None:
+        if cell.label is not None:
             # And what is the vardict?
             vardict = {
                 arg: val
-                for arg, val in (
-                    {**skel_widget.init_args, **skel_widget.config_args}.items()
-                )
+                for arg, val in ({**init_args, **config_args}.items())
                 if isinstance(val, tkinter.Variable)
             }
 
             # Widgets!
-            self.created[skel_widget.label] = CreatedWidget(widget=w, **vardict)
+            self._add_created(cell.label, CreatedWidget(widget=w, **vardict))
         return w
 
+    def _pooled_widget(
+        self, cell: _PlannedCell, init_args: dict[str, Any]
+    ) -> tkinter.Widget | None:
+        """Reuses a parked widget for a cell, or returns None if the widget must be
+        created. Widgets that must be created are tagged with their pool key."""
+        pool = self.widget_pool
+        if pool is None:
+            return None
+        key = pool.key_of(
+            cell.widget,
+            init_args,
+            [*cell.config_args, *(name for name, __ in cell.config_factories)],
+        )
+        if key is None:
+            return None
+        w = pool.acquire(key)
+        if w is None:
+            w = cell.widget(self, **init_args)  # type: ignore[misc]
+            w.__pool_key__ = key  # type: ignore[attr-defined]
+            return w
+        w.configure(
+            **{k: v for k, v in init_args.items() if k not in _CREATE_ONLY_OPTIONS}
+        )
+        return w
+
+    def __track_proxied_options(
+        self, widget: tkinter.Misc, *option_dicts: dict[str, Any]
+    ) -> None:
+        """Remembers the options of a widget set to call proxies that could not call
+        the controller directly yet, to rewrite them when it is assigned."""
+        proxied = {
+            option: value
+            for options in option_dicts
+            for option, value in options.items()
+            if isinstance(value, CallProxy)
+        }
+        if proxied:
+            self.__proxied_options[widget] = proxied
+        else:
+            # Pooled widgets can be reused without proxies
+            self.__proxied_options.pop(widget, None)
+
+    def __direct_proxied_options(self) -> None:
+        """Rewrites the options set to call proxies to call the controller
+        directly."""
+        proxied = self.__proxied_options
+        self.__proxied_options = WeakKeyDictionary()
+        for widget, options in proxied.items():
+            for option, proxy in options.items():
+                if proxy.target is None:
+                    continue
+                try:
+                    previous = str(widget.cget(option))
+                    widget.configure({option: proxy.target})
+                    widget.deletecommand(previous)
+                except tkinter.TclError:
+                    # The widget was destroyed
+                    break
+
+    def _compile_template(self) -> _TemplatePlan:
+        """Returns the compiled template, reusing the class plan if
+        ``cache_template`` is set."""
+        cls = type(self)
+        if not cls.cache_template:
+            return _TemplatePlan(self.template)
+        if cls._template_plan is None:
+            cls._template_plan = _TemplatePlan(self.template)
+        return cls._template_plan
+
     def _create_all(self):
         """Creates all the widgets in template."""
-        global_grid_args = self._global_gridargs
-        for row_index, row in enumerate(self.template):
-            for col_index, skel_widget in enumerate(row):
-                w = self._widget_create(skel_widget, row_index, col_index)
-                if w is None:
-                    continue
-                self._grid_widget(
-                    row_index, col_index, w, **global_grid_args, **skel_widget.grid_args
+        plan = self._compile_template()
+        cells = zip(plan.cells, plan.merged_grid_args(self._global_gridargs))
+        if self.bulk_create is not None:
+            self._bulk_create_all(cells)
+            return
+        stats = self.construction_stats
+        for cell, grid_args in cells:
+            if stats is None:
+                self._create_cell(cell, grid_args)
+                continue
+            start = time.perf_counter()
+            self._create_cell(cell, grid_args)
+            stats.add_cell(
+                cell.row, cell.column, cell.label, time.perf_counter() - start
+            )
+
+    def _create_cell(self, cell: _PlannedCell, grid_args: dict[str, Any]) -> None:
+        """Creates and grids the widget of a compiled template cell."""
+        if type(self)._widget_create is SkeletonMixin._widget_create:
+            w = self._create_planned(cell)
+        else:
+            # Subclasses overriding _widget_create get the cells of the template
+            w = self._widget_create(cell.source, cell.row, cell.column)
+        if w is not None:
+            self._grid_widget(cell.row, cell.column, w, **grid_args)
+
+    def _bulk_create_all(
+        self, cells: Iterable[tuple[_PlannedCell, dict[str, Any]]]
+    ) -> None:
+        """Creates the widgets of the template using one Tcl script per template or
+        per row (see ``bulk_create``)."""
+        script: list[str] = []
+        pending: list[tuple[_PlannedCell, tkinter.Widget, dict[str, Any]]] = []
+        current_row = 0
+        for cell, grid_args in cells:
+            if self.bulk_create == "row" and cell.row != current_row:
+                self._bulk_flush(script, pending)
+                current_row = cell.row
+            if cell.widget is None:
+                self._w_cache[(cell.row, cell.column)] = CachedWidget(None, None)
+                continue
+            command = _bulk_command(cell.widget)
+            if command is None:
+                # Keep the creation order (and thus stacking order) of the template
+                self._bulk_flush(script, pending)
+                self._create_cell(cell, grid_args)
+                continue
+            pending.append(
+                (
+                    cell,
+                    self._bulk_script_cell(script, command, cell, grid_args),
+                    grid_args,
                 )
+            )
+        self._bulk_flush(script, pending)
+
+    def _bulk_script_cell(
+        self,
+        script: list[str],
+        command: str,
+        cell: _PlannedCell,
+        grid_args: dict[str, Any],
+    ) -> tkinter.Widget:
+        """Creates the Python wrapper of a widget without creating the Tk widget and
+        appends the Tcl commands that create, configure and grid it to script."""
+        # pylint: disable=protected-access
+        w = cell.widget.__new__(cell.widget)  # type: ignore[union-attr]
+        w.widgetName = command
+        init_args = dict(cell.resolve_init_args())
+        w._setup(self, init_args)
+        w._tclCommands = []
+        config_args = cell.resolve_config_args()
+        if self.direct_commands:
+            init_args = _direct_options(init_args)
+            config_args = _direct_options(config_args)
+            self.__track_proxied_options(w, init_args, config_args)
+        position = f"{cell.row} {cell.column}"
+        script.append(f"set {_BULK_STEP_VAR} {{initializing {position}}}")
+        script.append(_tcl_command(command, w._w, *w._options(init_args)))
+        if config_args:
+            script.append(f"set {_BULK_STEP_VAR} {{configuring {position}}}")
+            script.append(_tcl_command(w._w, "configure", *w._options(config_args)))
+        script.append(f"set {_BULK_STEP_VAR} {{gridding {position}}}")
+        script.append(
+            _tcl_command(
+                "grid",
+                "configure",
+                w._w,
+                *w._options({"row": cell.row, "column": cell.column, **grid_args}),
+            )
+        )
+        for args in (init_args, config_args):
+            if "image" in args:
+                w.__image__ = args["image"]
+        if cell.label is not None:
+            self._add_created(
+                cell.label,
+                CreatedWidget(
+                    widget=w,
+                    **{
+                        arg: val
+                        for arg, val in {**init_args, **config_args}.items()
+                        if isinstance(val, tkinter.Variable)
+                    },
+                ),
+            )
+        return w
+
+    def _bulk_flush(
+        self,
+        script: list[str],
+        pending: list[tuple[_PlannedCell, tkinter.Widget, dict[str, Any]]],
+    ) -> None:
+        """Evaluates the pending script and caches the widgets it created."""
+        if not script:
+            return
+        try:
+            self.tk.eval("\n".join(script))
+        except tkinter.TclError as ex:
+            phase, row, column = str(self.tk.getvar(_BULK_STEP_VAR)).split()
+            raise ValueError(
+                f"Error {phase} widget at row {row}, column {column}: {ex}"
+            ) from ex
+        for cell, w, grid_args in pending:
+            self._w_cache[cell.row, cell.column] = CachedWidget(w, grid_args)
+        script.clear()
+        pending.clear()
 
     def _grid_config(self):
         """Configures the grid."""
@@ -605,9 +1423,99 @@ class SkeletonMixin(_Skel):
             add = event_def.pop("add", "")
             id_ = event_def.pop("id", None)
             handle = bind_method(widget, **event_def, add=add)
+            self.binding_scope.track(
+                event_object, widget, handle, event_def.get("classname")
+            )
             if id_:
                 self.assigned_events[id_] = (event_object, handle)
 
+    @property
+    def binding_scope(self) -> BindingScope:
+        """Returns the binding scope of this widget, created on first use. The
+        ``events`` are bound through it, so bindings on other widgets (such as the
+        toplevel) are released when this widget is destroyed.
+
+        Returns:
+            The binding scope
+
+        """
+        if self.__binding_scope is None:
+            self.__binding_scope = BindingScope(self)  # type: ignore
+        return self.__binding_scope
+
+    def group_tag(self, name: str) -> str:
+        """Returns the bindtag of a named group of widgets of this instance.
+
+        Args:
+            name: The name of the group
+
+        Returns:
+            The bindtag
+
+        """
+        return f"{name}@{self}"
+
+    def add_to_group(
+        self, name: str, widgets: Optional[Iterable[tkinter.Misc]] = None
+    ) -> None:
+        """Adds widgets to a named group, so callbacks bound with ``bind_group`` are
+        called for their events. Widgets already in the group are left as is.
+
+        Args:
+            name: The name of the group
+
+        Keyword Args:
+            widgets: The widgets to add, or None for every widget in the widget cache
+                (default: None)
+
+        """
+        if widgets is None:
+            widgets = (c.widget for c in self._w_cache.values())
+        add_bindtag(self.group_tag(name), (w for w in widgets if w is not None))
+
+    def add_row_to_group(self, name: str, row: int) -> None:
+        """Adds the widgets of a row to a named group, such as after appending it.
+
+        Args:
+            name: The name of the group
+            row: The row index
+
+        """
+        self.add_to_group(name, (c.widget for c in self._w_cache.row(row).values()))
+
+    def bind_group(
+        self,
+        name: str,
+        event: tklife.event.BaseEvent,
+        action: Callable[[Any, Optional[tuple[int, int]]], Any],
+        **kwargs: Any,
+    ) -> str:
+        """Binds a callback once for the events of every widget of a named group. The
+        binding is kept in ``binding_scope``, and does not grow with the number of
+        widgets in the group. Other keyword arguments are passed to
+        ``BaseEvent.bind``.
+
+        Args:
+            name: The name of the group
+            event: The event to bind
+            action: Called with the event and the (row, column) of the widget it
+                happened on in the widget cache, or None if the widget is not cached
+
+        Returns:
+            The event callback id
+
+        """
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            kwargs["fields"] = ("widget", *(f for f in fields if f != "widget"))
+
+        def group_action(group_event: Any) -> Any:
+            return action(group_event, self._w_cache.position_of(group_event.widget))
+
+        return self.binding_scope.bind(
+            event, self, group_action, classname=self.group_tag(name), **kwargs
+        )
+
     @property
     def controller(self) -> Union[CallProxyFactory, ControllerABC]:
         """Returns the controller or a call proxy factory that will call controller
@@ -633,3 +1541,6 @@ class SkeletonMixin(_Skel):
         self.__controller = controller
         if controller is not None:
             controller.set_view(self)
+        self.__proxy_factory.set_controller(controller)
+        if controller is not None and self.direct_commands:
+            self.__direct_proxied_options()
@@ -3,37 +3,56 @@ appended or removed from them dynamically."""
 
 from __future__ import annotations
 
+import bisect
 import tkinter
-from functools import reduce
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, TypeVar
 
-from tklife.core import CachedWidget
+from tklife.core import _CREATE_ONLY_OPTIONS
+from tklife.event import TkEvent
 
 if TYPE_CHECKING:
-    from typing import Any, Iterable, Union
+    from collections.abc import Hashable
+    from typing import Any, Iterable, Optional, Union
 
-    from tklife.core import CreatedWidgetDict, SkelWidget
+    from tklife.core import (
+        CachedWidget,
+        CreatedWidgetDict,
+        SkelWidget,
+        WidgetCache,
+        WidgetPool,
+    )
+
+T = TypeVar("T")
 
 
 class AppendableMixin:
     """Mixin to allow for rows to be appended to and removed from a widget.
 
-    Must appear after SkeletonMixin, but before the tkinter Widget.
+    Must appear after SkeletonMixin, but before the tkinter Widget. Set
+    ``widget_pool_size`` to reuse the widgets of destroyed rows for new rows.
 
     """
 
     created: CreatedWidgetDict
+    widget_pool: Optional[WidgetPool]
     _global_gridargs: dict[str, Any]
-    _w_cache: dict[tuple[int, int], CachedWidget]
+    _w_cache: WidgetCache
     _widget_create: Callable[[SkelWidget | None, int, int], tkinter.Widget | None]
-    _grid_widget: Callable[[int, int, tkinter.Widget | None], None]
+    _grid_widget: Callable[..., None]
+    _forget_created: Callable[[tkinter.Misc], None]
+
+    def __init__(self, master: Optional[tkinter.Misc] = None, **kwargs: Any) -> None:
+        super().__init__(master=master, **kwargs)  # type: ignore
+        # The first widget of each reconciled row and its record, by key
+        self.__keyed_rows: dict[Hashable, tuple[tkinter.Widget, Any]] = {}
+        self.__widget_keys: dict[int, Hashable] = {}
 
     @property
-    def widget_cache(self) -> dict[tuple[int, int], CachedWidget]:
+    def widget_cache(self) -> WidgetCache:
         """Stores the widgets created as well as grid cooridates and arguments.
 
         Returns:
-            dict[tuple[int, int], CachedWidget]: Widget cache
+            WidgetCache: Widget cache
 
         """
         # Use the super's widget cache. This mixin is only used with SkeletonMixin, so
@@ -53,26 +72,30 @@ class AppendableMixin:
             int: The new row index
 
         """
-        # Find last row in cache and add 1 for new row
-        max_row = -1
-        for row, __ in self._w_cache:
-            if row > max_row:
-                max_row = row
-        new_row = max_row + 1
+        return self.append_rows((widget_row,))[0]
+
+    def append_rows(
+        self, widget_rows: Iterable[Iterable[Union[SkelWidget, None]]]
+    ) -> list[int]:
+        """Appends many rows.
 
-        # Create the widgets in the row
-        for col_index, skel_widget in enumerate(widget_row):
-            if w := self._widget_create(skel_widget, new_row, col_index):
-                self._grid_widget(
-                    new_row,
-                    col_index,
-                    w,
-                    **self._global_gridargs,
-                    # Ignore the typing error because we have already checked for None
-                    **skel_widget.grid_args,  # type: ignore
-                )
+        Args:
+            widget_rows (Iterable[Iterable[Union[SkelWidget, None]]]): The rows of
+                widgets to append
 
-        return new_row
+        Raises:
+            TypeError: Raised when a row is not iterable
+
+        Returns:
+            list[int]: The new row indexes
+
+        """
+        new_rows = []
+        for new_row, widget_row in enumerate(widget_rows, self._w_cache.max_row + 1):
+            for col_index, skel_widget in enumerate(widget_row):
+                self._create_cell_at(new_row, col_index, skel_widget)
+            new_rows.append(new_row)
+        return new_rows
 
     def insert_row_at(
         self, index: int, widget_row: Iterable[Union[SkelWidget, None]]
@@ -91,46 +114,53 @@ class AppendableMixin:
             int: The new row index
 
         """
-        if index == 1 + reduce(
-            lambda carry, value: max(carry, value[0]), self.widget_cache.keys(), 0
-        ):
+        if index == self._w_cache.max_row + 1:
             self.append_row(widget_row)
-        else:
-            i_row = iter(widget_row)
-            for (row, col), (widget, grid_args) in tuple(self._w_cache.items()):
-                if row < index:
-                    continue
-                if row == index:
-                    # Make the insert
-                    skel_widget = next(i_row)
-                    if new_widget := self._widget_create(skel_widget, row, col):
-                        self._grid_widget(
-                            row,
-                            col,
-                            new_widget,
-                            **self._global_gridargs,
-                            # Ignore the typing error because we have already checked
-                            # for None (This check was done in __widget_create)
-                            **skel_widget.grid_args,  # type: ignore
-                        )
-                    else:
-                        self._w_cache[row, col] = CachedWidget(None, None)
-                    if widget is not None:
-                        self._grid_widget(
-                            row + 1, col, widget, **grid_args if grid_args else {}
-                        )
-                    else:
-                        self._w_cache[row + 1, col] = CachedWidget(None, None)
-                else:
-                    # Shift row
-                    if (widget, grid_args) != (None, None):
-                        self._grid_widget(
-                            row + 1, col, widget, **grid_args
-                        )  # type: ignore
-                    else:
-                        self._w_cache[row + 1, col] = CachedWidget(None, None)
+            return index
+        if not 0 <= index <= self._w_cache.max_row:
+            raise IndexError(f"Row index {index} out of range")
+        new_row = tuple(widget_row)
+        displaced = self._w_cache.row(index)
+        moved = self._w_cache.shift_rows(index, 1)
+        for col in range(max(len(new_row), max(displaced, default=-1) + 1)):
+            if col < len(new_row):
+                self._create_cell_at(index, col, new_row[col])
+            if col in displaced:
+                self._regrid_cell(index + 1, col, displaced[col])
+        self._regrid_rows(moved[1:] if moved and moved[0] == index + 1 else moved)
         return index
 
+    def insert_rows_at(
+        self, index: int, widget_rows: Iterable[Iterable[Union[SkelWidget, None]]]
+    ) -> list[int]:
+        """Inserts many rows starting at the given index. Rows after the index are
+        moved and regridded once.
+
+        Args:
+            index (int): The index to insert the first row at
+            widget_rows (Iterable[Iterable[Union[SkelWidget, None]]]): The rows to
+                insert
+
+        Raises:
+            TypeError: Raised when a row is not iterable
+            IndexError: Raised when index is out of range
+
+        Returns:
+            list[int]: The new row indexes
+
+        """
+        if index == self._w_cache.max_row + 1:
+            return self.append_rows(widget_rows)
+        if not 0 <= index <= self._w_cache.max_row:
+            raise IndexError(f"Row index {index} out of range")
+        new_rows = tuple(tuple(widget_row) for widget_row in widget_rows)
+        moved = self._w_cache.shift_rows(index, len(new_rows))
+        for row, widget_row in enumerate(new_rows, index):
+            for col, skel_widget in enumerate(widget_row):
+                self._create_cell_at(row, col, skel_widget)
+        self._regrid_rows(moved)
+        return list(range(index, index + len(new_rows)))
+
     def destroy_row(self, row_index: int) -> None:
         """Destroys the row at given index.
 
@@ -138,21 +168,98 @@ class AppendableMixin:
             row_index (int): The row index to destroy
 
         """
-        for (row, col), (widget, grid_args) in tuple(self._w_cache.items()):
-            if row == row_index:
-                if widget in (c.widget for c in self.created.values()):
-                    ind = [k for k, v in self.created.items() if v.widget == widget][0]
-                    del self.created[ind]
-                if widget is not None:
-                    widget.destroy()
-                del self._w_cache[row, col]
-            elif row > row_index:
-                w = self._w_cache[row, col]
-                del self._w_cache[row, col]
-                self._w_cache[row - 1, col] = w
-        for (row, col), (widget, grid_args) in self._w_cache.items():
-            if widget is not None and grid_args is not None:
-                widget.grid(row=row, column=col, **grid_args)
+        self.destroy_rows((row_index,))
+
+    def destroy_rows(self, row_indexes: Iterable[int]) -> None:
+        """Destroys the rows at the given indexes. The remaining rows are moved up
+        and regridded once. Widgets are parked in ``widget_pool`` instead, if it is
+        set and they can be pooled.
+
+        Args:
+            row_indexes (Iterable[int]): The row indexes to destroy, indexes out of
+                range are ignored
+
+        """
+        last_row = self._w_cache.max_row
+        destroyed = sorted({row for row in row_indexes if 0 <= row <= last_row})
+        if not destroyed:
+            return
+        for row in destroyed:
+            self._discard_row(row)
+        moved = self._w_cache.renumber_rows(
+            {
+                row: row - bisect.bisect_left(destroyed, row)
+                for row in range(destroyed[0] + 1, last_row + 1)
+            }
+        )
+        self._regrid_rows(moved)
+
+    def move_row(self, src: int, dst: int) -> None:
+        """Moves a row to another index, like ``list.insert(dst, list.pop(src))``.
+        The rows in between are moved by one, and only moved rows are regridded.
+
+        Args:
+            src (int): The index of the row to move
+            dst (int): The index to move the row to
+
+        Raises:
+            IndexError: Raised when src or dst is out of range
+
+        """
+        self.__check_row_index(src)
+        self.__check_row_index(dst)
+        if src == dst:
+            return
+        step = 1 if src > dst else -1
+        mapping = {row: row + step for row in range(min(src, dst), max(src, dst) + 1)}
+        mapping[src] = dst
+        self._regrid_rows(self._w_cache.renumber_rows(mapping))
+
+    def swap_rows(self, a: int, b: int) -> None:
+        """Swaps two rows. Only the two rows are regridded.
+
+        Args:
+            a (int): The index of the first row
+            b (int): The index of the second row
+
+        Raises:
+            IndexError: Raised when a or b is out of range
+
+        """
+        self.__check_row_index(a)
+        self.__check_row_index(b)
+        if a != b:
+            self._regrid_rows(self._w_cache.renumber_rows({a: b, b: a}))
+
+    def sort_rows(
+        self,
+        key: Callable[[dict[int, CachedWidget]], Any],
+        reverse: bool = False,
+        start: int = 0,
+    ) -> None:
+        """Sorts the rows, stably, keeping the widgets. The permutation is applied to
+        the widget cache at once, and each moved cell is regridded once.
+
+        Args:
+            key (Callable[[dict[int, CachedWidget]], Any]): Returns the sort key of a
+                row, given its cached widgets by column
+            reverse (bool): Sort in descending order
+            start (int): The first row to sort, rows before it (such as headers) are
+                not moved
+
+        """
+        cells = {
+            row: self._w_cache.row(row)
+            for row in range(start, self._w_cache.max_row + 1)
+        }
+        rows = [row for row, columns in cells.items() if columns]
+        order = sorted(rows, key=lambda row: key(cells[row]), reverse=reverse)
+        mapping = {old: new for old, new in zip(order, rows) if old != new}
+        self._regrid_rows(self._w_cache.renumber_rows(mapping))
+
+    def __check_row_index(self, index: int) -> None:
+        if not 0 <= index <= self._w_cache.max_row:
+            raise IndexError(f"Row index {index} out of range")
 
     def find_row_of(self, label: str) -> Union[int, None]:
         """Finds a row of a widget having label as defined in SkelWidget.
@@ -169,7 +276,553 @@ class AppendableMixin:
             widget = self.created[label].widget
         except KeyError:
             return None
-        for (row, __), cached in self.widget_cache.items():
-            if widget == cached.widget:
-                return row
-        return None  # pragma: no cover
+        position = self._w_cache.position_of(widget)
+        return position[0] if position is not None else None
+
+    def reconcile_rows(
+        self,
+        records: Iterable[T],
+        key: Callable[[T], Hashable],
+        row_template: Callable[[T], Iterable[Union[SkelWidget, None]]],
+        update_row: Optional[Callable[[T, dict[int, CachedWidget]], None]] = None,
+    ) -> None:
+        """Makes the reconciled rows show the given records, in order, changing as
+        few rows as possible.
+
+        Rows of records whose key is no longer present are destroyed, rows of new
+        keys are created with row_template, and only the rows whose index changes
+        are regridded. Rows of records that are kept but no longer equal (``==``) to
+        the previous record are updated in place by update_row, so records should be
+        replaced rather than mutated.
+
+        The reconciled rows are created after the last row the first time, and must
+        only be changed with this method afterwards. Other rows may come before or
+        after them.
+
+        Args:
+            records (Iterable[T]): The records to show
+            key (Callable[[T], Hashable]): Returns the unique key of a record
+            row_template (Callable[[T], Iterable[Union[SkelWidget, None]]]): Returns
+                the row of widgets showing a record. Every row must have at least one
+                widget.
+            update_row (Optional[Callable[[T, dict[int, CachedWidget]], None]]):
+                Updates the widgets of a row, by column, to show a changed record.
+                Defaults to reconfiguring the widgets with the arguments returned by
+                row_template, setting the value of existing variables in place.
+
+        Raises:
+            ValueError: Raised when two records have the same key
+
+        """
+        records = list(records)
+        keys = [key(record) for record in records]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Records must have unique keys")
+        current = self.__reconciled_rows()
+        start = min(current.values(), default=self._w_cache.max_row + 1)
+        end = max(current.values(), default=start - 1) + 1
+        kept = set(keys)
+        for removed in [k for k in current if k not in kept]:
+            self._discard_row(current.pop(removed))
+        mapping = {
+            current[k]: row
+            for row, k in enumerate(keys, start)
+            if k in current and current[k] != row
+        }
+        offset = start + len(keys) - end
+        if offset:
+            mapping.update(
+                (row, row + offset) for row in range(end, self._w_cache.max_row + 1)
+            )
+        moved = self._w_cache.renumber_rows(mapping)
+        for row, (k, record) in enumerate(zip(keys, records), start):
+            if k not in current:
+                self.__create_keyed_row(row, k, record, row_template)
+                continue
+            anchor, previous = self.__keyed_rows[k]
+            if previous != record:
+                self.__keyed_rows[k] = (anchor, record)
+                if update_row is None:
+                    self._update_row_in_place(row, row_template(record))
+                else:
+                    update_row(record, self._w_cache.row(row))
+        self._regrid_rows(moved)
+
+    def row_of_key(self, key: Hashable) -> Union[int, None]:
+        """Finds the row of a record reconciled by ``reconcile_rows``.
+
+        Args:
+            key (Hashable): The key of the record
+
+        Returns:
+            Union[int, None]: The row index or None if not found
+
+        """
+        if key not in self.__keyed_rows:
+            return None
+        position = self._w_cache.position_of(self.__keyed_rows[key][0])
+        return position[0] if position is not None else None
+
+    def __reconciled_rows(self) -> dict[Hashable, int]:
+        rows = {}
+        for k in list(self.__keyed_rows):
+            row = self.row_of_key(k)
+            if row is None:
+                self.__forget_key(k)
+            else:
+                rows[k] = row
+        return rows
+
+    def __create_keyed_row(
+        self,
+        row: int,
+        key: Hashable,
+        record: Any,
+        row_template: Callable[[Any], Iterable[Union[SkelWidget, None]]],
+    ) -> None:
+        for col, skel_widget in enumerate(row_template(record)):
+            self._create_cell_at(row, col, skel_widget)
+        anchor = next(
+            (w for w, __ in self._w_cache.row(row).values() if w is not None), None
+        )
+        if anchor is None:
+            raise ValueError(f"Row of record with key {key!r} has no widgets")
+        self.__keyed_rows[key] = (anchor, record)
+        self.__widget_keys[id(anchor)] = key
+
+    def __forget_key(self, key: Hashable) -> None:
+        anchor, __ = self.__keyed_rows.pop(key)
+        self.__widget_keys.pop(id(anchor), None)
+
+    def _update_row_in_place(
+        self, row: int, widget_row: Iterable[Union[SkelWidget, None]]
+    ) -> None:
+        """Reconfigures the widgets of a row with the arguments of a row of
+        SkelWidgets. Variables already set on a widget keep their identity and get the
+        value of the new variable."""
+        cached_row = self._w_cache.row(row)
+        for col, skel_widget in enumerate(widget_row):
+            cached = cached_row.get(col)
+            if skel_widget is None or cached is None or cached.widget is None:
+                continue
+            widget = cached.widget
+            options = {}
+            for name, value in {
+                **skel_widget.init_args,
+                **skel_widget.config_args,
+            }.items():
+                if isinstance(value, type) or name in _CREATE_ONLY_OPTIONS:
+                    continue
+                if isinstance(value, tkinter.Variable):
+                    variable = str(widget.cget(name))
+                    if variable:
+                        widget.setvar(variable, value.get())
+                        continue
+                options[name] = value
+            if options:
+                widget.configure(**options)
+
+    def _discard_row(self, row: int) -> None:
+        """Removes a row from the widget cache without moving the rows after it, and
+        destroys or parks its widgets."""
+        pool = self.widget_pool
+        for widget, __ in self._w_cache.delete_row(row).values():
+            if widget is None:
+                continue
+            self._forget_created(widget)
+            if id(widget) in self.__widget_keys:
+                self.__forget_key(self.__widget_keys[id(widget)])
+            if pool is None or not pool.release(widget):
+                widget.destroy()
+
+    def _create_cell_at(
+        self, row: int, col: int, skel_widget: Union[SkelWidget, None]
+    ) -> None:
+        """Creates and grids the widget of a cell."""
+        if w := self._widget_create(skel_widget, row, col):
+            self._grid_widget(
+                row,
+                col,
+                w,
+                **self._global_gridargs,
+                # Ignore the typing error because we have already checked for None
+                **skel_widget.grid_args,  # type: ignore
+            )
+
+    def _regrid_rows(self, rows: Iterable[int]) -> None:
+        """Grids every cached widget in the given rows at its cached position."""
+        for row in rows:
+            for col, cached in self._w_cache.row(row).items():
+                self._regrid_cell(row, col, cached)
+
+    def _regrid_cell(self, row: int, col: int, cached: CachedWidget) -> None:
+        """Grids a cached widget at a new position with ``_grid_widget``."""
+        widget, grid_args = cached
+        if widget is not None:
+            self._grid_widget(row, col, widget, **grid_args if grid_args else {})
+
+
+class VirtualRowsMixin(AppendableMixin):
+    """Mixin to show the rows of a data model in a ``tklife.widgets.ScrolledFrame``,
+    creating widgets only for the rows in view.
+
+    Must appear after SkeletonMixin, but before ScrolledFrame. Must implement the
+    row_template() property method. The widgets of ``row_template`` are created once
+    per visible row (a slot) and reused while scrolling; ``render_row`` fills a slot
+    with a record of the model. Row operations act on ``model`` rather than on
+    widgets, so creation time and memory do not depend on the number of records.
+
+    Note:
+        Rows are expected to have the same height, ``row_height`` pixels, and the
+        template of the skeleton should be empty since slots use the widget cache
+        from row 0.
+
+    Attributes:
+        model: The records shown, one per row. Call ``refresh`` after modifying it
+            directly.
+        first_row: The index of the record shown in the first slot
+        row_height: The height of a row in pixels
+        overscan: The number of slots created beyond the ones that fit in view
+
+    """
+
+    model: list[Any]
+    first_row: int
+    row_height: int = 24
+    overscan: int = 1
+    canvas: tkinter.Canvas
+    v_scroll: tkinter.Scrollbar
+    rowconfigure: Callable[..., Any]
+
+    def __init__(self, master: Optional[tkinter.Misc] = None, **kwargs: Any) -> None:
+        super().__init__(master, **kwargs)  # type: ignore
+        self.model = []
+        self.first_row = 0
+        self.__hidden_slots: set[int] = set()
+        self.__record_key: Optional[Callable[[Any], Hashable]] = None
+        TkEvent.CONFIGURE.bind(
+            self.canvas, lambda __: self.refresh(), add="+", fields=()
+        )
+
+    @property
+    def row_template(self) -> Iterable[Union[SkelWidget, None]]:
+        """Returns the widgets of a single row. **Must be declared as @property**.
+
+        Returns:
+            Iterable[Union[SkelWidget, None]]: The row template
+
+        """
+        raise NotImplementedError
+
+    def render_row(
+        self, slot: dict[int, CachedWidget], record: Any, index: int
+    ) -> None:
+        """Shows a record in the widgets of a slot. Override this to customize how
+        records are shown. The default implementation sets the text of each widget to
+        the value at the same index in the record.
+
+        Args:
+            slot (dict[int, CachedWidget]): The cached widgets of the slot, by column
+            record (Any): The record to show
+            index (int): The index of the record in the model
+
+        """
+        for col, value in enumerate(record):
+            cached = slot.get(col)
+            if cached is not None and cached.widget is not None:
+                cached.widget.configure(text=value)
+
+    @property
+    def page_rows(self) -> int:
+        """Returns the number of rows that fit in view.
+
+        Returns:
+            int: Rows in view
+
+        """
+        return max(1, self.canvas.winfo_height() // self.row_height)
+
+    def refresh(self) -> None:
+        """Creates or destroys slots to fit the view and renders the records in
+        view."""
+        page = self.page_rows
+        slots = min(page + self.overscan, len(self.model))
+        created = self._w_cache.max_row + 1
+        if slots > created:
+            super().append_rows(self.row_template for __ in range(slots - created))
+            for slot in range(created, slots):
+                self.rowconfigure(slot, minsize=self.row_height)
+        elif slots < created:
+            super().destroy_rows(range(slots, created))
+            self.__hidden_slots.difference_update(range(slots, created))
+        self.first_row = max(0, min(self.first_row, len(self.model) - page))
+        for slot in range(slots):
+            index = self.first_row + slot
+            if index < len(self.model):
+                self.__show_slot(slot, True)
+                self.render_row(self._w_cache.row(slot), self.model[index], index)
+            else:
+                self.__show_slot(slot, False)
+        self._update_v_scroll()
+
+    def scroll_to(self, index: int) -> None:
+        """Scrolls so that the record at index is shown in the first row.
+
+        Args:
+            index (int): The index of the record
+
+        """
+        self.first_row = index
+        self.refresh()
+
+    def scroll_rows(self, count: int) -> None:
+        """Scrolls by a number of rows.
+
+        Args:
+            count (int): The number of rows to scroll by, negative scrolls up
+
+        """
+        self.scroll_to(self.first_row + count)
+
+    def append_row(self, record: Any) -> int:  # type: ignore[override]
+        """Appends a record to the model.
+
+        Args:
+            record (Any): The record to append
+
+        Returns:
+            int: The index of the record
+
+        """
+        return self.append_rows((record,))[0]
+
+    def append_rows(self, records: Iterable[Any]) -> list[int]:  # type: ignore
+        """Appends many records to the model.
+
+        Args:
+            records (Iterable[Any]): The records to append
+
+        Returns:
+            list[int]: The indexes of the records
+
+        """
+        start = len(self.model)
+        self.model.extend(records)
+        self.refresh()
+        return list(range(start, len(self.model)))
+
+    def insert_row_at(self, index: int, record: Any) -> int:  # type: ignore[override]
+        """Inserts a record in the model.
+
+        Args:
+            index (int): The index to insert the record at
+            record (Any): The record to insert
+
+        Raises:
+            IndexError: Raised when index is out of range
+
+        Returns:
+            int: The index of the record
+
+        """
+        return self.insert_rows_at(index, (record,))[0]
+
+    def insert_rows_at(  # type: ignore[override]
+        self, index: int, records: Iterable[Any]
+    ) -> list[int]:
+        """Inserts many records in the model.
+
+        Args:
+            index (int): The index to insert the first record at
+            records (Iterable[Any]): The records to insert
+
+        Raises:
+            IndexError: Raised when index is out of range
+
+        Returns:
+            list[int]: The indexes of the records
+
+        """
+        if not 0 <= index <= len(self.model):
+            raise IndexError(f"Row index {index} out of range")
+        inserted = list(records)
+        self.model[index:index] = inserted
+        self.refresh()
+        return list(range(index, index + len(inserted)))
+
+    def destroy_rows(self, row_indexes: Iterable[int]) -> None:
+        """Removes the records at the given indexes from the model.
+
+        Args:
+            row_indexes (Iterable[int]): The indexes to remove, indexes out of range
+                are ignored
+
+        """
+        for index in sorted(
+            {i for i in row_indexes if 0 <= i < len(self.model)}, reverse=True
+        ):
+            del self.model[index]
+        self.refresh()
+
+    def move_row(self, src: int, dst: int) -> None:
+        """Moves a record to another index, like ``list.insert(dst, list.pop(src))``.
+
+        Args:
+            src (int): The index of the record to move
+            dst (int): The index to move the record to
+
+        Raises:
+            IndexError: Raised when src or dst is out of range
+
+        """
+        if not (0 <= src < len(self.model) and 0 <= dst < len(self.model)):
+            raise IndexError(f"Row index {src} or {dst} out of range")
+        self.model.insert(dst, self.model.pop(src))
+        self.refresh()
+
+    def swap_rows(self, a: int, b: int) -> None:
+        """Swaps two records.
+
+        Args:
+            a (int): The index of the first record
+            b (int): The index of the second record
+
+        Raises:
+            IndexError: Raised when a or b is out of range
+
+        """
+        if not (0 <= a < len(self.model) and 0 <= b < len(self.model)):
+            raise IndexError(f"Row index {a} or {b} out of range")
+        self.model[a], self.model[b] = self.model[b], self.model[a]
+        self.refresh()
+
+    def sort_rows(  # type: ignore[override]
+        self, key: Callable[[Any], Any], reverse: bool = False, start: int = 0
+    ) -> None:
+        """Sorts the records, stably.
+
+        Args:
+            key (Callable[[Any], Any]): Returns the sort key of a record
+            reverse (bool): Sort in descending order
+            start (int): The index of the first record to sort
+
+        """
+        self.model[start:] = sorted(self.model[start:], key=key, reverse=reverse)
+        self.refresh()
+
+    def find_row_of(self, record: Any) -> Union[int, None]:  # type: ignore[override]
+        """Finds the index of a record in the model.
+
+        Args:
+            record (Any): The record to find
+
+        Returns:
+            Union[int, None]: The index of the record or None if not found
+
+        """
+        try:
+            return self.model.index(record)
+        except ValueError:
+            return None
+
+    def reconcile_rows(  # type: ignore[override]
+        self,
+        records: Iterable[T],
+        key: Callable[[T], Hashable],
+        row_template: Optional[Callable[[T], Any]] = None,
+        update_row: Optional[Callable[..., None]] = None,
+    ) -> None:
+        """Replaces the model with the given records, in order. Slots are reused for
+        any record, so the row_template and update_row arguments are ignored: slots
+        are created from the ``row_template`` property and filled by
+        ``render_row``.
+
+        Args:
+            records (Iterable[T]): The records to show
+            key (Callable[[T], Hashable]): Returns the unique key of a record, used
+                by ``row_of_key``
+            row_template (Optional[Callable[[T], Any]]): Ignored
+            update_row (Optional[Callable[..., None]]): Ignored
+
+        Raises:
+            ValueError: Raised when two records have the same key
+
+        """
+        records = list(records)
+        if len({key(record) for record in records}) != len(records):
+            raise ValueError("Records must have unique keys")
+        self.model = records
+        self.__record_key = key
+        self.refresh()
+
+    def row_of_key(self, key: Hashable) -> Union[int, None]:
+        """Finds the index in the model of a record reconciled by
+        ``reconcile_rows``.
+
+        Args:
+            key (Hashable): The key of the record
+
+        Returns:
+            Union[int, None]: The index of the record or None if not found
+
+        """
+        if self.__record_key is None:
+            return None
+        # The model can be modified directly, so it is searched every time
+        return next(
+            (
+                index
+                for index, record in enumerate(self.model)
+                if self.__record_key(record) == key
+            ),
+            None,
+        )
+
+    def _update_v_scroll(self) -> None:
+        total = len(self.model)
+        page = self.page_rows
+        if total <= page:
+            self.v_scroll.set(0, 1)
+            return
+        self.v_scroll.set(
+            self.first_row / total, min(1, (self.first_row + page) / total)
+        )
+
+    def _canvas_yscroll_handler(self, *__) -> None:
+        # The canvas never scrolls vertically; the scrollbar follows the model
+        self._update_v_scroll()
+
+    def _can_v_scroll(self) -> bool:
+        return len(self.model) > self.page_rows
+
+    def _v_scroll_command(self, *args) -> None:
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.model)))
+        elif args[0] == "scroll":
+            step = self.page_rows if args[2] == "pages" else 1
+            self.scroll_rows(int(args[1]) * step)
+
+    def _mouse_scroll_handler(self, event: tkinter.Event) -> None:
+        # Hold down shift to scroll horizontally
+        if int(event.state) & 0x0001:
+            super()._mouse_scroll_handler(event)  # type: ignore[misc]
+            return
+        if event.num == 4 or event.delta > 0:
+            self.scroll_rows(-1)
+        elif event.num == 5 or event.delta < 0:
+            self.scroll_rows(1)
+
+    def __show_slot(self, slot: int, shown: bool) -> None:
+        if shown == (slot not in self.__hidden_slots):
+            return
+        for widget, __ in self._w_cache.row(slot).values():
+            if widget is None:
+                continue
+            if shown:
+                widget.grid()
+            else:
+                widget.grid_remove()
+        if shown:
+            self.__hidden_slots.discard(slot)
+        else:
+            self.__hidden_slots.add(slot)
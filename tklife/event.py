@@ -2,13 +2,26 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import re
+import time
 from enum import Enum
-from tkinter import BaseWidget, Tk, Toplevel
-from typing import Any, Callable, Literal, Union
+from tkinter import BaseWidget, EventType, Misc, TclError, Tk, Toplevel
+from typing import Any, Callable, Iterable, Literal, Optional, Union
+
+from tklife.profiling import handler_profiler
 
 __all__ = [
     "BaseEvent",
+    "EventDispatcher",
+    "EventBus",
+    "BusEvent",
+    "BindingScope",
+    "add_bindtag",
+    "remove_bindtag",
+    "LeanEvent",
+    "RateLimitedAction",
     "EventsEnum",
     "CompositeEvent",
     "TkEventMod",
@@ -30,6 +43,940 @@ Widget = Union[BaseWidget, Tk, Toplevel]
 FuncId = str
 """A tkinter callback id."""
 
+_FUNC_ID_RE = re.compile(r"^[\w<>]+")
+
+
+def _parse_bindings(script: str) -> dict[FuncId, str]:
+    """Returns the lines of a Tcl bind script that call a tkinter callback, by
+    callback id."""
+    bindings = {}
+    for line in script.strip().split("\n"):
+        # Lines look like: if {"[funcid %# %b ...]" == "break"} break
+        match = _FUNC_ID_RE.match(line[6:])
+        if match:
+            bindings[match.group()] = line
+    return bindings
+
+
+class _BindingRegistry:
+    """Remembers the bind script of each (interpreter, tag, sequence) and the lines
+    of the callbacks in it, so the script is only parsed when it was changed outside
+    of tklife. Scripts that were appended to (such as with ``add="+"``) only have the
+    appended part parsed. The entries of a widget path are dropped when the widget
+    is destroyed, since Tk deletes its bindings."""
+
+    def __init__(self) -> None:
+        self.__entries: dict[tuple[int, str, str], tuple[str, dict[FuncId, str]]] = {}
+        self.__paths: dict[tuple[int, str], set[str]] = {}
+
+    def bindings(self, widget: Widget, tag: str, sequence: str) -> dict[FuncId, str]:
+        """Returns the callback lines bound to a sequence, by callback id. The
+        returned dict must not be modified."""
+        key = (id(widget.tk), tag, sequence)
+        script = widget.tk.call("bind", tag, sequence, None)  # type: ignore
+        entry = self.__entries.get(key)
+        if entry is not None:
+            known, lines = entry
+            if script == known:
+                return lines
+            if known and script.startswith(known):
+                lines = {**lines, **_parse_bindings(script[len(known) :])}
+            else:
+                lines = _parse_bindings(script)
+        else:
+            lines = _parse_bindings(script)
+        self.__store(widget, key, script, lines)
+        return lines
+
+    def replace(
+        self, widget: Widget, tag: str, sequence: str, lines: dict[FuncId, str]
+    ) -> None:
+        """Replaces the bind script of a sequence with the given callback lines."""
+        script = "\n".join(lines.values())
+        widget.tk.call("bind", tag, sequence, script)
+        self.__store(widget, (id(widget.tk), tag, sequence), script, lines)
+
+    def __store(
+        self,
+        widget: Widget,
+        key: tuple[int, str, str],
+        script: str,
+        lines: dict[FuncId, str],
+    ) -> None:
+        if script:
+            if key not in self.__entries and key[1].startswith("."):
+                self.__watch(widget, key)
+            self.__entries[key] = (script, lines)
+        else:
+            self.__entries.pop(key, None)
+
+    def __watch(self, widget: Widget, key: tuple[int, str, str]) -> None:
+        path_key = key[:2]
+        sequences = self.__paths.get(path_key)
+        if sequences is None:
+            sequences = self.__paths[path_key] = set()
+            _watch_destroy(widget, key[1], functools.partial(self.__forget, path_key))
+        sequences.add(key[2])
+
+    def __forget(self, path_key: tuple[int, str]) -> None:
+        for sequence in self.__paths.pop(path_key, ()):
+            self.__entries.pop((*path_key, sequence), None)
+
+
+_registry = _BindingRegistry()
+
+
+def _unbind_funcid(widget: Widget, tag: str, sequence: str, funcid: FuncId) -> None:
+    """Removes a single callback from a bind script and deletes its command."""
+    bindings = _registry.bindings(widget, tag, sequence)
+    _registry.replace(
+        widget, tag, sequence, {k: v for k, v in bindings.items() if k != funcid}
+    )
+    widget.deletecommand(funcid)
+
+
+_ADD_BINDTAG = (
+    "{tag args} {foreach w $args {set tags [bindtags $w]\n"
+    "if {$tag ni $tags} {bindtags $w [linsert $tags 1 $tag]}}}"
+)
+_REMOVE_BINDTAG = (
+    "{tag args} {foreach w $args {set tags [bindtags $w]\n"
+    "bindtags $w [lsearch -all -inline -not -exact $tags $tag]}}"
+)
+
+
+def add_bindtag(tag: str, widgets: Iterable[Widget]) -> None:
+    """Inserts a bindtag after the own tag of every widget that does not have it
+    yet, with a single Tcl call. Callbacks bound on the tag (with the classname
+    argument of ``BaseEvent.bind``) are then called for events of all the widgets.
+
+    Args:
+        tag: The bindtag, which must not start with "."
+        widgets: The widgets
+
+    """
+    widgets = list(widgets)
+    if widgets:
+        widgets[0].tk.call("apply", _ADD_BINDTAG, tag, *map(str, widgets))
+
+
+def remove_bindtag(tag: str, widgets: Iterable[Widget]) -> None:
+    """Removes a bindtag from every widget, with a single Tcl call.
+
+    Args:
+        tag: The bindtag
+        widgets: The widgets
+
+    """
+    widgets = list(widgets)
+    if widgets:
+        widgets[0].tk.call("apply", _REMOVE_BINDTAG, tag, *map(str, widgets))
+
+
+_DESTROY_TAG = "tklife_destroy"
+"""The bindtag of the widgets watched with ``_watch_destroy``."""
+
+_destroy_watchers: dict[int, tuple[Any, dict[str, list[Callable[[], Any]]]]] = {}
+"""The tkapp of each interpreter, and the callbacks of its watched paths."""
+
+
+def _watch_destroy(widget: Widget, path: str, callback: Callable[[], Any]) -> None:
+    """Calls a callback once the widget of a path is destroyed.
+
+    The widget is given the ``_DESTROY_TAG`` bindtag, whose <Destroy> binding is
+    created once per interpreter, so binding <Destroy> on the widget itself (even
+    without add="+") does not replace the watch.
+
+    Args:
+        widget: Any widget of the interpreter
+        path: The path of the watched widget
+        callback: Called without arguments
+
+    """
+    tkapp = widget.tk
+    entry = _destroy_watchers.get(id(tkapp))
+    # The id of a destroyed interpreter can be reused
+    if entry is None or entry[0] is not tkapp:
+        _bind_lean(
+            widget.nametowidget("."),
+            _DESTROY_TAG,
+            "<Destroy>",
+            functools.partial(_path_destroyed, id(tkapp)),
+            ("widget",),
+            "",
+        )
+        entry = _destroy_watchers[id(tkapp)] = (tkapp, {})
+    callbacks = entry[1].get(path)
+    if callbacks is None:
+        tkapp.call("apply", _ADD_BINDTAG, _DESTROY_TAG, path)
+        callbacks = entry[1][path] = []
+    callbacks.append(callback)
+
+
+def _path_destroyed(tkapp_id: int, event: LeanEvent) -> None:
+    entry = _destroy_watchers.get(tkapp_id)
+    if entry is None:
+        return
+    path = str(event.widget)
+    for callback in entry[1].pop(path, ()):
+        callback()
+    if path == ".":
+        del _destroy_watchers[tkapp_id]
+
+
+_UNSET = object()
+"""Returned by a field conversion to leave the field unset, like ``tkinter.Event``."""
+
+
+def _serial_field(widget: Misc, value: str) -> Any:
+    # Valid for all events
+    return widget.tk.getint(value)
+
+
+def _int_field(widget: Misc, value: str) -> Any:
+    try:
+        return widget.tk.getint(value)
+    except (ValueError, TclError):
+        # Tk returns "??" for fields that are not valid for the event
+        return value
+
+
+def _delta_field(widget: Misc, value: str) -> Any:
+    try:
+        return widget.tk.getint(value)
+    except (ValueError, TclError):
+        # Unlike the other integer fields, tkinter uses 0 for an invalid delta
+        return 0
+
+
+def _bool_field(widget: Misc, value: str) -> Any:
+    try:
+        return widget.tk.getboolean(value)
+    except TclError:
+        return _UNSET
+
+
+def _str_field(widget: Misc, value: str) -> Any:
+    return value
+
+
+def _type_field(widget: Misc, value: str) -> Any:
+    try:
+        return EventType(value)
+    except ValueError:
+        return value
+
+
+def _widget_field(widget: Misc, value: str) -> Any:
+    try:
+        return widget.nametowidget(value)
+    except KeyError:
+        return value
+
+
+_EVENT_FIELDS: dict[str, tuple[str, Callable[[Misc, str], Any]]] = {
+    "serial": ("%#", _serial_field),
+    "num": ("%b", _int_field),
+    "focus": ("%f", _bool_field),
+    "height": ("%h", _int_field),
+    "keycode": ("%k", _int_field),
+    "state": ("%s", _int_field),
+    "time": ("%t", _int_field),
+    "width": ("%w", _int_field),
+    "x": ("%x", _int_field),
+    "y": ("%y", _int_field),
+    "char": ("%A", _str_field),
+    "send_event": ("%E", _bool_field),
+    "keysym": ("%K", _str_field),
+    "keysym_num": ("%N", _int_field),
+    "widget": ("%W", _widget_field),
+    "type": ("%T", _type_field),
+    "x_root": ("%X", _int_field),
+    "y_root": ("%Y", _int_field),
+    "delta": ("%D", _delta_field),
+}
+"""The fields of ``tkinter.Event``, with their Tcl substitution and conversion."""
+
+
+class LeanEvent:
+    """A lightweight event passed to callbacks bound with ``fields``. Only the
+    requested fields are set, with the same names and conversions as
+    ``tkinter.Event``; accessing other fields raises AttributeError. As with
+    ``tkinter.Event``, ``focus`` and ``send_event`` are left unset when Tk has no
+    value for them."""
+
+    __slots__ = tuple(_EVENT_FIELDS)
+
+    def __repr__(self) -> str:
+        fields = " ".join(
+            f"{name}={getattr(self, name)!r}"
+            for name in self.__slots__
+            if hasattr(self, name)
+        )
+        return f"<{self.__class__.__name__} {fields}>"
+
+
+def _bind_lean(
+    widget: Widget,
+    tag: Optional[str],
+    sequence: str,
+    action: ActionCallable,
+    fields: Iterable[str],
+    add: str,
+) -> FuncId:
+    """Binds a callback that is passed a LeanEvent having only the given fields."""
+    names = tuple(fields)
+    try:
+        specs = [_EVENT_FIELDS[name] for name in names]
+    except KeyError as ex:
+        raise ValueError(f"Unknown event field {ex.args[0]!r}") from None
+    codes = " ".join(code for code, __ in specs)
+    converters = tuple((name, convert) for name, (__, convert) in zip(names, specs))
+
+    def substitute(*values: str) -> tuple[LeanEvent]:
+        event = LeanEvent()
+        for (name, convert), value in zip(converters, values):
+            converted = convert(widget, value)
+            if converted is not _UNSET:
+                setattr(event, name, converted)
+        return (event,)
+
+    funcid = widget._register(  # pylint: disable=protected-access
+        action, substitute, needcleanup=tag is None
+    )
+    widget.tk.call(
+        "bind",
+        tag or str(widget),
+        sequence,
+        f'{"+" if add else ""}if {{"[{funcid} {codes}]" == "break"}} break\n',
+    )
+    return funcid
+
+
+_DISPATCH_PREFIX = "tklife_dispatch"
+
+
+class EventDispatcher:
+    """Calls the handlers of a sequence on a widget or bind tag from a single Tcl
+    binding, so that adding and removing handlers does not change the Tcl bind script
+    or register Tcl commands.
+
+    The Tcl binding is created with the first handler and kept until ``close`` is
+    called, even when every handler is removed. Dispatchers of a widget path are
+    dropped with their handlers when the widget is destroyed.
+
+    Handlers run by descending priority, then in the order they were added. When a
+    handler returns ``"break"``, the handlers after it are not called and ``"break"``
+    is returned to Tcl, so the bindings of the next bind tags do not run either.
+
+    Note:
+        Use ``BaseEvent.bind`` with ``dispatch=True`` rather than creating instances
+        directly; there is a single dispatcher per interpreter, tag and sequence.
+
+    Args:
+        widget: The widget used to create the binding, which should live as long as
+            the tag
+        tag: The widget path or bind tag the binding is on
+        sequence: The event sequence
+
+    """
+
+    __ids = itertools.count()
+
+    def __init__(self, widget: Widget, tag: str, sequence: str) -> None:
+        self.widget = widget
+        self.tag = tag
+        self.sequence = sequence
+        self.funcid: Optional[FuncId] = None
+        self.__handlers: dict[FuncId, tuple[int, int, ActionCallable]] = {}
+        self.__order: Optional[list[tuple[FuncId, ActionCallable]]] = None
+
+    def add(self, action: ActionCallable, priority: int = 0) -> FuncId:
+        """Adds a handler, creating the Tcl binding if needed.
+
+        Args:
+            action: The callable called with the event
+            priority: Handlers with a higher priority are called first
+
+        Returns:
+            The handler id, used to remove the handler
+
+        """
+        if not self.__is_bound():
+            # The binding was removed outside of the dispatcher, so were its handlers
+            self.__handlers.clear()
+            if self.tag == str(self.widget):
+                self.funcid = self.widget.bind(self.sequence, self, add="+")
+            else:
+                self.funcid = self.widget.bind_class(
+                    self.tag, self.sequence, self, add="+"
+                )
+        number = next(self.__ids)
+        handler_id = f"{_DISPATCH_PREFIX}{number}"
+        self.__handlers[handler_id] = (-priority, number, action)
+        self.__order = None
+        return handler_id
+
+    def remove(self, handler_id: FuncId) -> None:
+        """Removes a handler. The Tcl binding is kept, so adding a handler again is
+        cheap.
+
+        Args:
+            handler_id: The id returned by ``add``
+
+        """
+        if self.__handlers.pop(handler_id, None) is not None:
+            self.__order = None
+
+    def close(self) -> None:
+        """Removes every handler and the Tcl binding."""
+        self.__handlers.clear()
+        self.__order = None
+        if self.__is_bound():
+            _unbind_funcid(
+                self.widget, self.tag, self.sequence, self.funcid  # type: ignore
+            )
+        self.funcid = None
+        key = (id(self.widget.tk), self.tag, self.sequence)
+        if _dispatchers.get(key) is self:
+            del _dispatchers[key]
+
+    def _forget(self) -> None:
+        """Drops the handlers and the Tcl command of a dispatcher whose widget path
+        was destroyed."""
+        self.__handlers.clear()
+        self.__order = None
+        if self.funcid is not None:
+            try:
+                self.widget.deletecommand(self.funcid)
+            except TclError:
+                pass
+        self.funcid = None
+        key = (id(self.widget.tk), self.tag, self.sequence)
+        if _dispatchers.get(key) is self:
+            del _dispatchers[key]
+
+    def __is_bound(self) -> bool:
+        return self.funcid is not None and self.funcid in _registry.bindings(
+            self.widget, self.tag, self.sequence
+        )
+
+    def __call__(self, event: Any) -> Optional[str]:
+        if self.__order is None:
+            self.__order = [
+                (handler_id, action)
+                for handler_id, (*__, action) in sorted(
+                    self.__handlers.items(), key=lambda item: item[1][:2]
+                )
+            ]
+        handlers = self.__handlers
+        for handler_id, action in self.__order:
+            # Skip handlers removed by a previous handler
+            if handler_id in handlers and action(event) == "break":
+                return "break"
+        return None
+
+    def __contains__(self, handler_id: object) -> bool:
+        return handler_id in self.__handlers
+
+    def __len__(self) -> int:
+        return len(self.__handlers)
+
+
+class RateLimitedAction:
+    """An action that coalesces bursts of events, returned by
+    ``BaseEvent.bind_throttled`` and ``BaseEvent.bind_debounced``.
+
+    Throttled actions are called with the first event of a burst, then at most once
+    per interval with the latest event. Debounced actions are called with the latest
+    event once no event was received for the interval. An interval of 0 delivers the
+    latest event once per idle tick.
+
+    Args:
+        widget: The widget used to schedule delivery
+        action: The action to call
+        interval_ms: The interval in milliseconds
+        debounce: If True, debounce rather than throttle
+
+    Attributes:
+        funcid: The callback id of the binding
+        delivered: The number of events passed to the action
+        dropped: The number of events replaced by a later event before delivery
+
+    """
+
+    __none = object()
+
+    def __init__(
+        self,
+        widget: Widget,
+        action: ActionCallable,
+        interval_ms: int,
+        debounce: bool = False,
+    ) -> None:
+        self.widget = widget
+        self.action = action
+        self.interval_ms = interval_ms
+        self.debounce = debounce
+        self.funcid: Optional[FuncId] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.__pending: Any = self.__none
+        self.__after_id: Optional[str] = None
+        self.__last_event = 0.0
+        self.__unbind: Optional[Callable[[], None]] = None
+
+    def __call__(self, event: Any) -> None:
+        if self.__pending is not self.__none:
+            self.dropped += 1
+        self.__last_event = time.monotonic()
+        if self.__after_id is not None:
+            self.__pending = event
+        elif self.debounce or not self.interval_ms:
+            self.__pending = event
+            self.__schedule(self.interval_ms)
+        else:
+            # Leading edge of a throttled burst
+            self.__deliver(event)
+            self.__schedule(self.interval_ms)
+
+    def flush(self) -> None:
+        """Calls the action with the pending event, if any, now."""
+        self.cancel()
+        if self.__pending is not self.__none:
+            self.__deliver(self.__pending)
+
+    def cancel(self) -> None:
+        """Cancels the scheduled delivery. The pending event is kept."""
+        if self.__after_id is not None:
+            self.widget.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def unbind(self) -> None:
+        """Drops the pending event and unbinds the action."""
+        self.cancel()
+        self.__pending = self.__none
+        if self.__unbind is not None:
+            self.__unbind()
+            self.__unbind = None
+
+    def _bound(self, funcid: FuncId, unbind: Callable[[], None]) -> None:
+        self.funcid = funcid
+        self.__unbind = unbind
+
+    def __schedule(self, delay_ms: int) -> None:
+        if delay_ms:
+            self.__after_id = self.widget.after(delay_ms, self.__fire)
+        else:
+            self.__after_id = self.widget.after_idle(self.__fire)
+
+    def __fire(self) -> None:
+        self.__after_id = None
+        if self.debounce and self.interval_ms:
+            remaining = self.interval_ms - int(
+                (time.monotonic() - self.__last_event) * 1000
+            )
+            if remaining > 0:
+                # Events arrived since scheduling; wait instead of rescheduling per event
+                self.__schedule(remaining)
+                return
+        if self.__pending is self.__none:
+            return
+        self.__deliver(self.__pending)
+        if not self.debounce and self.interval_ms:
+            self.__schedule(self.interval_ms)
+
+    def __deliver(self, event: Any) -> None:
+        self.__pending = self.__none
+        self.delivered += 1
+        self.action(event)
+
+
+class BusEvent:
+    """The event passed to the handlers of an ``EventBus``."""
+
+    __slots__ = ("event", "widget", "data")
+
+    event: BaseEvent
+    """The event published."""
+
+    widget: Optional[Widget]
+    """The widget the event was published on, if any."""
+
+    data: Any
+    """The data published with the event, any Python object."""
+
+    def __init__(self, event: BaseEvent, widget: Optional[Widget], data: Any) -> None:
+        self.event = event
+        self.widget = widget
+        self.data = data
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} {self.event.value} widget={self.widget!r} "
+            f"data={self.data!r}>"
+        )
+
+
+class EventBus:
+    """Delivers events published in Python to Python handlers without going through
+    Tcl, for custom events that only Python handlers listen to.
+
+    Handlers subscribe to an event on a widget, or on any widget, and are called
+    with a ``BusEvent`` carrying any Python object as data. Handlers of the widget
+    are called before handlers of any widget, in the order they subscribed; a
+    handler returning ``"break"`` stops the others. Events can be delivered
+    immediately, or queued and delivered together on the next idle tick.
+
+    When an event is published on a widget that has a Tcl binding for it on one of
+    its bind tags, the event is also generated in Tcl, so those bindings still run.
+
+    Note:
+        Use ``EventBus.of`` or the ``publish`` and ``subscribe`` methods of events
+        rather than creating instances directly; there is a single bus per
+        interpreter.
+
+    Args:
+        master: A widget of the interpreter, used to schedule idle delivery
+        tcl_fallback: Whether to generate events that have Tcl bindings in Tcl
+
+    """
+
+    __ids = itertools.count()
+
+    def __init__(self, master: Widget, tcl_fallback: bool = True) -> None:
+        self.master = master
+        self.tcl_fallback = tcl_fallback
+        self.__topics: dict[str, dict[Optional[str], dict[int, ActionCallable]]] = {}
+        self.__subscriptions: dict[int, tuple[str, Optional[str]]] = {}
+        self.__queue: list[BusEvent] = []
+        self.__after_id: Optional[str] = None
+
+    @classmethod
+    def of(cls, widget: Widget) -> EventBus:
+        """Returns the bus of the interpreter of a widget.
+
+        Args:
+            widget: Any widget of the interpreter
+
+        Returns:
+            The event bus
+
+        """
+        bus = _buses.get(id(widget.tk))
+        # The id of a destroyed interpreter can be reused
+        if bus is None or bus.master.tk is not widget.tk:
+            bus = _buses[id(widget.tk)] = cls(widget.nametowidget("."))
+        return bus
+
+    def subscribe(
+        self,
+        event: BaseEvent,
+        action: ActionCallable,
+        widget: Optional[Widget] = None,
+    ) -> int:
+        """Subscribes a handler to an event.
+
+        Args:
+            event: The event to subscribe to
+            action: The callable called with a BusEvent
+            widget: The widget the event must be published on, or None for any
+
+        Returns:
+            The subscription id, used to unsubscribe
+
+        """
+        subscription = next(self.__ids)
+        topic = (event.value, None if widget is None else str(widget))
+        self.__topics.setdefault(topic[0], {}).setdefault(topic[1], {})[
+            subscription
+        ] = action
+        self.__subscriptions[subscription] = topic
+        return subscription
+
+    def unsubscribe(self, subscription: int) -> None:
+        """Removes a subscription.
+
+        Args:
+            subscription: The id returned by ``subscribe``
+
+        """
+        topic = self.__subscriptions.pop(subscription, None)
+        if topic is None:
+            return
+        widgets = self.__topics[topic[0]]
+        handlers = widgets[topic[1]]
+        del handlers[subscription]
+        if not handlers:
+            del widgets[topic[1]]
+            if not widgets:
+                del self.__topics[topic[0]]
+
+    def publish(
+        self,
+        event: BaseEvent,
+        data: Any = None,
+        widget: Optional[Widget] = None,
+        idle: bool = False,
+    ) -> None:
+        """Publishes an event.
+
+        Args:
+            event: The event to publish
+            data: Any object passed to the handlers
+            widget: The widget the event is published on, or None
+            idle: If True, the event is queued and delivered with the other queued
+                events on the next idle tick
+
+        """
+        bus_event = BusEvent(event, widget, data)
+        if not idle:
+            self.__deliver(bus_event)
+            return
+        self.__queue.append(bus_event)
+        if self.__after_id is None:
+            self.__after_id = self.master.after_idle(self.flush)
+
+    def flush(self) -> None:
+        """Delivers the queued events now."""
+        if self.__after_id is not None:
+            self.master.after_cancel(self.__after_id)
+            self.__after_id = None
+        queue, self.__queue = self.__queue, []
+        for bus_event in queue:
+            self.__deliver(bus_event)
+
+    def has_subscribers(self, event: BaseEvent) -> bool:
+        """Returns whether any handler is subscribed to an event.
+
+        Args:
+            event: The event
+
+        Returns:
+            True if the event has subscribers
+
+        """
+        return event.value in self.__topics
+
+    def __deliver(self, bus_event: BusEvent) -> None:
+        widget = bus_event.widget
+        sequence = bus_event.event.value
+        widgets = self.__topics.get(sequence)
+        if widgets:
+            handlers = (
+                [] if widget is None else [*widgets.get(str(widget), {}).values()]
+            )
+            handlers.extend(widgets.get(None, {}).values())
+            for action in handlers:
+                if action(bus_event) == "break":
+                    break
+        if (
+            widget is not None
+            and self.tcl_fallback
+            and self.__has_tcl_binding(widget, sequence)
+        ):
+            if sequence.startswith("<<") and bus_event.data is not None:
+                widget.event_generate(sequence, data=bus_event.data)
+            else:
+                widget.event_generate(sequence)
+
+    @staticmethod
+    def __has_tcl_binding(widget: Widget, sequence: str) -> bool:
+        return any(widget.tk.call("bind", tag, sequence) for tag in widget.bindtags())
+
+
+class BindingScope:
+    """Keeps the bindings made through it and releases them together when its owner
+    widget is destroyed, or when ``release`` is called.
+
+    Bindings on the owner and its descendants are removed by Tk when they are
+    destroyed, but bindings on other widgets (such as the toplevel) or on tags
+    keep their Tcl command until they are unbound. Binding through a scope owned by
+    the widget that needs them releases those too.
+
+    Attributes:
+        outstanding: The number of bindings held by all scopes that were not
+            released yet. It should return to its baseline after a view is
+            destroyed; steady growth means bindings are leaking.
+
+    Args:
+        owner: The widget whose <Destroy> event releases the bindings
+
+    """
+
+    outstanding = 0
+
+    def __init__(self, owner: Widget) -> None:
+        self.owner = owner
+        self.__path = str(owner)
+        self.__releases: list[Callable[[], Any]] = []
+        # Watched through a bindtag, so binding <Destroy> on the owner without
+        # add="+" does not replace it
+        _watch_destroy(owner, self.__path, self.release)
+
+    def bind(
+        self, event: BaseEvent, widget: Widget, action: ActionCallable, **kwargs: Any
+    ) -> FuncId:
+        """Binds a callback with ``BaseEvent.bind`` and keeps it in this scope.
+
+        Args:
+            event: The event to bind
+            widget: The widget the bind is on or called on
+            action: The callable called when the event is triggered
+
+        Returns:
+            The event callback id
+
+        """
+        funcid = event.bind(widget, action, **kwargs)
+        self.track(event, widget, funcid, kwargs.get("classname"))
+        return funcid
+
+    def bind_throttled(
+        self,
+        event: BaseEvent,
+        widget: Widget,
+        action: ActionCallable,
+        interval_ms: int,
+        **kwargs: Any,
+    ) -> RateLimitedAction:
+        """Binds a callback with ``BaseEvent.bind_throttled`` and keeps it in this
+        scope.
+
+        Args:
+            event: The event to bind
+            widget: The widget the bind is on or called on
+            action: The callable called with the events
+            interval_ms: The minimum time between calls in milliseconds
+
+        Returns:
+            The bound action
+
+        """
+        limited = event.bind_throttled(widget, action, interval_ms, **kwargs)
+        self.track(event, widget, limited)
+        return limited
+
+    def bind_debounced(
+        self,
+        event: BaseEvent,
+        widget: Widget,
+        action: ActionCallable,
+        delay_ms: int,
+        **kwargs: Any,
+    ) -> RateLimitedAction:
+        """Binds a callback with ``BaseEvent.bind_debounced`` and keeps it in this
+        scope.
+
+        Args:
+            event: The event to bind
+            widget: The widget the bind is on or called on
+            action: The callable called with the events
+            delay_ms: The time without events in milliseconds
+
+        Returns:
+            The bound action
+
+        """
+        limited = event.bind_debounced(widget, action, delay_ms, **kwargs)
+        self.track(event, widget, limited)
+        return limited
+
+    def subscribe(
+        self, event: BaseEvent, widget: Widget, action: ActionCallable, **kwargs: Any
+    ) -> int:
+        """Subscribes a handler with ``BaseEvent.subscribe`` and keeps the
+        subscription in this scope.
+
+        Args:
+            event: The event to subscribe to
+            widget: The widget the event must be published on
+            action: The callable called with a ``BusEvent``
+
+        Returns:
+            The subscription id
+
+        """
+        subscription = event.subscribe(widget, action, **kwargs)
+        self.track(event, widget, subscription)
+        return subscription
+
+    def track(
+        self,
+        event: BaseEvent,
+        widget: Widget,
+        handle: Union[FuncId, RateLimitedAction, int],
+        classname: Optional[str] = None,
+    ) -> None:
+        """Keeps a binding made elsewhere in this scope.
+
+        Args:
+            event: The event that was bound
+            widget: The widget the bind is on or called on
+            handle: The callback id, rate limited action or bus subscription
+                returned when binding
+
+        Keyword Args:
+            classname: The classname the callback id was bound on, if any
+                (default: None)
+
+        """
+        if isinstance(handle, RateLimitedAction):
+            release: Callable[[], Any] = handle.unbind
+        elif isinstance(handle, int):
+            release = functools.partial(event.unsubscribe, widget, handle)
+        else:
+            release = functools.partial(
+                event.unbind, widget, handle, classname=classname
+            )
+        self.__releases.append(release)
+        BindingScope.outstanding += 1
+
+    def release(self) -> int:
+        """Releases every binding of this scope, newest first. The scope can be used
+        again afterwards.
+
+        Returns:
+            The number of bindings released
+
+        """
+        releases, self.__releases = self.__releases, []
+        BindingScope.outstanding -= len(releases)
+        for release in reversed(releases):
+            try:
+                release()
+            except TclError:
+                # The widget was destroyed, and Tk removed the binding with it
+                pass
+        return len(releases)
+
+    def __len__(self) -> int:
+        return len(self.__releases)
+
+
+_buses: dict[int, EventBus] = {}
+_dispatchers: dict[tuple[int, str, str], EventDispatcher] = {}
+
+
+def _dispatcher(widget: Widget, tag: str, sequence: str) -> EventDispatcher:
+    """Returns the dispatcher of a sequence on a widget or tag."""
+    key = (id(widget.tk), tag, sequence)
+    dispatcher = _dispatchers.get(key)
+    # The id of a destroyed interpreter can be reused
+    if dispatcher is None or dispatcher.widget.tk is not widget.tk:
+        # The Tcl command of the dispatcher is deleted with the widget registering
+        # it, so it is registered by the widget of the tag, or by the root window
+        owner = widget.nametowidget(".")
+        if tag.startswith("."):
+            try:
+                owner = widget.nametowidget(tag)
+            except KeyError:
+                pass
+        dispatcher = _dispatchers[key] = EventDispatcher(owner, tag, sequence)
+        if tag.startswith("."):
+            _watch_destroy(widget, tag, dispatcher._forget)
+    return dispatcher
+
 
 class BaseEvent:
     """Class representing a tkinter event.
@@ -67,10 +1014,17 @@ class BaseEvent:
         action: ActionCallable,
         add: Literal["", "+"] = "",
         classname: str | None = None,
+        dispatch: bool = False,
+        priority: int = 0,
+        fields: Iterable[str] | None = None,
     ) -> FuncId:
         """Binds a callback to an event on given widget. Kwargs are passed to the bind
         method.
 
+        Note:
+            While ``tklife.profiling.enable_handler_profiling`` is in effect, the
+            callback is wrapped to record its wall time.
+
         Args:
             widget: The widget the bind is on or called on
             action: The callable called when the event is triggered
@@ -81,15 +1035,160 @@ class BaseEvent:
             classname: The classname to bind on, or None for widget (default: None); use
                 `"all"` to bind to all widgets or `"tag_name"` to bind to a specific
                 tag.
+            dispatch: If True, the callback is added to the ``EventDispatcher`` of the
+                widget (or classname) and event, which has a single Tcl binding for
+                all of its callbacks. Callbacks are always added. (default: False)
+            priority: Dispatched callbacks with a higher priority are called first
+                (default: 0)
+            fields: The names of the ``tkinter.Event`` fields the callback uses, such
+                as ``("x", "y", "delta")``. If given, only these fields are
+                substituted by Tcl and the callback is passed a ``LeanEvent``, which is
+                much cheaper for high rate events such as <Motion>. Cannot be used with
+                dispatch. (default: None)
+
+        Raises:
+            ValueError: Raised when a field is unknown, or when fields is used with
+                dispatch
 
         Returns:
             The event callback id, used to unbind events
 
         """
+        if not isinstance(action, RateLimitedAction):
+            action = self.__profiled(widget, classname, action)
+        if fields is not None:
+            if dispatch:
+                raise ValueError("fields cannot be used with dispatch")
+            return _bind_lean(widget, classname, self.value, action, fields, add)
+        if dispatch:
+            return _dispatcher(widget, classname or str(widget), self.value).add(
+                action, priority
+            )
         if not classname:
             return widget.bind(self.value, action, add=add)
         return widget.bind_class(classname, self.value, action, add=add)
 
+    def publish(self, widget: Widget, data: Any = None, idle: bool = False) -> None:
+        """Publishes this event on a widget through the ``EventBus`` of its
+        interpreter, without going through Tcl unless the widget has a Tcl binding
+        for it.
+
+        Args:
+            widget: The widget to publish the event on
+
+        Keyword Args:
+            data: Any object passed to the handlers (default: None)
+            idle: If True, deliver on the next idle tick with the other queued events
+                (default: False)
+
+        """
+        EventBus.of(widget).publish(self, data, widget, idle)
+
+    def subscribe(
+        self, widget: Widget, action: ActionCallable, any_widget: bool = False
+    ) -> int:
+        """Subscribes a handler to this event on the ``EventBus`` of the interpreter
+        of a widget.
+
+        Args:
+            widget: The widget the event must be published on
+            action: The callable called with a ``BusEvent``
+
+        Keyword Args:
+            any_widget: If True, the handler is called when the event is published on
+                any widget, or on none (default: False)
+
+        Returns:
+            The subscription id, used to unsubscribe
+
+        """
+        return EventBus.of(widget).subscribe(
+            self, action, None if any_widget else widget
+        )
+
+    def unsubscribe(self, widget: Widget, subscription: int) -> None:
+        """Removes a subscription made with ``subscribe``.
+
+        Args:
+            widget: Any widget of the interpreter
+            subscription: The subscription id
+
+        """
+        EventBus.of(widget).unsubscribe(subscription)
+
+    def bind_throttled(
+        self, widget: Widget, action: ActionCallable, interval_ms: int, **kwargs: Any
+    ) -> RateLimitedAction:
+        """Binds a callback that is called with the first event of a burst, then at
+        most once every interval_ms with the latest event. Other keyword arguments are
+        passed to ``bind``.
+
+        Args:
+            widget: The widget the bind is on or called on
+            action: The callable called with the events
+            interval_ms: The minimum time between calls in milliseconds, or 0 to
+                call at most once per idle tick
+
+        Returns:
+            The bound action, having the callback id and delivery counters
+
+        """
+        return self.__bind_rate_limited(
+            widget,
+            RateLimitedAction(
+                widget,
+                self.__profiled(widget, kwargs.get("classname"), action),
+                interval_ms,
+            ),
+            kwargs,
+        )
+
+    def bind_debounced(
+        self, widget: Widget, action: ActionCallable, delay_ms: int, **kwargs: Any
+    ) -> RateLimitedAction:
+        """Binds a callback that is called with the latest event once no event was
+        received for delay_ms. Other keyword arguments are passed to ``bind``.
+
+        Args:
+            widget: The widget the bind is on or called on
+            action: The callable called with the events
+            delay_ms: The time without events in milliseconds, or 0 to call once
+                per idle tick
+
+        Returns:
+            The bound action, having the callback id and delivery counters
+
+        """
+        return self.__bind_rate_limited(
+            widget,
+            RateLimitedAction(
+                widget,
+                self.__profiled(widget, kwargs.get("classname"), action),
+                delay_ms,
+                debounce=True,
+            ),
+            kwargs,
+        )
+
+    def __profiled(
+        self, widget: Widget, classname: Optional[str], action: ActionCallable
+    ) -> ActionCallable:
+        """Returns the action timed by the enabled handler profiler, if any."""
+        profiler = handler_profiler()
+        if profiler is None:
+            return action
+        return profiler.wrap(self.value, classname or type(widget).__name__, action)
+
+    def __bind_rate_limited(
+        self, widget: Widget, limited: RateLimitedAction, kwargs: dict[str, Any]
+    ) -> RateLimitedAction:
+        funcid = self.bind(widget, limited, **kwargs)
+        classname = kwargs.get("classname")
+        limited._bound(  # pylint: disable=protected-access
+            funcid, lambda: self.unbind(widget, funcid, classname=classname)
+        )
+        return limited
+
     def unbind(
         self,
         widget: Widget,
@@ -106,19 +1205,23 @@ class BaseEvent:
             widget: The widget that will call unbind
 
         Keyword Args:
-            funcid: The callback id to remove, or None for all (default: None)
+            funcid: The callback id to remove, or None for all (default: None). Ids
+                returned by ``bind`` with ``dispatch=True`` are removed from the
+                dispatcher without changing the Tcl bind script.
             classname: The classname to unbind on, or None for widget
 
         """
+        tag = classname or str(widget)
         if not funcid:
-            widget.tk.call("bind", classname or str(widget), self.value, "")
+            _registry.replace(widget, tag, self.value, {})
+            _dispatchers.pop((id(widget.tk), tag, self.value), None)
             return
-        func_callbacks = self.get_bindings(widget, classname=classname)
-        new_callbacks = [v for k, v in func_callbacks.items() if k != funcid]
-        widget.tk.call(
-            "bind", classname or str(widget), self.value, "\n".join(new_callbacks)
-        )
-        widget.deletecommand(funcid)
+        if funcid.startswith(_DISPATCH_PREFIX):
+            dispatcher = _dispatchers.get((id(widget.tk), tag, self.value))
+            if dispatcher is not None:
+                dispatcher.remove(funcid)
+            return
+        _unbind_funcid(widget, tag, self.value, funcid)
 
     def get_bindings(
         self, widget: Widget, classname: str | None = None
@@ -126,6 +1229,10 @@ class BaseEvent:
         """Returns a dict of all bindings for this event on the given widget (if
         applicable) and classname, if specified.
 
+        Note:
+            The callback ids of a binding are remembered, so the bind script is only
+            parsed again when it was changed outside of tklife.
+
         Args:
             widget: The widget to get bindings for
 
@@ -137,25 +1244,25 @@ class BaseEvent:
             A dict of callback ids to callbacks
 
         """
-        func_id_re = re.compile(r"^[\w<>]+")
-        func_callbacks = (
-            widget.tk.call(  # type: ignore
-                "bind",
-                classname or str(widget),
-                self.value,
-                None,
-            )
-            .strip()
-            .split("\n")
-        )
+        return dict(_registry.bindings(widget, classname or str(widget), self.value))
 
-        def get_match(v):
-            match = func_id_re.match(v[6:])
-            if match:
-                return match.group()
-            return None
+    @staticmethod
+    def parse(sequence: str) -> BaseEvent:
+        """Returns the event of a sequence string. Sequences of the standard events
+        defined in this module return the enum member, others an interned
+        ``CompositeEvent``. Results are cached.
 
-        return {match: v for v in func_callbacks if (match := get_match(v))}
+        Args:
+            sequence: The sequence, like "<Control-KeyPress-z>"
+
+        Raises:
+            ValueError: Raised when the sequence is not enclosed in angle brackets
+
+        Returns:
+            The event
+
+        """
+        return _parse(sequence)
 
     def __add__(self, arg: BaseEvent | str) -> CompositeEvent:
         """Creates a composite event from this event and another.
@@ -176,9 +1283,24 @@ class EventsEnum(BaseEvent, Enum):
 
 
 class CompositeEvent(BaseEvent):
-    """An event composed of other events/event mods."""
+    """An event composed of other events/event mods.
+
+    Instances are interned by value: creating a CompositeEvent with the value of an
+    existing one returns the existing instance, so they can be compared by identity
+    and used as cheap dict keys.
+
+    """
 
     value: str
+    __interned: dict[tuple[type, str], CompositeEvent] = {}
+
+    def __new__(cls, value: str) -> CompositeEvent:
+        try:
+            return cls.__interned[cls, value]
+        except KeyError:
+            event = cls.__interned[cls, value] = super().__new__(cls)
+            event.value = value
+            return event
 
     def __init__(self, value: str) -> None:
         """Create a new CompositeEvent instance.
@@ -187,7 +1309,6 @@ class CompositeEvent(BaseEvent):
             value: The event. Should be formatted like: <event>
 
         """
-        self.value = value
 
     @classmethod
     def factory(
@@ -209,6 +1330,18 @@ class CompositeEvent(BaseEvent):
         event_value = event.value if not isinstance(event, str) else event
         return cls(f"{mod_value[0:-1]}-{event_value[1:]}")
 
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.value == other.value  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __reduce__(self) -> tuple[type, tuple[str]]:
+        # Copies and unpickled events are interned too
+        return self.__class__, (self.value,)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {self.value}>"
 
@@ -391,3 +1524,29 @@ class TtkTreeviewEvents(EventsEnum):
     TREEVIEW_SELECT = "<<TreeviewSelect>>"
     TREEVIEW_OPEN = "<<TreeviewOpen>>"
     TREEVIEW_CLOSE = "<<TreeviewClose>>"
+
+
+_STANDARD_EVENTS: dict[str, BaseEvent] = {
+    member.value: member
+    for enum in (
+        TkEventMod,
+        TkEvent,
+        TkVirtualEvents,
+        TtkNotebookEvents,
+        TtkPanedWindowEvents,
+        TtkSpinboxEvents,
+        TtkComboboxEvents,
+        TtkTreeviewEvents,
+    )
+    for member in enum
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(sequence: str) -> BaseEvent:
+    if not (sequence.startswith("<") and sequence.endswith(">")):
+        raise ValueError(f"Invalid event sequence {sequence!r}")
+    try:
+        return _STANDARD_EVENTS[sequence]
+    except KeyError:
+        return CompositeEvent(sequence)
@@ -0,0 +1,240 @@
+"""Contains the UI mailbox, used by worker threads to update widgets without flooding
+the Tk event queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from tklife.core import CreatedWidget
+from tklife.event import _watch_destroy
+
+if TYPE_CHECKING:
+    import tkinter
+    from typing import Any, Callable, Hashable, Iterable, Optional, Union
+
+    from tklife.core import SkelWidget
+    from tklife.dynamic import AppendableMixin
+    from tklife.event import Widget
+
+__all__ = ["UIMailbox"]
+
+
+class UIMailbox:
+    """A thread-safe mailbox of UI mutations, drained on the Tk thread once per
+    frame.
+
+    Worker threads post mutations instead of scheduling their own callbacks. A later
+    write to the same target replaces the earlier one still in the mailbox: the
+    last value set to a variable wins, and the options configured on a widget are
+    merged. Rows appended to the same widget are appended together.
+
+    Workers never call Tk: the mailbox is drained by a tick of the Tk thread, every
+    frame while it has mutations and every ``idle_ms`` otherwise. Each drain stops
+    when its frame budget is spent, leaving the other mutations for the next frame.
+
+    Note:
+        Use ``UIMailbox.of`` on the Tk thread, then pass the mailbox to the workers.
+        ``set``, ``configure``, ``append_row`` and ``post`` are safe to call from any
+        thread; the other methods must be called on the Tk thread.
+
+    Example:
+        mailbox = UIMailbox.of(view)
+
+        def work():
+            for index, line in enumerate(lines):
+                mailbox.set(view.created["status"], f"Line {index}")
+                mailbox.append_row(view, parse(line))
+
+    Args:
+        master: The root window of the interpreter
+        frame_ms: The time between two drains in milliseconds
+        budget_ms: The time a drain can spend applying mutations in milliseconds
+        idle_ms: The time between two checks of an empty mailbox in milliseconds
+
+    """
+
+    coalesced: int
+    """The number of mutations replaced or merged by a later write."""
+
+    def __init__(
+        self,
+        master: Widget,
+        frame_ms: int = 16,
+        budget_ms: float = 8.0,
+        idle_ms: int = 50,
+    ) -> None:
+        self.master = master
+        self.frame_ms = frame_ms
+        self.budget_ms = budget_ms
+        self.idle_ms = idle_ms
+        self.coalesced = 0
+        self.__lock = threading.Lock()
+        self.__entries: dict[Hashable, list[Any]] = {}
+        self.__closed = False
+        # Only read and written on the Tk thread
+        self.__after_id: Optional[str] = self.master.after(idle_ms, self.__tick)
+        # Watched through a bindtag, so binding <Destroy> without add="+" does not
+        # replace it
+        _watch_destroy(master, str(master), self.close)
+
+    @classmethod
+    def of(cls, widget: Widget) -> UIMailbox:
+        """Returns the mailbox of the interpreter of a widget. Must be called on the
+        Tk thread.
+
+        Args:
+            widget: Any widget of the interpreter
+
+        Returns:
+            The mailbox
+
+        """
+        mailbox = _mailboxes.get(id(widget.tk))
+        # The id of a destroyed interpreter can be reused
+        if mailbox is None or mailbox.master.tk is not widget.tk or mailbox.__closed:
+            mailbox = _mailboxes[id(widget.tk)] = cls(widget.nametowidget("."))
+        return mailbox
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of mutations in the mailbox."""
+        return len(self.__entries)
+
+    def set(
+        self,
+        target: Union[CreatedWidget, tkinter.Variable],
+        value: Any,
+        name: str = "textvariable",
+    ) -> None:
+        """Sets a variable. Replaces the value of a previous set of the variable.
+
+        Args:
+            target: The variable, or the created widget having it
+            value: The value
+
+        Keyword Args:
+            name: The name of the variable of a created widget
+                (default: "textvariable")
+
+        """
+        variable = target[name] if isinstance(target, CreatedWidget) else target
+        self.post(("set", str(variable)), variable.set, value)
+
+    def configure(self, widget: Widget, **options: Any) -> None:
+        """Configures a widget. The options are merged with the options of a
+        previous configure of the widget; it is skipped if the widget is destroyed
+        by then.
+
+        Args:
+            widget: The widget
+            **options: The options
+
+        """
+        self.__post(
+            ("configure", str(widget)),
+            [_configure, widget, dict(options)],
+            lambda entry: entry[2].update(options),
+        )
+
+    def append_row(
+        self, widget: AppendableMixin, row: Iterable[Union[SkelWidget, None]]
+    ) -> None:
+        """Appends a row to a widget. Rows appended to the same widget before a
+        drain are appended together with ``append_rows``.
+
+        Args:
+            widget: The widget having rows
+            row: The row
+
+        """
+        self.__post(
+            ("append", str(widget)),
+            [widget.append_rows, [row]],
+            lambda entry: entry[1].append(row),
+        )
+
+    def post(
+        self, key: Optional[Hashable], function: Callable[..., Any], *args: Any
+    ) -> None:
+        """Posts a mutation, called with its arguments on the Tk thread. A mutation
+        replaces the previous mutation having the same key, which moves to the end
+        of the mailbox.
+
+        Args:
+            key: The key of the target of the mutation, or None to never replace it
+            function: The function applying the mutation
+            *args: The arguments of the function
+
+        """
+        self.__post(object() if key is None else key, [function, *args])
+
+    def drain(self) -> None:
+        """Applies mutations in the order they were posted, until the frame budget
+        is spent. Called by the tick of the mailbox."""
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        while True:
+            with self.__lock:
+                if not self.__entries:
+                    return
+                key = next(iter(self.__entries))
+                function, *args = self.__entries.pop(key)
+            try:
+                function(*args)
+            except Exception as ex:  # pylint: disable=broad-except
+                self.master.report_callback_exception(type(ex), ex, ex.__traceback__)
+            # At least one mutation is applied per frame
+            if time.perf_counter() >= deadline:
+                return
+
+    def __post(
+        self,
+        key: Hashable,
+        entry: list[Any],
+        merge: Optional[Callable[[list[Any]], Any]] = None,
+    ) -> None:
+        with self.__lock:
+            if self.__closed:
+                return
+            previous = self.__entries.get(key)
+            if previous is not None:
+                self.coalesced += 1
+                if merge is not None:
+                    merge(previous)
+                    return
+                del self.__entries[key]
+            self.__entries[key] = entry
+
+    def __tick(self) -> None:
+        self.__after_id = None
+        if self.__closed:
+            return
+        if self.__entries:
+            self.drain()
+        # Ticks come every frame while mutations are pending, to keep latency low
+        self.__after_id = self.master.after(
+            self.frame_ms if self.__entries else self.idle_ms, self.__tick
+        )
+
+    def close(self) -> None:
+        """Discards the mutations in the mailbox and ignores the ones posted later.
+        Must be called on the Tk thread."""
+        with self.__lock:
+            self.__closed = True
+            self.__entries.clear()
+        if self.__after_id is not None:
+            self.master.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.master} pending={self.pending}>"
+
+
+def _configure(widget: Widget, options: dict[str, Any]) -> None:
+    """Configures a widget that still exists."""
+    if widget.winfo_exists():
+        widget.configure(**options)
+
+
+_mailboxes: dict[int, UIMailbox] = {}
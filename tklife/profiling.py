@@ -0,0 +1,377 @@
+"""Contains opt-in instrumentation used to find slow parts of a tklife application."""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator, Optional
+
+    HandlerKey = tuple[str, str, str]
+
+
+__all__ = [
+    "CONSTRUCTION_PHASES",
+    "CellTiming",
+    "ConstructionStats",
+    "ConstructionAggregate",
+    "HANDLER_LATENCY_BUCKETS_MS",
+    "LatencyHistogram",
+    "HandlerProfiler",
+    "enable_handler_profiling",
+    "disable_handler_profiling",
+    "handler_profiler",
+]
+
+_logger = logging.getLogger(__name__)
+
+CONSTRUCTION_PHASES = (
+    "before_init",
+    "init",
+    "after_init",
+    "create_all",
+    "grid_config",
+    "after_widgets",
+    "create_events",
+)
+"""The phases of ``SkeletonMixin`` construction, in the order they run."""
+
+
+@dataclasses.dataclass(frozen=True)
+class CellTiming:
+    """Wall time spent creating and gridding a single template cell."""
+
+    row: int
+    """The row of the cell."""
+
+    column: int
+    """The column of the cell."""
+
+    label: Optional[str]
+    """The label of the widget, if any."""
+
+    seconds: float
+    """The wall time in seconds."""
+
+
+@dataclasses.dataclass
+class ConstructionStats:
+    """Wall time of each construction phase of a single ``SkeletonMixin`` instance."""
+
+    phases: dict[str, float] = dataclasses.field(default_factory=dict)
+    """Seconds spent in each phase, keyed by a name in ``CONSTRUCTION_PHASES``."""
+
+    cells: dict[tuple[int, int], CellTiming] = dataclasses.field(default_factory=dict)
+    """Timing of each cell created by ``_create_all``, keyed by (row, column)."""
+
+    @property
+    def total(self) -> float:
+        """Returns the seconds spent in all phases.
+
+        Returns:
+            The total seconds
+
+        """
+        return sum(self.phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Context manager that records the wall time of the wrapped block as a phase.
+
+        Args:
+            name: The name of the phase
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+    def add_cell(
+        self, row: int, column: int, label: Optional[str], seconds: float
+    ) -> None:
+        """Records the timing of a template cell.
+
+        Args:
+            row: The row of the cell
+            column: The column of the cell
+            label: The label of the widget, if any
+            seconds: The wall time in seconds
+
+        """
+        self.cells[row, column] = CellTiming(row, column, label, seconds)
+
+    def slowest_cells(self, count: int = 10) -> list[CellTiming]:
+        """Returns the slowest cells, slowest first.
+
+        Args:
+            count: The maximum number of cells to return
+
+        Returns:
+            The slowest cells
+
+        """
+        return sorted(self.cells.values(), key=lambda c: c.seconds, reverse=True)[
+            :count
+        ]
+
+
+@dataclasses.dataclass
+class ConstructionAggregate:
+    """Aggregated construction stats of every profiled instance of a class."""
+
+    count: int = 0
+    """The number of instances aggregated."""
+
+    totals: dict[str, float] = dataclasses.field(default_factory=dict)
+    """Total seconds spent in each phase."""
+
+    maximums: dict[str, float] = dataclasses.field(default_factory=dict)
+    """The most seconds a single instance spent in each phase."""
+
+    def add(self, stats: ConstructionStats) -> None:
+        """Adds the stats of an instance to the aggregate.
+
+        Args:
+            stats: The stats to add
+
+        """
+        self.count += 1
+        for name, seconds in stats.phases.items():
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+            self.maximums[name] = max(self.maximums.get(name, 0.0), seconds)
+
+    @property
+    def means(self) -> dict[str, float]:
+        """Returns the mean seconds spent in each phase.
+
+        Returns:
+            Mean seconds keyed by phase
+
+        """
+        if not self.count:
+            return {}
+        return {name: total / self.count for name, total in self.totals.items()}
+
+
+HANDLER_LATENCY_BUCKETS_MS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0)
+"""The upper bounds in milliseconds of the default handler latency buckets."""
+
+
+@dataclasses.dataclass
+class LatencyHistogram:
+    """Counts of handler calls in fixed latency buckets."""
+
+    bounds: tuple[float, ...] = HANDLER_LATENCY_BUCKETS_MS
+    """The upper bound in milliseconds of each bucket, ascending."""
+
+    counts: list[int] = dataclasses.field(default_factory=list)
+    """The number of calls in each bucket. The last bucket counts the calls slower
+    than every bound."""
+
+    total: float = 0.0
+    """Total seconds spent in the handler."""
+
+    maximum: float = 0.0
+    """The most seconds a single call took."""
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    @property
+    def count(self) -> int:
+        """Returns the number of calls recorded.
+
+        Returns:
+            The number of calls
+
+        """
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean seconds of a call.
+
+        Returns:
+            The mean seconds, or 0.0 if no call was recorded
+
+        """
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Records a call.
+
+        Args:
+            seconds: The wall time of the call in seconds
+
+        """
+        self.counts[bisect.bisect_left(self.bounds, seconds * 1000)] += 1
+        self.total += seconds
+        self.maximum = max(self.maximum, seconds)
+
+
+def _qualname(action: Callable[..., Any]) -> str:
+    """Returns the qualified name of a callback, looking through partials."""
+    while isinstance(action, functools.partial):
+        action = action.func
+    name = getattr(action, "__qualname__", None) or type(action).__qualname__
+    return f"{getattr(action, '__module__', None) or '?'}.{name}"
+
+
+class HandlerProfiler:
+    """Records the wall time of event handlers in a ``LatencyHistogram`` per
+    (sequence, widget class, handler qualified name), and reports handlers that
+    blocked the mainloop longer than a threshold.
+
+    Enable it with ``enable_handler_profiling``, after which every callback bound
+    through ``BaseEvent`` (including the ``events`` of a ``SkeletonMixin``) is
+    wrapped. Callbacks bound before it was enabled are not timed.
+
+    """
+
+    stats: dict[HandlerKey, LatencyHistogram]
+    """Histograms keyed by (sequence, widget class, handler qualified name)."""
+
+    slow_ms: Optional[float]
+    """Calls taking longer than this many milliseconds are reported, or None to
+    not report."""
+
+    on_slow: Optional[Callable[[HandlerKey, float], Any]]
+    """Called with the key and the seconds of a slow call, or None to log a
+    warning."""
+
+    def __init__(
+        self,
+        slow_ms: Optional[float] = None,
+        on_slow: Optional[Callable[[HandlerKey, float], Any]] = None,
+        bounds: tuple[float, ...] = HANDLER_LATENCY_BUCKETS_MS,
+    ) -> None:
+        """Creates a handler profiler.
+
+        Keyword Args:
+            slow_ms: Report calls taking longer than this many milliseconds, or
+                None to not report (default: None)
+            on_slow: Called with the key and the seconds of a slow call, or None to
+                log a warning (default: None)
+            bounds: The upper bounds of the histogram buckets in milliseconds
+                (default: HANDLER_LATENCY_BUCKETS_MS)
+
+        """
+        self.stats = {}
+        self.slow_ms = slow_ms
+        self.on_slow = on_slow
+        self.__bounds = tuple(bounds)
+
+    def wrap(
+        self, sequence: str, widget_class: str, action: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Returns a callback that calls an action and records its wall time.
+
+        Args:
+            sequence: The event sequence the action is bound to
+            widget_class: The class or bindtag of the widget the action is bound on
+            action: The action
+
+        Returns:
+            The timed callback, returning what the action returns
+
+        """
+        key = (sequence, widget_class, _qualname(action))
+
+        @functools.wraps(action)
+        def timed(*args: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return action(*args)
+            finally:
+                self.record(key, time.perf_counter() - start)
+
+        return timed
+
+    def record(self, key: HandlerKey, seconds: float) -> None:
+        """Records a handler call, and reports it if it is slow.
+
+        Args:
+            key: The (sequence, widget class, handler qualified name) of the handler
+            seconds: The wall time of the call in seconds
+
+        """
+        histogram = self.stats.get(key)
+        if histogram is None:
+            histogram = self.stats[key] = LatencyHistogram(self.__bounds)
+        histogram.add(seconds)
+        if self.slow_ms is not None and seconds * 1000 > self.slow_ms:
+            if self.on_slow is not None:
+                self.on_slow(key, seconds)
+            else:
+                _logger.warning(
+                    "%s bound to %s on %s blocked the mainloop for %.1f ms",
+                    key[2],
+                    key[0],
+                    key[1],
+                    seconds * 1000,
+                )
+
+    def slowest(self, count: int = 10) -> list[tuple[HandlerKey, LatencyHistogram]]:
+        """Returns the handlers that spent the most time in total, slowest first.
+
+        Args:
+            count: The maximum number of handlers to return
+
+        Returns:
+            The keys and histograms of the handlers
+
+        """
+        return sorted(self.stats.items(), key=lambda i: i[1].total, reverse=True)[
+            :count
+        ]
+
+    def reset(self) -> None:
+        """Removes every recorded histogram."""
+        self.stats.clear()
+
+
+_handler_profiler: Optional[HandlerProfiler] = None
+
+
+def enable_handler_profiling(
+    slow_ms: Optional[float] = None,
+    on_slow: Optional[Callable[[HandlerKey, float], Any]] = None,
+    bounds: tuple[float, ...] = HANDLER_LATENCY_BUCKETS_MS,
+) -> HandlerProfiler:
+    """Times every callback bound through ``BaseEvent`` from now on with a new
+    ``HandlerProfiler``. Arguments are passed to ``HandlerProfiler``.
+
+    Returns:
+        The profiler recording the handlers
+
+    """
+    global _handler_profiler  # pylint: disable=global-statement
+    _handler_profiler = HandlerProfiler(slow_ms, on_slow, bounds)
+    return _handler_profiler
+
+
+def disable_handler_profiling() -> None:
+    """Stops wrapping newly bound callbacks. Callbacks that were already wrapped keep
+    recording to their profiler."""
+    global _handler_profiler  # pylint: disable=global-statement
+    _handler_profiler = None
+
+
+def handler_profiler() -> Optional[HandlerProfiler]:
+    """Returns the profiler enabled by ``enable_handler_profiling``.
+
+    Returns:
+        The profiler, or None if handler profiling is not enabled
+
+    """
+    return _handler_profiler
@@ -7,10 +7,15 @@ controller has been assigned to the skeleton.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+import inspect
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, Coroutine, Optional
+
+    from tklife.controller import ControllerABC
     from tklife.core import SkeletonMixin
 
 
@@ -22,7 +27,8 @@ class CallProxyFactory:
     """Factory for CallProxy objects.
 
     This is used to create a CallProxy object that will call the controller's function
-    when called.
+    when called. A single proxy is created per function name, and every proxy calls
+    the controller's method directly once the controller is set.
 
     Args:
         skel (SkeletonMixin): The skeleton that will be used to create the CallProxy
@@ -38,27 +44,55 @@ class CallProxyFactory:
 
     def __init__(self, skel: SkeletonMixin) -> None:
         self.skel = skel
+        self.__proxies: dict[str, CallProxy] = {}
+        self.__controller: Optional[ControllerABC] = None
 
     def __getattr__(self, func: str) -> CallProxy:
-        """Creates a CallProxy object that will call the controller's function when
+        """Returns the CallProxy object that will call the controller's function when
         called.
 
         Args:
             func (str): The name of the function to call.
 
+        Raises:
+            AttributeError: Raised for special and private attributes of the factory,
+                such as those looked up by copy and pickle
+
         Returns:
             CallProxy: The CallProxy object that will call the controller's function
 
         """
-        proxy = CallProxy(self.skel, func)
+        if func.startswith("__") or func.startswith("_CallProxyFactory__"):
+            raise AttributeError(func)
+        proxy = self.__proxies.get(func)
+        if proxy is None:
+            proxy = self.__proxies[func] = CallProxy(self.skel, func)
+            if self.__controller is not None:
+                proxy.retarget(self.__controller)
         return proxy
 
+    def set_controller(self, controller: Optional[ControllerABC]) -> None:
+        """Makes every proxy of this factory call the methods of a controller
+        directly, or go back to looking up the controller of the skeleton if None.
+
+        Args:
+            controller (Optional[ControllerABC]): The controller
+
+        """
+        self.__controller = controller
+        for proxy in self.__proxies.values():
+            proxy.retarget(controller)
+
 
 @dataclass(frozen=True)
 class CallProxy:
     """Stand-in for a controller call. When called, it will call the controller's method
     or raise an error if the controller has not been assigned yet.
 
+    Methods defined with ``async def`` are not awaited: their coroutine is scheduled
+    on the ``tklife.aio.AsyncLoop`` of the skeleton, owned by the skeleton so it is
+    cancelled when the skeleton is destroyed, and the call returns the task.
+
     Args:
         skel (SkeletonMixin): The skeleton that will be used to call the controller's
             method.
@@ -68,14 +102,64 @@ class CallProxy:
         skel (SkeletonMixin): The skeleton that will be used to call the controller's
             method.
         func (str): The name of the function to call.
+        target (Optional[Callable]): The controller's method, once the proxy was
+            retargeted to a controller.
 
     """
 
     skel: SkeletonMixin
     func: str
+    target: Optional[Callable[..., Any]] = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def retarget(self, controller: Optional[ControllerABC]) -> None:
+        """Caches the method of a controller so calls do not look it up, or clears it
+        if None. Methods the controller does not have are looked up when called.
+
+        Args:
+            controller (Optional[ControllerABC]): The controller
+
+        """
+        target = None
+        if controller is not None:
+            try:
+                target = getattr(controller, self.func)
+            except (AttributeError, KeyError):
+                pass
+        if inspect.iscoroutinefunction(target):
+            target = _scheduled(self.skel, target)
+        object.__setattr__(self, "target", target)
 
     def __call__(self, *args, **kwargs):
+        target = self.target
+        if target is not None:
+            return target(*args, **kwargs)
         if not isinstance(self.skel.controller, CallProxyFactory):
-            return getattr(self.skel.controller, self.func)(*args, **kwargs)
+            result = getattr(self.skel.controller, self.func)(*args, **kwargs)
+            if inspect.iscoroutine(result):
+                return _schedule(self.skel, result)
+            return result
 
         raise TklProxyError("Cannot call. Have you assigned a controller yet?")
+
+
+def _schedule(skel: SkeletonMixin, coro: Coroutine[Any, Any, Any]) -> Any:
+    """Schedules a coroutine on the asyncio loop of a skeleton, owned by it."""
+    # Imported here so asyncio is only loaded by applications using coroutines
+    from tklife.aio import AsyncLoop  # pylint: disable=import-outside-toplevel
+
+    return AsyncLoop.of(skel).create_task(coro, owner=skel)  # type: ignore[arg-type]
+
+
+def _scheduled(
+    skel: SkeletonMixin, method: Callable[..., Coroutine[Any, Any, Any]]
+) -> Callable[..., Any]:
+    """Returns a callable scheduling the coroutines of a method on the asyncio loop
+    of a skeleton."""
+
+    @functools.wraps(method)
+    def schedule(*args: Any, **kwargs: Any) -> Any:
+        return _schedule(skel, method(*args, **kwargs))
+
+    return schedule
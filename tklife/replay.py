@@ -0,0 +1,324 @@
+"""Contains a recorder of the input events of an application and a replayer that
+generates them again, used to turn user sessions into repeatable benchmarks."""
+
+from __future__ import annotations
+
+import functools
+import json
+import time
+from tkinter import TclError
+from typing import TYPE_CHECKING, NamedTuple
+
+from tklife.event import TkEvent
+
+if TYPE_CHECKING:
+    from os import PathLike
+    from typing import Any, Callable, Iterable, Mapping, Optional, Union
+
+    from tklife.event import BaseEvent, FuncId, LeanEvent, Widget
+
+__all__ = [
+    "RECORDED_EVENTS",
+    "RecordedEvent",
+    "EventRecorder",
+    "EventReplayer",
+]
+
+RECORDED_EVENTS: dict[BaseEvent, tuple[str, ...]] = {
+    TkEvent.KEYPRESS: ("keysym", "state"),
+    TkEvent.KEYRELEASE: ("keysym", "state"),
+    TkEvent.BUTTON: ("num", "x", "y", "state"),
+    TkEvent.BUTTONRELEASE: ("num", "x", "y", "state"),
+    TkEvent.MOTION: ("x", "y", "state"),
+    TkEvent.MOUSEWHEEL: ("delta", "x", "y", "state"),
+}
+"""The events recorded by default, with the fields recorded for each."""
+
+_FORMAT = {"format": "tklife-events", "version": 1}
+"""The header line of a recording file."""
+
+_GENERATE_OPTIONS = {"num": "-button"}
+"""Options of ``event generate`` that are not named like the event field."""
+
+
+class RecordedEvent(NamedTuple):
+    """A single event of a recording."""
+
+    time_ms: int
+    """Milliseconds since the recording started."""
+
+    sequence: str
+    """The event sequence, like "<KeyPress>"."""
+
+    path: str
+    """The Tcl path of the widget the event happened on."""
+
+    fields: dict[str, Union[int, str]]
+    """The substituted fields of the event, by ``tkinter.Event`` field name."""
+
+
+class EventRecorder:
+    """Records the events of every widget of an interpreter by binding them on the
+    "all" bindtag.
+
+    Note:
+        Events are recorded when they reach the "all" bindtag, so events that a
+        binding of the widget, class or toplevel stopped with "break" are not
+        recorded.
+
+    Example:
+        with EventRecorder(root) as recorder:
+            root.mainloop()
+        recorder.save("session.jsonl")
+
+    """
+
+    widget: Widget
+    """Any widget of the interpreter to record."""
+
+    events: list[RecordedEvent]
+    """The events recorded, oldest first."""
+
+    def __init__(
+        self,
+        widget: Widget,
+        sequences: Optional[Mapping[BaseEvent, Iterable[str]]] = None,
+    ) -> None:
+        """Creates a recorder. Call ``start`` to start recording.
+
+        Args:
+            widget: Any widget of the interpreter to record
+
+        Keyword Args:
+            sequences: The events to record, with the names of the fields recorded
+                for each (default: RECORDED_EVENTS)
+
+        """
+        self.widget = widget
+        self.events = []
+        self.__sequences = {
+            event: tuple(fields)
+            for event, fields in (sequences or RECORDED_EVENTS).items()
+        }
+        self.__funcids: dict[BaseEvent, FuncId] = {}
+        self.__started = 0.0
+
+    @property
+    def recording(self) -> bool:
+        """Whether the recorder is recording."""
+        return bool(self.__funcids)
+
+    def start(self) -> None:
+        """Starts recording. Times of events recorded after a ``stop`` continue from
+        the last recorded event."""
+        if self.recording:
+            return
+        self.__started = time.perf_counter() - (
+            self.events[-1].time_ms / 1000 if self.events else 0.0
+        )
+        for event, fields in self.__sequences.items():
+            self.__funcids[event] = event.bind(
+                self.widget,
+                functools.partial(self.__record, event.value, fields),
+                add="+",
+                classname="all",
+                fields=("widget",) + fields,
+            )
+
+    def stop(self) -> None:
+        """Stops recording and removes the bindings of the recorder."""
+        for event, funcid in self.__funcids.items():
+            event.unbind(self.widget, funcid, classname="all")
+        self.__funcids.clear()
+
+    def save(self, path: Union[str, PathLike[str]]) -> None:
+        """Writes the recorded events to a file, one JSON array per line.
+
+        Args:
+            path: The path of the file
+
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(json.dumps(_FORMAT) + "\n")
+            previous = 0
+            for event in self.events:
+                # Times are stored as deltas to keep lines short
+                line = [event.time_ms - previous, event.sequence, event.path]
+                if event.fields:
+                    line.append(event.fields)
+                file.write(json.dumps(line, separators=(",", ":")) + "\n")
+                previous = event.time_ms
+
+    def __record(
+        self, sequence: str, fields: tuple[str, ...], event: LeanEvent
+    ) -> None:
+        values = {}
+        for name in fields:
+            value = getattr(event, name)
+            # Tk substitutes "??" for fields that are not valid for the event
+            if value != "??":
+                values[name] = value
+        self.events.append(
+            RecordedEvent(
+                round((time.perf_counter() - self.__started) * 1000),
+                sequence,
+                str(event.widget),
+                values,
+            )
+        )
+
+    def __enter__(self) -> EventRecorder:
+        self.start()
+        return self
+
+    def __exit__(self, *__: Any) -> None:
+        self.stop()
+
+
+class EventReplayer:
+    """Generates recorded events again with ``event generate``, either as fast as
+    possible or with their recorded timing.
+
+    Events are generated on the Tcl path they were recorded on, so the application
+    must create its widgets in the same order as when it was recorded. Events of
+    paths that do not exist are skipped.
+
+    """
+
+    widget: Widget
+    """Any widget of the interpreter to replay on."""
+
+    events: list[RecordedEvent]
+    """The events to replay."""
+
+    latencies: list[float]
+    """Seconds each replayed event took to handle, in replay order."""
+
+    skipped: int
+    """The number of events whose widget did not exist."""
+
+    def __init__(self, widget: Widget, events: Iterable[RecordedEvent]) -> None:
+        """Creates a replayer.
+
+        Args:
+            widget: Any widget of the interpreter to replay on
+            events: The events to replay
+
+        """
+        self.widget = widget
+        self.events = list(events)
+        self.latencies = []
+        self.skipped = 0
+        self.__after_id: Optional[str] = None
+
+    @classmethod
+    def load(cls, widget: Widget, path: Union[str, PathLike[str]]) -> EventReplayer:
+        """Creates a replayer of the events of a file written by
+        ``EventRecorder.save``.
+
+        Args:
+            widget: Any widget of the interpreter to replay on
+            path: The path of the file
+
+        Raises:
+            ValueError: Raised when the file is not a recording
+
+        Returns:
+            The replayer
+
+        """
+        with open(path, encoding="utf-8") as file:
+            if json.loads(file.readline() or "null") != _FORMAT:
+                raise ValueError(f"{path} is not a tklife event recording")
+            events = []
+            time_ms = 0
+            for line in file:
+                delta, sequence, widget_path, *fields = json.loads(line)
+                time_ms += delta
+                events.append(
+                    RecordedEvent(
+                        time_ms, sequence, widget_path, fields[0] if fields else {}
+                    )
+                )
+        return cls(widget, events)
+
+    @property
+    def playing(self) -> bool:
+        """Whether a replay started with ``play`` is in progress."""
+        return self.__after_id is not None
+
+    def replay(self) -> None:
+        """Generates every event immediately, ignoring the recorded timing. Each
+        event is handled before the next one is generated."""
+        for event in self.events:
+            self.__generate(event)
+
+    def play(
+        self,
+        speed: float = 1.0,
+        callback: Optional[Callable[[EventReplayer], Any]] = None,
+    ) -> None:
+        """Generates the events from the mainloop with their recorded timing.
+
+        Args:
+            speed: The time compression, such as 2.0 to replay twice as fast
+                (default: 1.0)
+            callback: Called with the replayer when every event was generated
+                (default: None)
+
+        Raises:
+            ValueError: Raised when speed is not positive
+
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.cancel()
+        self.__schedule(0, time.perf_counter(), speed, callback)
+
+    def cancel(self) -> None:
+        """Stops a replay started with ``play``."""
+        if self.__after_id is not None:
+            self.widget.after_cancel(self.__after_id)
+            self.__after_id = None
+
+    def __schedule(
+        self,
+        index: int,
+        started: float,
+        speed: float,
+        callback: Optional[Callable[[EventReplayer], Any]],
+    ) -> None:
+        if index == len(self.events):
+            self.__after_id = None
+            if callback is not None:
+                callback(self)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        delay = max(0, round(self.events[index].time_ms / speed - elapsed_ms))
+        self.__after_id = self.widget.after(
+            delay, self.__step, index, started, speed, callback
+        )
+
+    def __step(
+        self,
+        index: int,
+        started: float,
+        speed: float,
+        callback: Optional[Callable[[EventReplayer], Any]],
+    ) -> None:
+        self.__generate(self.events[index])
+        self.__schedule(index + 1, started, speed, callback)
+
+    def __generate(self, event: RecordedEvent) -> None:
+        options = []
+        for name, value in event.fields.items():
+            options += (_GENERATE_OPTIONS.get(name, f"-{name}"), value)
+        start = time.perf_counter()
+        try:
+            self.widget.tk.call(
+                "event", "generate", event.path, event.sequence, *options
+            )
+        except TclError:
+            self.skipped += 1
+            return
+        self.latencies.append(time.perf_counter() - start)
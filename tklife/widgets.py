@@ -7,7 +7,7 @@ import typing
 from tkinter import ttk
 
 import tklife as tkl
-from tklife.event import BaseEvent, TkEvent
+from tklife.event import BindingScope, TkEvent
 
 if typing.TYPE_CHECKING:
     from tkinter import Canvas, Event, Misc
@@ -15,6 +15,7 @@ if typing.TYPE_CHECKING:
     from typing import Any, Iterable, Optional
 
     from tklife.core import SkelEventDef
+    from tklife.event import LeanEvent
 
 __all__ = ["ScrolledListbox", "AutoSearchCombobox", "ScrolledFrame", "ModalDialog"]
 
@@ -123,7 +124,9 @@ class ScrolledFrame(ttk.Frame):
         When created, this widget adds to the toplevel's bindings for <MouseWheel>,
         <Button-4>, <Button-5>. This is to ensure that
         the scrolling works in both horizontal (with shift) and vertical directions
-        with the mousewheel.
+        with the mousewheel. The handlers are added once through an
+        ``EventDispatcher`` and only scroll while the pointer is over the canvas. They
+        are released when this widget is destroyed.
 
     """
 
@@ -138,7 +141,7 @@ class ScrolledFrame(ttk.Frame):
         self.canvas = tk.Canvas(self.container, relief="flat", highlightthickness=0)
         self.v_scroll = ttk.Scrollbar(self.container, orient=tk.VERTICAL)
         self.h_scroll = ttk.Scrollbar(self.container, orient=tk.HORIZONTAL)
-        self._canvas_handlers: list[tuple[str, BaseEvent]] = []
+        self._pointer_in_canvas = False
 
         kwargs.update(master=self.canvas)
         ttk.Frame.__init__(self, **kwargs)
@@ -171,12 +174,28 @@ class ScrolledFrame(ttk.Frame):
         self.canvas.configure(xscrollcommand=self._canvas_xscroll_handler)
 
     def __events(self):
-        TkEvent.CONFIGURE.bind(self.container, self._container_configure_handler)
-        TkEvent.CONFIGURE.bind(self, self._self_configure_handler)
+        TkEvent.CONFIGURE.bind(
+            self.container,
+            self._container_configure_handler,
+            fields=("width", "height"),
+        )
+        TkEvent.CONFIGURE.bind(self, self._self_configure_handler, fields=())
         TkEvent.ENTER.bind(self.canvas, self._enter_canvas_handler)
         TkEvent.LEAVE.bind(self.canvas, self._leave_canvas_handler)
+        self._bindings = BindingScope(self)
+        for tkevent in (
+            TkEvent.BUTTON + "<4>",
+            TkEvent.BUTTON + "<5>",
+            TkEvent.MOUSEWHEEL,
+        ):
+            self._bindings.bind(
+                tkevent,
+                self.winfo_toplevel(),
+                self._toplevel_scroll_handler,
+                dispatch=True,
+            )
 
-    def _container_configure_handler(self, event: Event):
+    def _container_configure_handler(self, event: Event | LeanEvent):
         self.canvas.configure(
             width=event.width - self.v_scroll.winfo_width(),
             height=event.height - self.h_scroll.winfo_height() * self._show_hscroll,
@@ -221,24 +240,14 @@ class ScrolledFrame(ttk.Frame):
         )
 
     def _enter_canvas_handler(self, *__):
-        for tkevent in (
-            TkEvent.BUTTON + "<4>",
-            TkEvent.BUTTON + "<5>",
-            TkEvent.MOUSEWHEEL,
-        ):
-            self._canvas_handlers.append(
-                (
-                    tkevent.bind(
-                        self.winfo_toplevel(), self._mouse_scroll_handler, add="+"
-                    ),
-                    tkevent,
-                )
-            )
+        self._pointer_in_canvas = True
 
     def _leave_canvas_handler(self, *__):
-        for handler, tkevent in self._canvas_handlers:
-            tkevent.unbind(self.winfo_toplevel(), handler)
-        self._canvas_handlers = []
+        self._pointer_in_canvas = False
+
+    def _toplevel_scroll_handler(self, event: Event):
+        if self._pointer_in_canvas:
+            self._mouse_scroll_handler(event)
 
     def _mouse_scroll_handler(self, event: Event):
         # Hold down shift to scroll horizontally
@@ -313,13 +322,15 @@ class AutoSearchCombobox(ttk.Entry):
         TkEvent.KEYRELEASE.bind(self, self._handle_keyrelease)
         TkEvent.FOCUSOUT.bind(self, self._handle_focusout)
         TkEvent.KEYPRESS.bind(self, self._handle_keypress)
-        # toplevel bindings
-        cfg_handler = TkEvent.CONFIGURE.bind(
-            self.winfo_toplevel(), self._handle_configure, add="+"
-        )
-        TkEvent.DESTROY.bind(
-            self,
-            lambda __: TkEvent.CONFIGURE.unbind(self.winfo_toplevel(), cfg_handler),
+        # toplevel bindings, moving the dropdown at most once per idle tick, released
+        # when this widget is destroyed
+        self._bindings = BindingScope(self)
+        self._bindings.bind_throttled(
+            TkEvent.CONFIGURE,
+            self.winfo_toplevel(),
+            self._handle_configure,
+            0,
+            dispatch=True,
         )
         (TkEvent.BUTTONRELEASE + "<1>").bind(self._lb, self._handle_lb_click)
 